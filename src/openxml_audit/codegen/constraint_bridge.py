@@ -262,6 +262,15 @@ def get_element_constraint_for_element(
     return convert_element_type(elem_type) if elem_type else None
 
 
+def is_ambiguous_tag(tag: str) -> bool:
+    """Check whether a tag needs the element instance to pick its constraint.
+
+    Tags with a single SDK candidate (or none) always resolve to the same
+    constraint, so callers may cache the result per tag.
+    """
+    return len(get_registry().get_element_type_candidates(tag)) > 1
+
+
 def convert_element_type(elem_type: SdkElementType) -> ElementConstraint:
     """Convert an SDK element type to an ElementConstraint.
 
@@ -284,10 +293,10 @@ def convert_element_type(elem_type: SdkElementType) -> ElementConstraint:
     target_namespace = schema.target_namespace if schema else ""
 
     # Convert attributes
-    attributes = [
+    attributes = tuple(
         _convert_attribute(attr, namespace_map)
         for attr in elem_type.attributes
-    ]
+    )
 
     # Convert particle (content model)
     content_model = None
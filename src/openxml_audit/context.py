@@ -13,13 +13,16 @@ from openxml_audit.errors import (
     ValidationErrorType,
     ValidationSeverity,
 )
+from openxml_audit.namespaces import get_local_name
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from openxml_audit.package import OpenXmlPackage
     from openxml_audit.parts import OpenXmlPart
 
 
-@dataclass
+@dataclass(slots=True)
 class ElementInfo:
     """Information about an element being validated."""
 
@@ -31,25 +34,20 @@ class ElementInfo:
 class ValidationStack:
     """Stack for tracking element traversal during validation."""
 
+    __slots__ = ("_stack",)
+
     def __init__(self) -> None:
         self._stack: list[ElementInfo] = []
 
     def push(self, element: etree._Element, name: str) -> None:
         """Push an element onto the stack."""
-        depth = len(self._stack)
-        if self._stack:
-            parent_path = self._stack[-1].path
-            path = f"{parent_path}/{name}"
-        else:
-            path = f"/{name}"
-
-        self._stack.append(ElementInfo(element=element, path=path, depth=depth))
+        stack = self._stack
+        path = stack[-1].path + "/" + name if stack else "/" + name
+        stack.append(ElementInfo(element, path, len(stack)))
 
     def pop(self) -> ElementInfo | None:
         """Pop an element from the stack."""
-        if self._stack:
-            return self._stack.pop()
-        return None
+        return self._stack.pop() if self._stack else None
 
     @property
     def current(self) -> ElementInfo | None:
@@ -88,6 +86,11 @@ class ValidationContext:
     strict: bool = True
     errors: list[ValidationError] = field(default_factory=list)
     _stack: ValidationStack = field(default_factory=ValidationStack)
+    _error_count: int = field(default=0, init=False, repr=False)
+    _stopped: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._refresh_error_count()
 
     @property
     def part_uri(self) -> str:
@@ -108,10 +111,7 @@ class ValidationContext:
     def push_element(self, element: etree._Element) -> None:
         """Push an element onto the traversal stack."""
         # Get local name without namespace
-        tag = element.tag
-        if tag.startswith("{"):
-            tag = tag.split("}")[-1]
-        self._stack.push(element, tag)
+        self._stack.push(element, get_local_name(element.tag))
 
     def pop_element(self) -> None:
         """Pop an element from the traversal stack."""
@@ -127,7 +127,7 @@ class ValidationContext:
         error_id: str = "",
     ) -> None:
         """Add a validation error using current context."""
-        if self.max_errors > 0 and self.error_count >= self.max_errors:
+        if self._stopped:
             return
 
         if not self.strict and severity == ValidationSeverity.ERROR:
@@ -144,15 +144,24 @@ class ValidationContext:
             severity=severity,
             id=error_id,
         )
-        self.errors.append(error)
+        self._record(error)
 
     def add_schema_error(
         self,
         description: str,
+        *args: object,
         node: str | None = None,
         error_id: str = "",
     ) -> None:
-        """Add a schema validation error."""
+        """Add a schema validation error.
+
+        When ``args`` are given, ``description`` is a ``str.format`` template
+        that is only formatted if the error is actually recorded.
+        """
+        if self._stopped:
+            return
+        if args:
+            description = description.format(*args)
         self.add_error(
             error_type=ValidationErrorType.SCHEMA,
             description=description,
@@ -160,6 +169,34 @@ class ValidationContext:
             error_id=error_id,
         )
 
+    def add_schema_errors(self, entries: Iterable[tuple[str, str | None]]) -> None:
+        """Add a batch of schema errors sharing the current part and path.
+
+        Each entry is a ``(description, node)`` pair. Severity, part and path
+        are resolved once for the batch; ``max_errors`` is still honoured.
+        """
+        if self._stopped:
+            return
+
+        severity = (
+            ValidationSeverity.ERROR if self.strict else ValidationSeverity.WARNING
+        )
+        part_uri = self.part_uri
+        path = self.current_path
+        for description, node in entries:
+            if self._stopped:
+                return
+            self._record(
+                ValidationError(
+                    error_type=ValidationErrorType.SCHEMA,
+                    description=description,
+                    part_uri=part_uri,
+                    path=path,
+                    node=node,
+                    severity=severity,
+                )
+            )
+
     def add_semantic_error(
         self,
         description: str,
@@ -177,14 +214,50 @@ class ValidationContext:
     @property
     def error_count(self) -> int:
         """Get the number of errors collected."""
-        return sum(1 for e in self.errors if e.severity == ValidationSeverity.ERROR)
+        return self._error_count
 
     @property
     def should_stop(self) -> bool:
-        """Check if we should stop collecting errors."""
-        if self.max_errors == 0:
-            return False
-        return self.error_count >= self.max_errors
+        """Check if we should stop collecting errors.
+
+        Validators check this at loop heads so traversal ends once
+        ``max_errors`` is reached instead of producing errors that are dropped.
+        """
+        return self._stopped
+
+    def _record(self, error: ValidationError) -> None:
+        """Append an error and update the error count and stop flag."""
+        self.errors.append(error)
+        if error.severity == ValidationSeverity.ERROR:
+            self._error_count += 1
+            if self.max_errors > 0 and self._error_count >= self.max_errors:
+                self._stopped = True
+
+    def _refresh_error_count(self) -> None:
+        self._error_count = sum(
+            1 for e in self.errors if e.severity == ValidationSeverity.ERROR
+        )
+        self._stopped = self.max_errors > 0 and self._error_count >= self.max_errors
+
+    def spawn(self) -> ValidationContext:
+        """Create an empty context with the same package and settings.
+
+        Used by the streamed slide path to buffer shape errors until the
+        slide-level checks have run.
+        """
+        return ValidationContext(
+            package=self.package,
+            file_format=self.file_format,
+            max_errors=self.max_errors,
+            strict=self.strict,
+        )
+
+    def merge(self, other: ValidationContext) -> None:
+        """Append another context's errors, honouring ``max_errors``."""
+        for error in other.errors:
+            if self._stopped:
+                return
+            self._record(error)
 
     def set_part(self, part: OpenXmlPart) -> None:
         """Set the current part being validated."""
@@ -195,6 +268,15 @@ class ValidationContext:
     def clear_errors(self) -> None:
         """Clear all collected errors."""
         self.errors.clear()
+        self._refresh_error_count()
+
+    def truncate_errors(self, length: int) -> None:
+        """Discard errors added after the first ``length`` entries.
+
+        Used to roll back errors reported by speculative checks.
+        """
+        del self.errors[length:]
+        self._refresh_error_count()
 
 
 class ElementContext:
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import zipfile
+from collections import OrderedDict
+from io import BytesIO
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING, TypedDict, TypeVar
 
 from lxml import etree
 
@@ -18,14 +20,44 @@ from openxml_audit.errors import (
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+P = TypeVar("P", bound="ZipPackage")
+
+
+class PartParserOptions(TypedDict):
+    """Hardening options accepted by both XMLParser and iterparse."""
+
+    collect_ids: bool
+    resolve_entities: bool
+    no_network: bool
+    huge_tree: bool
+
+
+# Package parts never need DTD ID tables, entity expansion or network access.
+# The options are shared with streamed (iterparse) reads of the same parts.
+PART_PARSER_OPTIONS: PartParserOptions = {
+    "collect_ids": False,
+    "resolve_entities": False,
+    "no_network": True,
+    "huge_tree": False,
+}
+# One parser is shared by every package so batch runs reuse its setup.
+_PART_PARSER = etree.XMLParser(**PART_PARSER_OPTIONS)
+
 
 class ZipPackage:
     """A ZIP-backed document package."""
 
+    # Upper bound on decompressed bytes kept in the part cache. Large binary
+    # parts (media, embeddings) are read once, so holding them for the whole
+    # session only pins memory.
+    PART_CACHE_BYTES = 8 * 1024 * 1024
+
     def __init__(self, path: str | Path):
         self._path = Path(path)
         self._zip: zipfile.ZipFile | None = None
-        self._part_cache: dict[str, bytes] = {}
+        self._infos: dict[str, zipfile.ZipInfo] = {}
+        self._part_cache: OrderedDict[str, bytes] = OrderedDict()
+        self._part_cache_bytes = 0
         self._errors: list[ValidationError] = []
 
     def __enter__(self) -> ZipPackage:
@@ -35,6 +67,33 @@ class ZipPackage:
     def __exit__(self, exc_type: object, exc_val: object, exc_tb: object) -> None:
         self.close()
 
+    @classmethod
+    def try_open(cls: type[P], path: str | Path) -> tuple[P | None, ValidationError | None]:
+        """Open a package, reporting expected failures as an error instead of raising.
+
+        Missing files and non-ZIP files are detected up front, which keeps
+        batch runs over many bad inputs off the exception path.
+
+        Returns:
+            The opened package and None, or None and the reason it failed.
+        """
+        package = cls(path)
+        if not package._path.is_file():
+            return None, ValidationError(
+                error_type=ValidationErrorType.PACKAGE,
+                description=f"File not found: {package._path}",
+                severity=ValidationSeverity.ERROR,
+            )
+        if not zipfile.is_zipfile(package._path):
+            return None, ValidationError(
+                error_type=ValidationErrorType.PACKAGE,
+                description="Invalid ZIP file: File is not a zip file",
+                severity=ValidationSeverity.ERROR,
+            )
+
+        package.open()
+        return package, None
+
     def open(self) -> None:
         """Open the package for reading."""
         if self._zip is not None:
@@ -65,12 +124,16 @@ class ZipPackage:
                 ],
             ) from exc
 
+        self._infos = {info.filename: info for info in self._zip.infolist()}
+
     def close(self) -> None:
         """Close the package."""
         if self._zip is not None:
             self._zip.close()
             self._zip = None
+        self._infos = {}
         self._part_cache.clear()
+        self._part_cache_bytes = 0
 
     @property
     def path(self) -> Path:
@@ -89,24 +152,53 @@ class ZipPackage:
 
         zip_path = part_path.lstrip("/")
 
-        if zip_path in self._part_cache:
-            return self._part_cache[zip_path]
+        cached = self._part_cache.get(zip_path)
+        if cached is not None:
+            self._part_cache.move_to_end(zip_path)
+            return cached
 
-        try:
-            content = self._zip.read(zip_path)
-            self._part_cache[zip_path] = content
-            return content
-        except KeyError:
+        info = self._infos.get(zip_path)
+        if info is None:
             return None
 
+        content = self._zip.read(info)
+        self._cache_part(zip_path, content)
+        return content
+
+    def _cache_part(self, zip_path: str, content: bytes) -> None:
+        """Store part content, evicting least recently used parts over budget."""
+        size = len(content)
+        if size > self.PART_CACHE_BYTES:
+            return
+
+        self._part_cache[zip_path] = content
+        self._part_cache_bytes += size
+        while self._part_cache_bytes > self.PART_CACHE_BYTES:
+            _, evicted = self._part_cache.popitem(last=False)
+            self._part_cache_bytes -= len(evicted)
+
     def get_part_xml(self, part_path: str) -> etree._Element | None:
-        """Get the parsed XML content of a part."""
-        content = self.get_part_content(part_path)
-        if content is None:
-            return None
+        """Get the parsed XML content of a part.
+
+        Parts that are not already cached are streamed from the archive into
+        the parser, so the decompressed bytes are never materialized.
+        """
+        if self._zip is None:
+            raise PackageValidationError("Package not opened")
+
+        zip_path = part_path.lstrip("/")
 
         try:
-            return etree.fromstring(content)
+            cached = self._part_cache.get(zip_path)
+            if cached is not None:
+                self._part_cache.move_to_end(zip_path)
+                return etree.fromstring(cached, _PART_PARSER)
+
+            info = self._infos.get(zip_path)
+            if info is None:
+                return None
+            with self._zip.open(info) as stream:
+                return etree.parse(stream, _PART_PARSER).getroot()
         except etree.XMLSyntaxError as exc:
             self._errors.append(
                 ValidationError(
@@ -118,6 +210,33 @@ class ZipPackage:
             )
             return None
 
+    def get_part_size(self, part_path: str) -> int | None:
+        """Get the decompressed size of a part, or None if it does not exist."""
+        if self._zip is None:
+            raise PackageValidationError("Package not opened")
+
+        info = self._infos.get(part_path.lstrip("/"))
+        return None if info is None else info.file_size
+
+    def open_part(self, part_path: str) -> IO[bytes] | None:
+        """Open a part for streaming reads, or return None if it does not exist.
+
+        The caller is responsible for closing the returned stream.
+        """
+        if self._zip is None:
+            raise PackageValidationError("Package not opened")
+
+        zip_path = part_path.lstrip("/")
+        cached = self._part_cache.get(zip_path)
+        if cached is not None:
+            self._part_cache.move_to_end(zip_path)
+            return BytesIO(cached)
+
+        info = self._infos.get(zip_path)
+        if info is None:
+            return None
+        return self._zip.open(info)
+
     def list_parts(self) -> Iterator[str]:
         """List all parts in the package."""
         if self._zip is None:
@@ -131,5 +250,4 @@ class ZipPackage:
         if self._zip is None:
             raise PackageValidationError("Package not opened")
 
-        zip_path = part_path.lstrip("/")
-        return zip_path in self._zip.namelist()
+        return part_path.lstrip("/") in self._infos
@@ -37,7 +37,7 @@ class ValidationSeverity(Enum):
     INFO = "info"  # Informational
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationError:
     """A validation error found in a document."""
 
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from lxml import etree
 
 from openxml_audit.context import ElementContext
 from openxml_audit.errors import ValidationError
 from openxml_audit.namespaces import (
+    R_ID_ATTR,
     REL_CHARTSHEET,
     REL_DIALOGSHEET,
     REL_MACRO_SHEET,
@@ -26,7 +27,9 @@ class WorkbookValidator:
 
     def __init__(self) -> None:
         self._ns = {"s": SPREADSHEETML}
-        self._rel_ns = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+        self._rel_id_attr = R_ID_ATTR
+        self._workbook_tag = f"{{{SPREADSHEETML}}}workbook"
+        self._xp_sheets = etree.XPath("s:sheets[1]/s:sheet", namespaces=self._ns)
         self._sheet_relationship_types = {
             REL_WORKSHEET,
             REL_CHARTSHEET,
@@ -39,22 +42,19 @@ class WorkbookValidator:
     ) -> list[ValidationError]:
         """Validate a workbook part."""
         context.set_part(part)
-        errors: list[ValidationError] = []
 
         xml = part.xml
         if xml is None:
-            return errors
+            return []
 
         with ElementContext(context, xml):
             self._validate_root(xml, context)
             self._validate_sheet_list(xml, part, context)
 
-        errors.extend(context.errors)
-        return errors
+        return list(context.errors)
 
     def _validate_root(self, xml: etree._Element, context: "ValidationContext") -> None:
-        expected_tag = f"{{{SPREADSHEETML}}}workbook"
-        if xml.tag != expected_tag:
+        if xml.tag != self._workbook_tag:
             context.add_schema_error(
                 f"Root element should be 'workbook', got '{xml.tag}'",
             )
@@ -65,16 +65,16 @@ class WorkbookValidator:
         part: "WorkbookPart",
         context: "ValidationContext",
     ) -> None:
-        sheet_list = xml.find("s:sheets", self._ns)
-        if sheet_list is None:
-            context.add_schema_error(
-                "Workbook is missing sheets element",
-                node="sheets",
-            )
-            return
-
-        sheets = sheet_list.findall("s:sheet", self._ns)
+        # The compiled path selects elements only
+        sheets = cast("list[etree._Element]", self._xp_sheets(xml))
         if not sheets:
+            if xml.find("s:sheets", self._ns) is None:
+                context.add_schema_error(
+                    "Workbook is missing sheets element",
+                    node="sheets",
+                )
+                return
+
             context.add_schema_error(
                 "Workbook contains no sheets",
                 node="sheet",
@@ -85,6 +85,9 @@ class WorkbookValidator:
         seen_names: set[str] = set()
 
         for sheet in sheets:
+            if context.should_stop:
+                break
+
             sheet_id = sheet.get("sheetId", "")
             name = sheet.get("name", "")
 
@@ -114,7 +117,7 @@ class WorkbookValidator:
             else:
                 seen_names.add(name)
 
-            rel_id = sheet.get(f"{{{self._rel_ns}}}id", "")
+            rel_id = sheet.get(self._rel_id_attr, "")
             if not rel_id:
                 context.add_schema_error(
                     "Sheet is missing r:id attribute",
@@ -23,6 +23,34 @@ if TYPE_CHECKING:
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+class ValidatorWrapper:
+    """Validator wrapper that optionally raises on invalid files."""
+
+    def __init__(self, inner: OpenXmlValidator, raise_on_invalid: bool = False) -> None:
+        self._inner = inner
+        self._raise_on_invalid = raise_on_invalid
+
+    def validate(self, path: str | Path) -> ValidationResult:
+        result = self._inner.validate(path)
+        if self._raise_on_invalid and not result.is_valid:
+            error_summary = "; ".join(e.description for e in result.errors[:3])
+            if len(result.errors) > 3:
+                error_summary += f"... (+{len(result.errors) - 3} more)"
+            raise ValueError(f"Invalid PPTX: {error_summary}")
+        return result
+
+    def is_valid(self, path: str | Path) -> bool:
+        return self._inner.is_valid(path)
+
+    @property
+    def file_format(self) -> FileFormat:
+        return self._inner.file_format
+
+    @property
+    def max_errors(self) -> int:
+        return self._inner.max_errors
+
+
 @contextmanager
 def validation_context(
     file_format: FileFormat = FileFormat.OFFICE_2019,
@@ -55,33 +83,20 @@ def validation_context(
         strict=strict,
     )
 
-    class ValidatorWrapper:
-        """Wrapper that optionally raises on invalid files."""
-
-        def __init__(self, inner: OpenXmlValidator) -> None:
-            self._inner = inner
-
-        def validate(self, path: str | Path) -> ValidationResult:
-            result = self._inner.validate(path)
-            if raise_on_invalid and not result.is_valid:
-                error_summary = "; ".join(e.description for e in result.errors[:3])
-                if len(result.errors) > 3:
-                    error_summary += f"... (+{len(result.errors) - 3} more)"
-                raise ValueError(f"Invalid PPTX: {error_summary}")
-            return result
-
-        def is_valid(self, path: str | Path) -> bool:
-            return self._inner.is_valid(path)
+    yield ValidatorWrapper(validator, raise_on_invalid)  # type: ignore[misc]
 
-        @property
-        def file_format(self) -> FileFormat:
-            return self._inner.file_format
 
-        @property
-        def max_errors(self) -> int:
-            return self._inner.max_errors
+def _as_pptx_path(value: str | Path) -> Path | None:
+    """Return value as a Path if it names a .pptx file.
 
-    yield ValidatorWrapper(validator)  # type: ignore[misc]
+    Plain strings are checked with string operations so that decorated calls
+    whose argument is not a PPTX path never allocate a Path.
+    """
+    if isinstance(value, Path):
+        return value if value.suffix.lower() == ".pptx" else None
+    if value[-5:].lower() == ".pptx":
+        return Path(value)
+    return None
 
 
 def validate_on_save(
@@ -123,10 +138,9 @@ def validate_on_save(
             output_path = None
 
             # Check common argument patterns
-            if args and isinstance(args[-1], (str, Path)):
-                candidate = Path(args[-1])
-                if candidate.suffix.lower() == ".pptx":
-                    output_path = candidate
+            last = args[-1] if args else None
+            if isinstance(last, (str, Path)):
+                output_path = _as_pptx_path(last)
             elif "output_path" in kwargs:
                 output_path = Path(kwargs["output_path"])
             elif "path" in kwargs:
@@ -186,10 +200,9 @@ def require_valid_pptx(
             # Try to find input path from args/kwargs
             input_path = None
 
-            if args and isinstance(args[0], (str, Path)):
-                candidate = Path(args[0])
-                if candidate.suffix.lower() == ".pptx":
-                    input_path = candidate
+            first = args[0] if args else None
+            if isinstance(first, (str, Path)):
+                input_path = _as_pptx_path(first)
             elif "input_path" in kwargs:
                 input_path = Path(kwargs["input_path"])
             elif "path" in kwargs:
@@ -1,150 +1,191 @@
 """Open XML namespace definitions.
 
 Based on ECMA-376 and Microsoft Open XML SDK.
+
+URI constants are interned so that dictionary lookups keyed on them (and on
+the Clark-notation names built from them) can take the identity fast path.
 """
 
+import sys
+from functools import lru_cache
+
 # Content Types namespace
-CONTENT_TYPES = "http://schemas.openxmlformats.org/package/2006/content-types"
+CONTENT_TYPES = sys.intern("http://schemas.openxmlformats.org/package/2006/content-types")
 
 # Relationships namespaces
-RELATIONSHIPS = "http://schemas.openxmlformats.org/package/2006/relationships"
-RELATIONSHIPS_METADATA_CORE = (
+RELATIONSHIPS = sys.intern("http://schemas.openxmlformats.org/package/2006/relationships")
+RELATIONSHIPS_METADATA_CORE = sys.intern(
     "http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties"
 )
 
 # Office Document Relationships
-REL_OFFICE_DOCUMENT = (
+REL_OFFICE_DOCUMENT = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
 )
-REL_EXTENDED_PROPERTIES = (
+REL_EXTENDED_PROPERTIES = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/extended-properties"
 )
-REL_CUSTOM_PROPERTIES = (
+REL_CUSTOM_PROPERTIES = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/custom-properties"
 )
-REL_THUMBNAIL = "http://schemas.openxmlformats.org/package/2006/relationships/metadata/thumbnail"
+REL_THUMBNAIL = sys.intern(
+    "http://schemas.openxmlformats.org/package/2006/relationships/metadata/thumbnail"
+)
 
 # PresentationML namespaces
-PRESENTATIONML = "http://schemas.openxmlformats.org/presentationml/2006/main"
-PRESENTATIONML_STRICT = "http://purl.oclc.org/ooxml/presentationml/main"
+PRESENTATIONML = sys.intern("http://schemas.openxmlformats.org/presentationml/2006/main")
+PRESENTATIONML_STRICT = sys.intern("http://purl.oclc.org/ooxml/presentationml/main")
 
 # WordprocessingML namespace
-WORDPROCESSINGML = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+WORDPROCESSINGML = sys.intern("http://schemas.openxmlformats.org/wordprocessingml/2006/main")
 
 # SpreadsheetML namespace
-SPREADSHEETML = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+SPREADSHEETML = sys.intern("http://schemas.openxmlformats.org/spreadsheetml/2006/main")
 
 # PresentationML relationship types
-REL_SLIDE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
-REL_SLIDE_LAYOUT = (
+REL_SLIDE = sys.intern("http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide")
+REL_SLIDE_LAYOUT = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
 )
-REL_SLIDE_MASTER = (
+REL_SLIDE_MASTER = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideMaster"
 )
-REL_NOTES_SLIDE = (
+REL_NOTES_SLIDE = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesSlide"
 )
-REL_NOTES_MASTER = (
+REL_NOTES_MASTER = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/notesMaster"
 )
-REL_HANDOUT_MASTER = (
+REL_HANDOUT_MASTER = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/handoutMaster"
 )
-REL_THEME = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme"
-REL_PRES_PROPS = (
+REL_THEME = sys.intern("http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme")
+REL_PRES_PROPS = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/presProps"
 )
-REL_VIEW_PROPS = (
+REL_VIEW_PROPS = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/viewProps"
 )
-REL_TABLE_STYLES = (
+REL_TABLE_STYLES = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/tableStyles"
 )
-REL_HEADER = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/header"
-REL_FOOTER = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/footer"
-REL_COMMENTS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/comments"
-REL_FOOTNOTES = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/footnotes"
-REL_ENDNOTES = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/endnotes"
-REL_CUSTOM_XML = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/customXml"
-REL_CUSTOM_XML_PROPS = (
+REL_HEADER = sys.intern(
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/header"
+)
+REL_FOOTER = sys.intern(
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/footer"
+)
+REL_COMMENTS = sys.intern(
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/comments"
+)
+REL_FOOTNOTES = sys.intern(
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/footnotes"
+)
+REL_ENDNOTES = sys.intern(
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/endnotes"
+)
+REL_CUSTOM_XML = sys.intern(
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/customXml"
+)
+REL_CUSTOM_XML_PROPS = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/customXmlProps"
 )
-REL_STYLES = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles"
-REL_STYLES_WITH_EFFECTS = (
+REL_STYLES = sys.intern(
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles"
+)
+REL_STYLES_WITH_EFFECTS = sys.intern(
     "http://schemas.microsoft.com/office/2007/relationships/stylesWithEffects"
 )
-REL_SETTINGS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/settings"
-REL_WEB_SETTINGS = (
+REL_SETTINGS = sys.intern(
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/settings"
+)
+REL_WEB_SETTINGS = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/webSettings"
 )
-REL_FONT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/font"
-REL_FONT_TABLE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/fontTable"
-REL_NUMBERING = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering"
-REL_SHARED_STRINGS = (
+REL_FONT = sys.intern("http://schemas.openxmlformats.org/officeDocument/2006/relationships/font")
+REL_FONT_TABLE = sys.intern(
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/fontTable"
+)
+REL_NUMBERING = sys.intern(
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering"
+)
+REL_SHARED_STRINGS = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings"
 )
-REL_WORKSHEET = (
+REL_WORKSHEET = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"
 )
-REL_CHARTSHEET = (
+REL_CHARTSHEET = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/chartsheet"
 )
-REL_DIALOGSHEET = (
+REL_DIALOGSHEET = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/dialogsheet"
 )
-REL_MACRO_SHEET = "http://schemas.microsoft.com/office/2006/relationships/xlMacrosheet"
+REL_MACRO_SHEET = sys.intern("http://schemas.microsoft.com/office/2006/relationships/xlMacrosheet")
 
 # DrawingML namespaces
-DRAWINGML = "http://schemas.openxmlformats.org/drawingml/2006/main"
-DRAWINGML_STRICT = "http://purl.oclc.org/ooxml/drawingml/main"
-DRAWINGML_CHART = "http://schemas.openxmlformats.org/drawingml/2006/chart"
-DRAWINGML_DIAGRAM = "http://schemas.openxmlformats.org/drawingml/2006/diagram"
-DRAWINGML_PICTURE = "http://schemas.openxmlformats.org/drawingml/2006/picture"
-DRAWINGML_SPREADSHEET = "http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing"
-DRAWINGML_WORDPROCESSING = "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+DRAWINGML = sys.intern("http://schemas.openxmlformats.org/drawingml/2006/main")
+DRAWINGML_STRICT = sys.intern("http://purl.oclc.org/ooxml/drawingml/main")
+DRAWINGML_CHART = sys.intern("http://schemas.openxmlformats.org/drawingml/2006/chart")
+DRAWINGML_DIAGRAM = sys.intern("http://schemas.openxmlformats.org/drawingml/2006/diagram")
+DRAWINGML_PICTURE = sys.intern("http://schemas.openxmlformats.org/drawingml/2006/picture")
+DRAWINGML_SPREADSHEET = sys.intern(
+    "http://schemas.openxmlformats.org/drawingml/2006/spreadsheetDrawing"
+)
+DRAWINGML_WORDPROCESSING = sys.intern(
+    "http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"
+)
 
 # Office Document namespaces
-OFFICE_DOC = "http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes"
-OFFICE_DOC_RELATIONSHIPS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
-OFFICE_DOC_MATH = "http://schemas.openxmlformats.org/officeDocument/2006/math"
-OFFICE_DOC_BIBLIOGRAPHY = "http://schemas.openxmlformats.org/officeDocument/2006/bibliography"
-OFFICE_DOC_CUSTOM_XML = (
+OFFICE_DOC = sys.intern("http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes")
+OFFICE_DOC_RELATIONSHIPS = sys.intern(
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+)
+OFFICE_DOC_MATH = sys.intern("http://schemas.openxmlformats.org/officeDocument/2006/math")
+OFFICE_DOC_BIBLIOGRAPHY = sys.intern(
+    "http://schemas.openxmlformats.org/officeDocument/2006/bibliography"
+)
+OFFICE_DOC_CUSTOM_XML = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/relationships/customXml"
 )
 
 # Core Properties (Dublin Core)
-CORE_PROPERTIES = "http://schemas.openxmlformats.org/package/2006/metadata/core-properties"
-DC = "http://purl.org/dc/elements/1.1/"
-DCTERMS = "http://purl.org/dc/terms/"
-DCMITYPE = "http://purl.org/dc/dcmitype/"
-XSI = "http://www.w3.org/2001/XMLSchema-instance"
+CORE_PROPERTIES = sys.intern(
+    "http://schemas.openxmlformats.org/package/2006/metadata/core-properties"
+)
+DC = sys.intern("http://purl.org/dc/elements/1.1/")
+DCTERMS = sys.intern("http://purl.org/dc/terms/")
+DCMITYPE = sys.intern("http://purl.org/dc/dcmitype/")
+XSI = sys.intern("http://www.w3.org/2001/XMLSchema-instance")
 
 # Extended Properties (App)
-EXTENDED_PROPERTIES = (
+EXTENDED_PROPERTIES = sys.intern(
     "http://schemas.openxmlformats.org/officeDocument/2006/extended-properties"
 )
 
 # VML (Vector Markup Language)
-VML = "urn:schemas-microsoft-com:vml"
-VML_OFFICE = "urn:schemas-microsoft-com:office:office"
-VML_WORD = "urn:schemas-microsoft-com:office:word"
-VML_EXCEL = "urn:schemas-microsoft-com:office:excel"
-VML_POWERPOINT = "urn:schemas-microsoft-com:office:powerpoint"
+VML = sys.intern("urn:schemas-microsoft-com:vml")
+VML_OFFICE = sys.intern("urn:schemas-microsoft-com:office:office")
+VML_WORD = sys.intern("urn:schemas-microsoft-com:office:word")
+VML_EXCEL = sys.intern("urn:schemas-microsoft-com:office:excel")
+VML_POWERPOINT = sys.intern("urn:schemas-microsoft-com:office:powerpoint")
 
 # Markup Compatibility
-MC = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+MC = sys.intern("http://schemas.openxmlformats.org/markup-compatibility/2006")
 
 # Microsoft Office extensions
-MS_OFFICE = "http://schemas.microsoft.com/office/2006/metadata/properties"
-MS_OFFICE_WORD = "http://schemas.microsoft.com/office/word/2006/wordml"
-MS_OFFICE_EXCEL = "http://schemas.microsoft.com/office/spreadsheetml/2009/9/main"
-MS_OFFICE_DRAWING = "http://schemas.microsoft.com/office/drawing/2010/main"
-MS_OFFICE_POWERPOINT = "http://schemas.microsoft.com/office/powerpoint/2010/main"
+MS_OFFICE = sys.intern("http://schemas.microsoft.com/office/2006/metadata/properties")
+MS_OFFICE_WORD = sys.intern("http://schemas.microsoft.com/office/word/2006/wordml")
+MS_OFFICE_EXCEL = sys.intern("http://schemas.microsoft.com/office/spreadsheetml/2009/9/main")
+MS_OFFICE_DRAWING = sys.intern("http://schemas.microsoft.com/office/drawing/2010/main")
+MS_OFFICE_POWERPOINT = sys.intern("http://schemas.microsoft.com/office/powerpoint/2010/main")
 
 # XML standard namespaces
-XML = "http://www.w3.org/XML/1998/namespace"
-XSD = "http://www.w3.org/2001/XMLSchema"
+XML = sys.intern("http://www.w3.org/XML/1998/namespace")
+XSD = sys.intern("http://www.w3.org/2001/XMLSchema")
+
+# ODF manifest namespace
+ODF_MANIFEST = sys.intern("urn:oasis:names:tc:opendocument:xmlns:manifest:1.0")
 
 # Namespace prefix map for lxml
 NSMAP = {
@@ -167,9 +208,11 @@ NSMAP = {
 }
 
 # Reverse map for looking up prefix by namespace
-PREFIX_MAP = {v: k for k, v in NSMAP.items()}
+# Reverse map (namespace URI -> prefix); keys and values are interned
+PREFIX_MAP = {sys.intern(v): sys.intern(k) for k, v in NSMAP.items()}
 
 
+@lru_cache(maxsize=256)
 def get_prefix(namespace: str) -> str | None:
     """Get the standard prefix for a namespace URI."""
     return PREFIX_MAP.get(namespace)
@@ -180,9 +223,31 @@ def qualify_name(local_name: str, namespace: str) -> str:
     return f"{{{namespace}}}{local_name}"
 
 
+@lru_cache(maxsize=512)
+def qualify_name_cached(local_name: str, namespace: str) -> str:
+    """Create an interned Clark notation name, memoized for hot callers."""
+    return sys.intern(qualify_name(local_name, namespace))
+
+
+# Precomputed Clark notation names
+R_ID_ATTR = qualify_name_cached("id", OFFICE_DOC_RELATIONSHIPS)
+CT_DEFAULT_QN = qualify_name_cached("Default", CONTENT_TYPES)
+CT_OVERRIDE_QN = qualify_name_cached("Override", CONTENT_TYPES)
+MANIFEST_FILE_ENTRY_QN = qualify_name_cached("file-entry", ODF_MANIFEST)
+MANIFEST_FULL_PATH_QN = qualify_name_cached("full-path", ODF_MANIFEST)
+MANIFEST_MEDIA_TYPE_QN = qualify_name_cached("media-type", ODF_MANIFEST)
+
+
+@lru_cache(maxsize=256)
 def split_qualified_name(qname: str) -> tuple[str | None, str]:
     """Split a Clark notation name into (namespace, local_name)."""
     if qname.startswith("{"):
         ns_end = qname.index("}")
-        return qname[1:ns_end], qname[ns_end + 1 :]
-    return None, qname
+        return sys.intern(qname[1:ns_end]), sys.intern(qname[ns_end + 1 :])
+    return None, sys.intern(qname)
+
+
+@lru_cache(maxsize=4096)
+def get_local_name(qname: str) -> str:
+    """Get the local part of a Clark notation name."""
+    return qname.rpartition("}")[2]
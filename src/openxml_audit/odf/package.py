@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -10,12 +12,17 @@ from lxml import etree
 
 from openxml_audit.core.package import ZipPackage
 from openxml_audit.errors import ValidationError, ValidationErrorType, ValidationSeverity
+from openxml_audit.namespaces import (
+    MANIFEST_FILE_ENTRY_QN,
+    MANIFEST_FULL_PATH_QN,
+    MANIFEST_MEDIA_TYPE_QN,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OdfManifestEntry:
     """Entry from META-INF/manifest.xml."""
 
@@ -67,8 +74,23 @@ class OdfPackage(ZipPackage):
                 self._manifest = []
                 return self._manifest
 
+            entries: list[OdfManifestEntry] = []
             try:
-                xml = etree.fromstring(content)
+                for _, entry in etree.iterparse(
+                    BytesIO(content),
+                    events=("end",),
+                    tag=MANIFEST_FILE_ENTRY_QN,
+                    resolve_entities=False,
+                    no_network=True,
+                ):
+                    attrib = entry.attrib
+                    full_path = attrib.get(MANIFEST_FULL_PATH_QN, "")
+                    media_type = sys.intern(attrib.get(MANIFEST_MEDIA_TYPE_QN, ""))
+                    entries.append(OdfManifestEntry(full_path, media_type))
+
+                    entry.clear(keep_tail=True)
+                    while entry.getprevious() is not None:
+                        del entry.getparent()[0]
             except etree.XMLSyntaxError as exc:
                 self._errors.append(
                     ValidationError(
@@ -81,28 +103,27 @@ class OdfPackage(ZipPackage):
                 self._manifest = []
                 return self._manifest
 
-            ns = {"manifest": "urn:oasis:names:tc:opendocument:xmlns:manifest:1.0"}
-            entries: list[OdfManifestEntry] = []
-            for entry in xml.findall("manifest:file-entry", ns):
-                full_path = entry.get(f"{{{ns['manifest']}}}full-path", "")
-                media_type = entry.get(f"{{{ns['manifest']}}}media-type", "")
-                entries.append(OdfManifestEntry(full_path=full_path, media_type=media_type))
-
             self._manifest = entries
         return self._manifest
 
     def list_xml_parts(self) -> Iterator[str]:
         """List manifest parts that look like XML."""
+        is_xml: dict[str, bool] = {}
         for entry in self.manifest:
-            if entry.media_type.endswith("xml"):
+            media_type = entry.media_type
+            xml_like = is_xml.get(media_type)
+            if xml_like is None:
+                xml_like = is_xml[media_type] = media_type.endswith("xml")
+            if xml_like:
                 yield entry.full_path
 
     def validate_structure(self) -> list[ValidationError]:
         """Perform basic ODF package checks."""
         errors: list[ValidationError] = []
 
-        _ = self.mimetype
-        _ = self.manifest
+        # Without a mimetype entry the package is not valid ODF; skip the manifest.
+        if self.mimetype is not None:
+            _ = self.manifest
         errors.extend(self._errors)
 
         return errors
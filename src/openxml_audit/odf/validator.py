@@ -24,8 +24,12 @@ class OdfValidator:
         errors: list[ValidationError] = []
 
         try:
-            with OdfPackage(path) as package:
-                errors.extend(package.validate_structure())
+            package, open_error = OdfPackage.try_open(path)
+            if open_error is not None:
+                errors.append(open_error)
+            elif package is not None:
+                with package:
+                    errors.extend(package.validate_structure())
         except Exception as exc:
             errors.append(
                 ValidationError(
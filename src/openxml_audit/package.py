@@ -5,7 +5,10 @@ A PPTX file is an OPC package - a ZIP archive containing XML parts and relations
 
 from __future__ import annotations
 
+import sys
+import weakref
 from dataclasses import dataclass, field
+from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -13,14 +16,17 @@ from lxml import etree
 
 from openxml_audit.core.package import ZipPackage
 from openxml_audit.errors import ValidationError, ValidationErrorType, ValidationSeverity
-from openxml_audit.namespaces import CONTENT_TYPES, REL_OFFICE_DOCUMENT
+from openxml_audit.namespaces import CT_DEFAULT_QN, CT_OVERRIDE_QN, REL_OFFICE_DOCUMENT
+from openxml_audit.parts import OpenXmlPart
 from openxml_audit.relationships import RelationshipCollection, get_rels_path
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+_MISSING = object()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ContentType:
     """A content type definition from [Content_Types].xml."""
 
@@ -29,55 +35,72 @@ class ContentType:
     extension: str | None = None  # For Default elements
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ContentTypes:
     """Content types from [Content_Types].xml."""
 
     defaults: dict[str, str] = field(default_factory=dict)  # extension -> content_type
     overrides: dict[str, str] = field(default_factory=dict)  # part_name -> content_type
+    _lookup_cache: dict[str, str | None] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def get_content_type(self, part_name: str) -> str | None:
         """Get the content type for a part.
 
         First checks overrides, then falls back to extension-based defaults.
+        Results are memoized per part name.
         """
+        cache = self._lookup_cache
+        if part_name in cache:
+            return cache[part_name]
+
         # Normalize part name (ensure leading slash)
-        if not part_name.startswith("/"):
-            part_name = "/" + part_name
+        key = part_name if part_name[:1] == "/" else "/" + part_name
 
-        # Check overrides first
-        if part_name in self.overrides:
-            return self.overrides[part_name]
+        # Check overrides first, then fall back to extension-based default
+        if (content_type := self.overrides.get(key)) is None:
+            # Part names never end in "/", so the last segment is the file name;
+            # slicing it matches Path.suffix without building a path object.
+            name = key.rpartition("/")[2]
+            dot = name.rfind(".")
+            content_type = self.defaults.get(name[dot + 1 :] if dot > 0 else "")
 
-        # Fall back to extension-based default
-        ext = Path(part_name).suffix.lstrip(".")
-        return self.defaults.get(ext)
+        if content_type is not None:
+            content_type = sys.intern(content_type)
+        self._lookup_cache[part_name] = content_type
+        return content_type
 
     @classmethod
     def from_xml(cls, xml_content: bytes) -> ContentTypes:
         """Parse [Content_Types].xml content."""
         ct = cls()
 
+        # Stream Default/Override entries, releasing each one once read
         try:
-            root = etree.fromstring(xml_content)
+            for _, elem in etree.iterparse(
+                BytesIO(xml_content),
+                events=("end",),
+                tag=(CT_DEFAULT_QN, CT_OVERRIDE_QN),
+                resolve_entities=False,
+                no_network=True,
+            ):
+                attrib = elem.attrib
+                content_type = attrib.get("ContentType", "")
+                if elem.tag == CT_DEFAULT_QN:
+                    ext = attrib.get("Extension", "")
+                    if ext and content_type:
+                        ct.defaults[ext] = content_type
+                else:
+                    part_name = attrib.get("PartName", "")
+                    if part_name and content_type:
+                        ct.overrides[part_name] = content_type
+
+                elem.clear(keep_tail=True)
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
         except etree.XMLSyntaxError:
-            return ct
-
-        ns = {"ct": CONTENT_TYPES}
-
-        # Parse Default elements
-        for default in root.findall("ct:Default", ns):
-            ext = default.get("Extension", "")
-            content_type = default.get("ContentType", "")
-            if ext and content_type:
-                ct.defaults[ext] = content_type
-
-        # Parse Override elements
-        for override in root.findall("ct:Override", ns):
-            part_name = override.get("PartName", "")
-            content_type = override.get("ContentType", "")
-            if part_name and content_type:
-                ct.overrides[part_name] = content_type
+            return cls()
 
         return ct
 
@@ -91,7 +114,13 @@ class OpenXmlPackage(ZipPackage):
     def __init__(self, path: str | Path):
         super().__init__(path)
         self._content_types: ContentTypes | None = None
+        self._content_types_missing = False
         self._relationships: RelationshipCollection | None = None
+        self._rels_cache: dict[str, RelationshipCollection] = {}
+        self._main_doc_uri: str | None | object = _MISSING
+        self._part_pool: weakref.WeakValueDictionary[str, OpenXmlPart] = (
+            weakref.WeakValueDictionary()
+        )
 
     @property
     def content_types(self) -> ContentTypes:
@@ -111,6 +140,7 @@ class OpenXmlPackage(ZipPackage):
         """Load and parse [Content_Types].xml."""
         content = self.get_part_content("[Content_Types].xml")
         if content is None:
+            self._content_types_missing = True
             self._errors.append(
                 ValidationError(
                     error_type=ValidationErrorType.PACKAGE,
@@ -133,7 +163,14 @@ class OpenXmlPackage(ZipPackage):
             return ContentTypes()
 
     def _load_relationships(self, source_uri: str) -> RelationshipCollection:
-        """Load relationships for a part or the package root."""
+        """Load relationships for a part or the package root.
+
+        Each .rels file is parsed at most once per package.
+        """
+        cached = self._rels_cache.get(source_uri)
+        if cached is not None:
+            return cached
+
         rels_path = get_rels_path(source_uri)
         # Remove leading slash for ZIP lookup
         zip_path = rels_path.lstrip("/")
@@ -148,9 +185,24 @@ class OpenXmlPackage(ZipPackage):
                         severity=ValidationSeverity.ERROR,
                     )
                 )
-            return RelationshipCollection(source_uri)
+            collection = RelationshipCollection(source_uri)
+        else:
+            collection = RelationshipCollection.from_xml(content, source_uri)
+
+        self._rels_cache[source_uri] = collection
+        return collection
 
-        return RelationshipCollection.from_xml(content, source_uri)
+    def get_part(self, uri: str, content_type: str | None = None) -> OpenXmlPart:
+        """Get the shared OpenXmlPart for a URI.
+
+        Parts stay pooled while referenced, so repeated lookups reuse the
+        already-parsed XML and relationships.
+        """
+        part = self._part_pool.get(uri)
+        if part is None:
+            part = OpenXmlPart(self, uri, content_type)
+            self._part_pool[uri] = part
+        return part
 
     def get_part_relationships(self, part_uri: str) -> RelationshipCollection:
         """Get the relationships for a specific part."""
@@ -159,8 +211,9 @@ class OpenXmlPackage(ZipPackage):
     def list_parts(self) -> Iterator[str]:
         """List all parts in the package."""
         for name in super().list_parts():
-            # Skip relationship files and content types
-            if name.startswith("/_rels/") or "/_rels/" in name:
+            # Skip relationship files (anything directly under a _rels folder)
+            segments = name.rsplit("/", 2)
+            if len(segments) >= 2 and segments[-2] == "_rels":
                 continue
             if name == "/[Content_Types].xml":
                 continue
@@ -168,10 +221,10 @@ class OpenXmlPackage(ZipPackage):
 
     def get_main_document_uri(self) -> str | None:
         """Get the URI of the main document part (presentation.xml for PPTX)."""
-        rel = self.relationships.get_first_by_type(REL_OFFICE_DOCUMENT)
-        if rel is None:
-            return None
-        return rel.resolve_target("/")
+        if self._main_doc_uri is _MISSING:
+            rel = self.relationships.get_first_by_type(REL_OFFICE_DOCUMENT)
+            self._main_doc_uri = None if rel is None else rel.resolve_target("/")
+        return self._main_doc_uri  # type: ignore[return-value]
 
     def validate_structure(self) -> list[ValidationError]:
         """Perform basic structural validation of the package.
@@ -185,6 +238,11 @@ class OpenXmlPackage(ZipPackage):
         _ = self.content_types
         errors.extend(self._errors)
 
+        # Without [Content_Types].xml the package is not valid OPC; skip the
+        # relationship parsing below.
+        if self._content_types_missing:
+            return errors
+
         # Check package relationships
         _ = self.relationships
 
@@ -2,26 +2,49 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING, cast
 
 from lxml import etree
 
+from openxml_audit.namespaces import PRESENTATIONML, R_ID_ATTR, SPREADSHEETML
 from openxml_audit.relationships import RelationshipCollection
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from openxml_audit.package import OpenXmlPackage
 
+_PML_NS = {"p": PRESENTATIONML}
+_SML_NS = {"s": SPREADSHEETML}
+_XP_SLD_IDS = etree.XPath("p:sldIdLst/p:sldId", namespaces=_PML_NS)
+_XP_SLD_MASTER_IDS = etree.XPath("p:sldMasterIdLst/p:sldMasterId", namespaces=_PML_NS)
+_XP_SHEETS = etree.XPath("s:sheets/s:sheet", namespaces=_SML_NS)
+
 
 class OpenXmlPart:
     """Represents a part within an OPC package."""
 
+    __slots__ = (
+        "_package",
+        "_uri",
+        "_content_type",
+        "_xml",
+        "_raw",
+        "_relationships",
+        "_loaded",
+        "_raw_loaded",
+        "__weakref__",
+    )
+
     def __init__(self, package: OpenXmlPackage, uri: str, content_type: str | None = None):
         self._package = package
         self._uri = uri
         self._content_type = content_type
         self._xml: etree._Element | None = None
+        self._raw: bytes | None = None
         self._relationships: RelationshipCollection | None = None
         self._loaded = False
+        self._raw_loaded = False
 
     @property
     def uri(self) -> str:
@@ -49,7 +72,22 @@ class OpenXmlPart:
     @property
     def raw_content(self) -> bytes | None:
         """Get the raw bytes content of this part."""
-        return self._package.get_part_content(self._uri)
+        if not self._raw_loaded:
+            self._raw = self._package.get_part_content(self._uri)
+            self._raw_loaded = True
+        return self._raw
+
+    @property
+    def size(self) -> int | None:
+        """Get the decompressed size of this part in bytes."""
+        return self._package.get_part_size(self._uri)
+
+    def stream(self) -> IO[bytes] | None:
+        """Open this part's content for streaming reads.
+
+        Returns None if the part doesn't exist. The caller closes the stream.
+        """
+        return self._package.open_part(self._uri)
 
     @property
     def relationships(self) -> RelationshipCollection:
@@ -75,27 +113,30 @@ class OpenXmlPart:
         target = self.relationships.resolve_target(rel_id)
         if target is None:
             return None
-        return OpenXmlPart(self._package, target)
+        return self._package.get_part(target)
 
-    def get_related_parts_by_type(self, rel_type: str) -> list[OpenXmlPart]:
-        """Get all parts related to this one by relationship type.
+    def get_related_parts_by_type(self, rel_type: str) -> Iterator[OpenXmlPart]:
+        """Iterate over parts related to this one by relationship type.
 
         Args:
             rel_type: The relationship type URI.
 
-        Returns:
-            List of related OpenXmlParts.
+        Yields:
+            Related OpenXmlParts.
         """
-        parts = []
         for rel in self.relationships.get_by_type(rel_type):
-            target = rel.resolve_target(self._uri)
-            parts.append(OpenXmlPart(self._package, target))
-        return parts
+            yield self._package.get_part(rel.resolve_target(self._uri))
+
+    def list_related_parts_by_type(self, rel_type: str) -> list[OpenXmlPart]:
+        """Get all parts related to this one by relationship type as a list."""
+        return list(self.get_related_parts_by_type(rel_type))
 
 
 class PresentationPart(OpenXmlPart):
     """The main presentation part (ppt/presentation.xml)."""
 
+    __slots__ = ()
+
     CONTENT_TYPE = (
         "application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml"
     )
@@ -106,50 +147,36 @@ class PresentationPart(OpenXmlPart):
     @property
     def slide_ids(self) -> list[tuple[str, str]]:
         """Get list of (slide_id, rel_id) tuples for all slides."""
-        from openxml_audit.namespaces import PRESENTATIONML
-
-        slides = []
         xml = self.xml
         if xml is None:
-            return slides
+            return []
 
-        ns = {"p": PRESENTATIONML}
-        sld_id_lst = xml.find("p:sldIdLst", ns)
-        if sld_id_lst is not None:
-            for sld_id in sld_id_lst.findall("p:sldId", ns):
-                id_val = sld_id.get("id", "")
-                # r:id attribute uses relationships namespace
-                rel_id = sld_id.get("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id", "")
-                if id_val and rel_id:
-                    slides.append((id_val, rel_id))
-
-        return slides
+        return [
+            (id_val, rel_id)
+            for node in cast("list[etree._Element]", _XP_SLD_IDS(xml))
+            if (id_val := node.get("id", "")) and (rel_id := node.get(R_ID_ATTR, ""))
+        ]
 
     @property
     def slide_master_ids(self) -> list[tuple[str, str]]:
         """Get list of (id, rel_id) tuples for all slide masters."""
-        from openxml_audit.namespaces import PRESENTATIONML
-
-        masters = []
         xml = self.xml
         if xml is None:
-            return masters
-
-        ns = {"p": PRESENTATIONML}
-        master_id_lst = xml.find("p:sldMasterIdLst", ns)
-        if master_id_lst is not None:
-            for master_id in master_id_lst.findall("p:sldMasterId", ns):
-                id_val = master_id.get("id", "")
-                rel_id = master_id.get("{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id", "")
-                if rel_id:  # id is optional for masters
-                    masters.append((id_val, rel_id))
+            return []
 
-        return masters
+        # id is optional for masters
+        return [
+            (node.get("id", ""), rel_id)
+            for node in cast("list[etree._Element]", _XP_SLD_MASTER_IDS(xml))
+            if (rel_id := node.get(R_ID_ATTR, ""))
+        ]
 
 
 class SlidePart(OpenXmlPart):
     """A slide part (ppt/slides/slideN.xml)."""
 
+    __slots__ = ()
+
     CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.slide+xml"
 
     def __init__(self, package: OpenXmlPackage, uri: str):
@@ -159,6 +186,8 @@ class SlidePart(OpenXmlPart):
 class SlideLayoutPart(OpenXmlPart):
     """A slide layout part (ppt/slideLayouts/slideLayoutN.xml)."""
 
+    __slots__ = ()
+
     CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.slideLayout+xml"
 
     def __init__(self, package: OpenXmlPackage, uri: str):
@@ -168,6 +197,8 @@ class SlideLayoutPart(OpenXmlPart):
 class SlideMasterPart(OpenXmlPart):
     """A slide master part (ppt/slideMasters/slideMasterN.xml)."""
 
+    __slots__ = ()
+
     CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.slideMaster+xml"
 
     def __init__(self, package: OpenXmlPackage, uri: str):
@@ -177,6 +208,8 @@ class SlideMasterPart(OpenXmlPart):
 class ThemePart(OpenXmlPart):
     """A theme part (ppt/theme/themeN.xml)."""
 
+    __slots__ = ()
+
     CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.theme+xml"
 
     def __init__(self, package: OpenXmlPackage, uri: str):
@@ -186,6 +219,8 @@ class ThemePart(OpenXmlPart):
 class DocumentPart(OpenXmlPart):
     """The main Word document part (word/document.xml)."""
 
+    __slots__ = ()
+
     CONTENT_TYPE = (
         "application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"
     )
@@ -197,6 +232,8 @@ class DocumentPart(OpenXmlPart):
 class WorkbookPart(OpenXmlPart):
     """The main Excel workbook part (xl/workbook.xml)."""
 
+    __slots__ = ()
+
     CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"
 
     def __init__(self, package: OpenXmlPackage, uri: str = "/xl/workbook.xml"):
@@ -205,23 +242,11 @@ class WorkbookPart(OpenXmlPart):
     @property
     def sheet_ids(self) -> list[tuple[str, str, str]]:
         """Get list of (sheet_id, rel_id, name) tuples for all sheets."""
-        from openxml_audit.namespaces import SPREADSHEETML
-
-        sheets: list[tuple[str, str, str]] = []
         xml = self.xml
         if xml is None:
-            return sheets
-
-        ns = {"s": SPREADSHEETML}
-        sheet_list = xml.find("s:sheets", ns)
-        if sheet_list is None:
-            return sheets
-
-        rel_ns = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
-        for sheet in sheet_list.findall("s:sheet", ns):
-            sheet_id = sheet.get("sheetId", "")
-            rel_id = sheet.get(f"{{{rel_ns}}}id", "")
-            name = sheet.get("name", "")
-            sheets.append((sheet_id, rel_id, name))
+            return []
 
-        return sheets
+        return [
+            (sheet.get("sheetId", ""), sheet.get(R_ID_ATTR, ""), sheet.get("name", ""))
+            for sheet in cast("list[etree._Element]", _XP_SHEETS(xml))
+        ]
@@ -5,29 +5,71 @@ Validates slide masters, slide layouts, and their relationships.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from lxml import etree
 
 from openxml_audit.context import ElementContext
 from openxml_audit.errors import ValidationError
-from openxml_audit.namespaces import DRAWINGML, PRESENTATIONML
+from openxml_audit.namespaces import (
+    DRAWINGML,
+    PRESENTATIONML,
+    REL_SLIDE_LAYOUT,
+    REL_SLIDE_MASTER,
+    REL_THEME,
+)
+from openxml_audit.pptx.presentation import check_id_list
 
 if TYPE_CHECKING:
     from openxml_audit.context import ValidationContext
-    from openxml_audit.parts import OpenXmlPart, SlideLayoutPart, SlideMasterPart
+    from openxml_audit.parts import SlideLayoutPart, SlideMasterPart
+
+_NS = {"p": PRESENTATIONML, "a": DRAWINGML}
+_XP_CSLD = etree.XPath("p:cSld[1]", namespaces=_NS)
+_XP_SPTREE = etree.XPath("p:spTree[1]", namespaces=_NS)
+_XP_CLRMAP = etree.XPath("p:clrMap[1]", namespaces=_NS)
+_XP_CLRMAPOVR = etree.XPath("p:clrMapOvr[1]", namespaces=_NS)
+_XP_MASTERCLRMAP = etree.XPath("a:masterClrMapping[1]", namespaces=_NS)
+_XP_OVERRIDECLRMAP = etree.XPath("a:overrideClrMapping[1]", namespaces=_NS)
+_XP_SLDLAYOUTIDLST = etree.XPath("p:sldLayoutIdLst[1]", namespaces=_NS)
+
+_Q_SLDMASTER = f"{{{PRESENTATIONML}}}sldMaster"
+_Q_SLDLAYOUT = f"{{{PRESENTATIONML}}}sldLayout"
+_Q_NVGRPSPPR = f"{{{PRESENTATIONML}}}nvGrpSpPr"
+_Q_GRPSPPR = f"{{{PRESENTATIONML}}}grpSpPr"
+_Q_SLDLAYOUTID = f"{{{PRESENTATIONML}}}sldLayoutId"
+
+# ST_SlideLayoutType values
+_VALID_LAYOUT_TYPES = frozenset({
+    "title", "tx", "twoColTx", "tbl", "txAndChart",
+    "chartAndTx", "dgm", "chart", "txAndClipArt",
+    "clipArtAndTx", "titleOnly", "blank", "txAndObj",
+    "objAndTx", "objOnly", "obj", "txAndMedia",
+    "mediaAndTx", "objOverTx", "txOverObj", "txAndTwoObj",
+    "twoObjAndTx", "twoObjOverTx", "fourObj", "vertTx",
+    "clipArtAndVertTx", "vertTitleAndTx", "vertTitleAndTxOverChart",
+    "twoObj", "objAndTwoObj", "twoObjAndObj", "cust",
+    "secHead", "twoTxTwoObj", "objTx", "picTx",
+})
+
+# Attributes every p:clrMap must carry
+_CLR_MAP_REQUIRED_ATTRS = (
+    "bg1", "tx1", "bg2", "tx2",
+    "accent1", "accent2", "accent3", "accent4",
+    "accent5", "accent6", "hlink", "folHlink",
+)
+
+
+def _first(matches: object) -> etree._Element | None:
+    """Return the first XPath match, or None."""
+    # The compiled paths select elements only
+    elements = cast("list[etree._Element]", matches)
+    return elements[0] if elements else None
 
 
 class MasterValidator:
     """Validates PPTX slide master and layout structure."""
 
-    def __init__(self) -> None:
-        self._ns = {
-            "p": PRESENTATIONML,
-            "a": DRAWINGML,
-        }
-        self._rel_ns = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
-
     def validate_master(
         self, part: "SlideMasterPart", context: "ValidationContext"
     ) -> list[ValidationError]:
@@ -40,12 +82,11 @@ class MasterValidator:
         Returns:
             List of validation errors.
         """
-        context.set_part(part)
-        errors: list[ValidationError] = []
-
         xml = part.xml
         if xml is None:
-            return errors
+            return []
+
+        context.set_part(part)
 
         with ElementContext(context, xml):
             # Validate root element
@@ -63,11 +104,7 @@ class MasterValidator:
             # Validate theme relationship
             self._validate_theme_relationship(part, context)
 
-            # Validate text styles
-            self._validate_tx_styles(xml, context)
-
-        errors.extend(context.errors)
-        return errors
+        return list(context.errors)
 
     def validate_layout(
         self, part: "SlideLayoutPart", context: "ValidationContext"
@@ -81,12 +118,11 @@ class MasterValidator:
         Returns:
             List of validation errors.
         """
-        context.set_part(part)
-        errors: list[ValidationError] = []
-
         xml = part.xml
         if xml is None:
-            return errors
+            return []
+
+        context.set_part(part)
 
         with ElementContext(context, xml):
             # Validate root element
@@ -101,15 +137,13 @@ class MasterValidator:
             # Validate slide master relationship
             self._validate_master_relationship(part, context)
 
-        errors.extend(context.errors)
-        return errors
+        return list(context.errors)
 
     def _validate_master_root(
         self, xml: etree._Element, context: "ValidationContext"
     ) -> None:
         """Validate the slide master root element."""
-        expected_tag = f"{{{PRESENTATIONML}}}sldMaster"
-        if xml.tag != expected_tag:
+        if xml.tag != _Q_SLDMASTER:
             context.add_schema_error(
                 f"Root element should be 'sldMaster', got '{xml.tag}'",
             )
@@ -118,31 +152,18 @@ class MasterValidator:
         self, xml: etree._Element, context: "ValidationContext"
     ) -> None:
         """Validate the slide layout root element."""
-        expected_tag = f"{{{PRESENTATIONML}}}sldLayout"
-        if xml.tag != expected_tag:
+        if xml.tag != _Q_SLDLAYOUT:
             context.add_schema_error(
                 f"Root element should be 'sldLayout', got '{xml.tag}'",
             )
 
         # Check layout type
         layout_type = xml.get("type")
-        if layout_type:
-            valid_types = {
-                "title", "tx", "twoColTx", "tbl", "txAndChart",
-                "chartAndTx", "dgm", "chart", "txAndClipArt",
-                "clipArtAndTx", "titleOnly", "blank", "txAndObj",
-                "objAndTx", "objOnly", "obj", "txAndMedia",
-                "mediaAndTx", "objOverTx", "txOverObj", "txAndTwoObj",
-                "twoObjAndTx", "twoObjOverTx", "fourObj", "vertTx",
-                "clipArtAndVertTx", "vertTitleAndTx", "vertTitleAndTxOverChart",
-                "twoObj", "objAndTwoObj", "twoObjAndObj", "cust",
-                "secHead", "twoTxTwoObj", "objTx", "picTx",
-            }
-            if layout_type not in valid_types:
-                context.add_semantic_error(
-                    f"Invalid layout type: '{layout_type}'",
-                    node="type",
-                )
+        if layout_type and layout_type not in _VALID_LAYOUT_TYPES:
+            context.add_semantic_error(
+                f"Invalid layout type: '{layout_type}'",
+                node="type",
+            )
 
     def _validate_cSld(
         self,
@@ -151,7 +172,7 @@ class MasterValidator:
         context: "ValidationContext",
     ) -> None:
         """Validate common slide data."""
-        cSld = xml.find("p:cSld", self._ns)
+        cSld = _first(_XP_CSLD(xml))
         if cSld is None:
             context.add_schema_error(
                 f"{parent_type} missing required cSld element",
@@ -159,22 +180,33 @@ class MasterValidator:
             return
 
         # Validate shape tree
-        spTree = cSld.find("p:spTree", self._ns)
+        spTree = _first(_XP_SPTREE(cSld))
         if spTree is None:
             context.add_schema_error(
                 "cSld missing required spTree element",
             )
             return
 
-        # Validate shape tree structure
-        nvGrpSpPr = spTree.find("p:nvGrpSpPr", self._ns)
-        if nvGrpSpPr is None:
+        # Validate shape tree structure in one pass over its children; the
+        # group properties lead the tree, so the scan normally stops early.
+        has_nvGrpSpPr = has_grpSpPr = False
+        for child in spTree:
+            tag = child.tag
+            if tag == _Q_NVGRPSPPR:
+                has_nvGrpSpPr = True
+            elif tag == _Q_GRPSPPR:
+                has_grpSpPr = True
+            else:
+                continue
+            if has_nvGrpSpPr and has_grpSpPr:
+                break
+
+        if not has_nvGrpSpPr:
             context.add_schema_error(
                 "spTree missing required nvGrpSpPr element",
             )
 
-        grpSpPr = spTree.find("p:grpSpPr", self._ns)
-        if grpSpPr is None:
+        if not has_grpSpPr:
             context.add_schema_error(
                 "spTree missing required grpSpPr element",
             )
@@ -183,21 +215,14 @@ class MasterValidator:
         self, xml: etree._Element, context: "ValidationContext"
     ) -> None:
         """Validate color map in slide master."""
-        clrMap = xml.find("p:clrMap", self._ns)
+        clrMap = _first(_XP_CLRMAP(xml))
         if clrMap is None:
             context.add_schema_error(
                 "sldMaster missing required clrMap element",
             )
             return
 
-        # Required color map attributes
-        required_attrs = [
-            "bg1", "tx1", "bg2", "tx2",
-            "accent1", "accent2", "accent3", "accent4",
-            "accent5", "accent6", "hlink", "folHlink",
-        ]
-
-        for attr in required_attrs:
+        for attr in _CLR_MAP_REQUIRED_ATTRS:
             if clrMap.get(attr) is None:
                 context.add_schema_error(
                     f"clrMap missing required '{attr}' attribute",
@@ -208,13 +233,13 @@ class MasterValidator:
         self, xml: etree._Element, context: "ValidationContext"
     ) -> None:
         """Validate color map override in slide layout."""
-        clrMapOvr = xml.find("p:clrMapOvr", self._ns)
+        clrMapOvr = _first(_XP_CLRMAPOVR(xml))
         if clrMapOvr is None:
             return  # Optional
 
         # Should have either masterClrMapping or overrideClrMapping
-        has_master = clrMapOvr.find("a:masterClrMapping", self._ns) is not None
-        has_override = clrMapOvr.find("a:overrideClrMapping", self._ns) is not None
+        has_master = bool(_XP_MASTERCLRMAP(clrMapOvr))
+        has_override = bool(_XP_OVERRIDECLRMAP(clrMapOvr))
 
         if not has_master and not has_override:
             context.add_schema_error(
@@ -228,102 +253,58 @@ class MasterValidator:
         context: "ValidationContext",
     ) -> None:
         """Validate slide layout references in master."""
-        layoutIdLst = xml.find("p:sldLayoutIdLst", self._ns)
+        layoutIdLst = _first(_XP_SLDLAYOUTIDLST(xml))
         if layoutIdLst is None:
             context.add_schema_error(
                 "sldMaster missing required sldLayoutIdLst element",
             )
             return
 
-        layoutIds = layoutIdLst.findall("p:sldLayoutId", self._ns)
-        if not layoutIds:
+        count = check_id_list(
+            layoutIdLst,
+            _Q_SLDLAYOUTID,
+            REL_SLIDE_LAYOUT,
+            part.relationships,
+            context,
+            label="slide layout",
+        )
+
+        if not count:
             context.add_schema_error(
                 "sldLayoutIdLst is empty - at least one layout required",
             )
-            return
-
-        seen_ids: set[str] = set()
-        layout_rel_type = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
-
-        for layoutId in layoutIds:
-            # Check for duplicate IDs
-            id_val = layoutId.get("id", "")
-            if id_val:
-                if id_val in seen_ids:
-                    context.add_semantic_error(
-                        f"Duplicate slide layout ID: {id_val}",
-                        node="id",
-                    )
-                seen_ids.add(id_val)
-
-            # Check relationship
-            rel_id = layoutId.get(f"{{{self._rel_ns}}}id", "")
-            if not rel_id:
-                context.add_schema_error(
-                    "sldLayoutId missing r:id attribute",
-                    node="sldLayoutId",
-                )
-                continue
-
-            rel = part.relationships.get_by_id(rel_id)
-            if rel is None:
-                context.add_semantic_error(
-                    f"Slide layout relationship '{rel_id}' not found",
-                    node="r:id",
-                )
-            elif rel.type != layout_rel_type:
-                context.add_semantic_error(
-                    f"Relationship '{rel_id}' should be slideLayout type",
-                    node="r:id",
-                )
 
     def _validate_theme_relationship(
         self, part: "SlideMasterPart", context: "ValidationContext"
     ) -> None:
         """Validate slide master has a theme relationship."""
-        theme_type = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme"
-
-        theme_rels = list(part.relationships.get_by_type(theme_type))
-        if not theme_rels:
+        theme_count = part.relationships.count_by_type(REL_THEME)
+        if not theme_count:
             context.add_semantic_error(
                 "Slide master must have a theme relationship",
             )
-        elif len(theme_rels) > 1:
+        elif theme_count > 1:
             context.add_semantic_error(
-                f"Slide master has {len(theme_rels)} theme relationships, expected 1",
+                f"Slide master has {theme_count} theme relationships, expected 1",
             )
 
     def _validate_master_relationship(
         self, part: "SlideLayoutPart", context: "ValidationContext"
     ) -> None:
         """Validate slide layout has a master relationship."""
-        master_type = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideMaster"
-
-        master_rels = list(part.relationships.get_by_type(master_type))
-        if not master_rels:
+        master_count = part.relationships.count_by_type(REL_SLIDE_MASTER)
+        if not master_count:
             context.add_semantic_error(
                 "Slide layout must have a slideMaster relationship",
             )
-        elif len(master_rels) > 1:
+        elif master_count > 1:
             context.add_semantic_error(
-                f"Slide layout has {len(master_rels)} slideMaster relationships, expected 1",
+                f"Slide layout has {master_count} slideMaster relationships, expected 1",
             )
 
-    def _validate_tx_styles(
-        self, xml: etree._Element, context: "ValidationContext"
-    ) -> None:
-        """Validate text styles in slide master."""
-        txStyles = xml.find("p:txStyles", self._ns)
-        if txStyles is None:
-            return  # Optional
 
-        # Check for expected text style elements
-        expected_styles = ["titleStyle", "bodyStyle", "otherStyle"]
-        for style_name in expected_styles:
-            style = txStyles.find(f"p:{style_name}", self._ns)
-            if style is None:
-                # Not required, but if txStyles exists, typically has these
-                pass
+# MasterValidator holds no per-call state, so the helpers share one instance.
+_MASTER_VALIDATOR = MasterValidator()
 
 
 def validate_slide_master(
@@ -338,8 +319,7 @@ def validate_slide_master(
     Returns:
         List of validation errors.
     """
-    validator = MasterValidator()
-    return validator.validate_master(part, context)
+    return _MASTER_VALIDATOR.validate_master(part, context)
 
 
 def validate_slide_layout(
@@ -354,5 +334,4 @@ def validate_slide_layout(
     Returns:
         List of validation errors.
     """
-    validator = MasterValidator()
-    return validator.validate_layout(part, context)
+    return _MASTER_VALIDATOR.validate_layout(part, context)
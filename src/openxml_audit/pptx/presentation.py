@@ -12,20 +12,130 @@ from lxml import etree
 
 from openxml_audit.context import ElementContext
 from openxml_audit.errors import ValidationError, ValidationErrorType, ValidationSeverity
-from openxml_audit.namespaces import PRESENTATIONML, REL_SLIDE, REL_SLIDE_MASTER
+from openxml_audit.namespaces import PRESENTATIONML, R_ID_ATTR, REL_SLIDE, REL_SLIDE_MASTER
 
 if TYPE_CHECKING:
     from openxml_audit.context import ValidationContext
     from openxml_audit.parts import PresentationPart
+    from openxml_audit.relationships import RelationshipCollection
+
+_Q_PRESENTATION = f"{{{PRESENTATIONML}}}presentation"
+_Q_SLDMASTERIDLST = f"{{{PRESENTATIONML}}}sldMasterIdLst"
+_Q_SLDIDLST = f"{{{PRESENTATIONML}}}sldIdLst"
+_Q_NOTESMASTERIDLST = f"{{{PRESENTATIONML}}}notesMasterIdLst"
+_Q_HANDOUTMASTERIDLST = f"{{{PRESENTATIONML}}}handoutMasterIdLst"
+_Q_SLDSZ = f"{{{PRESENTATIONML}}}sldSz"
+_Q_NOTESSZ = f"{{{PRESENTATIONML}}}notesSz"
+_Q_SLDMASTERID = f"{{{PRESENTATIONML}}}sldMasterId"
+_Q_SLDID = f"{{{PRESENTATIONML}}}sldId"
+_Q_NOTESMASTERID = f"{{{PRESENTATIONML}}}notesMasterId"
+_Q_HANDOUTMASTERID = f"{{{PRESENTATIONML}}}handoutMasterId"
+
+
+# Root children inspected by the validator, collected in a single pass.
+_SECTION_TAGS = frozenset(
+    (
+        _Q_SLDMASTERIDLST,
+        _Q_SLDIDLST,
+        _Q_NOTESMASTERIDLST,
+        _Q_HANDOUTMASTERIDLST,
+        _Q_SLDSZ,
+        _Q_NOTESSZ,
+    )
+)
+
+
+def _collect_sections(xml: etree._Element) -> dict[str, etree._Element]:
+    """Map each known root child tag to its first occurrence."""
+    sections: dict[str, etree._Element] = {}
+    for child in xml:
+        tag = child.tag
+        if tag in _SECTION_TAGS and tag not in sections:
+            sections[tag] = child
+    return sections
+
+
+def _parse_int(value: str) -> int | None:
+    """Parse a decimal integer attribute, or return None if it is malformed."""
+    text = value.strip()
+    digits = text[1:] if text[:1] in ("+", "-") else text
+    return int(text) if digits.isdecimal() else None
+
+
+def check_id_list(
+    id_list: etree._Element,
+    child_tag: str,
+    rel_type: str,
+    relationships: "RelationshipCollection",
+    context: "ValidationContext",
+    *,
+    label: str,
+    report_actual_type: bool = False,
+) -> int:
+    """Validate the ID entries of a sldMasterIdLst/sldIdLst/sldLayoutIdLst.
+
+    Reports duplicate ``id`` values, missing ``r:id`` attributes, and
+    ``r:id`` values that do not resolve to a relationship of ``rel_type``.
+
+    Args:
+        id_list: The ID list element.
+        child_tag: Clark name of the entry elements to check.
+        rel_type: Relationship type each entry must reference.
+        relationships: Relationships of the part owning the list.
+        context: The validation context.
+        label: Human-readable entry name used in messages (e.g. "slide master").
+        report_actual_type: Include the actual type in wrong-type messages.
+
+    Returns:
+        The number of entries found.
+    """
+    child_name = child_tag.rpartition("}")[2]
+    type_name = rel_type.rpartition("/")[2]
+    seen_ids: set[str] = set()
+    count = 0
+
+    for entry in id_list.iterchildren(child_tag):
+        count += 1
+
+        # Check for duplicate IDs
+        attrib = entry.attrib
+        id_val = attrib.get("id")
+        if id_val:
+            seen_count = len(seen_ids)
+            seen_ids.add(id_val)
+            if len(seen_ids) == seen_count:
+                context.add_semantic_error(
+                    f"Duplicate {label} ID: {id_val}",
+                    node="id",
+                )
+
+        # Check relationship exists
+        rel_id = attrib.get(R_ID_ATTR)
+        if not rel_id:
+            context.add_schema_error(
+                f"{child_name} missing r:id attribute",
+                node=child_name,
+            )
+            continue
+
+        rel = relationships.get_by_id(rel_id)
+        if rel is None:
+            context.add_semantic_error(
+                f"{label.capitalize()} relationship '{rel_id}' not found",
+                node="r:id",
+            )
+        elif rel.type != rel_type:
+            message = f"Relationship '{rel_id}' should be {type_name} type"
+            if report_actual_type:
+                message += f", got '{rel.type}'"
+            context.add_semantic_error(message, node="r:id")
+
+    return count
 
 
 class PresentationValidator:
     """Validates PPTX presentation structure."""
 
-    def __init__(self) -> None:
-        self._ns = {"p": PRESENTATIONML}
-        self._rel_ns = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
-
     def validate(
         self, part: "PresentationPart", context: "ValidationContext"
     ) -> list[ValidationError]:
@@ -38,42 +148,45 @@ class PresentationValidator:
         Returns:
             List of validation errors.
         """
-        context.set_part(part)
-        errors: list[ValidationError] = []
-
         xml = part.xml
         if xml is None:
-            return errors
+            return []
+
+        context.set_part(part)
 
         with ElementContext(context, xml):
             # Validate root element
             self._validate_root(xml, context)
 
+            sections = _collect_sections(xml)
+
             # Validate slide master list
-            self._validate_slide_master_list(xml, part, context)
+            self._validate_slide_master_list(
+                sections.get(_Q_SLDMASTERIDLST), part, context
+            )
 
             # Validate slide list
-            self._validate_slide_list(xml, part, context)
+            self._validate_slide_list(sections.get(_Q_SLDIDLST), part, context)
 
             # Validate notes master
-            self._validate_notes_master(xml, part, context)
+            self._validate_notes_master(sections.get(_Q_NOTESMASTERIDLST), context)
 
             # Validate handout master
-            self._validate_handout_master(xml, part, context)
+            self._validate_handout_master(
+                sections.get(_Q_HANDOUTMASTERIDLST), context
+            )
 
             # Validate slide size
-            self._validate_slide_size(xml, context)
+            self._validate_slide_size(sections.get(_Q_SLDSZ), context)
 
             # Validate notes size
-            self._validate_notes_size(xml, context)
+            self._validate_notes_size(sections.get(_Q_NOTESSZ), context)
 
-        errors.extend(context.errors)
-        return errors
+        return list(context.errors)
 
     def _validate_root(self, xml: etree._Element, context: "ValidationContext") -> None:
         """Validate the root presentation element."""
-        expected_tag = f"{{{PRESENTATIONML}}}presentation"
-        if xml.tag != expected_tag:
+        if xml.tag != _Q_PRESENTATION:
             context.add_schema_error(
                 f"Root element should be 'presentation', got '{xml.tag}'",
             )
@@ -87,187 +200,105 @@ class PresentationValidator:
 
     def _validate_slide_master_list(
         self,
-        xml: etree._Element,
+        master_list: etree._Element | None,
         part: "PresentationPart",
         context: "ValidationContext",
     ) -> None:
         """Validate slide master references."""
-        master_list = xml.find("p:sldMasterIdLst", self._ns)
-
         if master_list is None:
             context.add_schema_error(
                 "Presentation must have at least one slide master",
             )
             return
 
-        master_ids = master_list.findall("p:sldMasterId", self._ns)
-        if not master_ids:
+        count = check_id_list(
+            master_list,
+            _Q_SLDMASTERID,
+            REL_SLIDE_MASTER,
+            part.relationships,
+            context,
+            label="slide master",
+            report_actual_type=True,
+        )
+
+        if not count:
             context.add_schema_error(
                 "sldMasterIdLst is empty - at least one slide master required",
             )
-            return
-
-        seen_ids: set[str] = set()
-
-        for master_id in master_ids:
-            # Check for duplicate master IDs
-            id_val = master_id.get("id", "")
-            if id_val:
-                if id_val in seen_ids:
-                    context.add_semantic_error(
-                        f"Duplicate slide master ID: {id_val}",
-                        node="id",
-                    )
-                seen_ids.add(id_val)
-
-            # Check relationship exists
-            rel_id = master_id.get(f"{{{self._rel_ns}}}id", "")
-            if not rel_id:
-                context.add_schema_error(
-                    "sldMasterId missing r:id attribute",
-                    node="sldMasterId",
-                )
-                continue
-
-            rel = part.relationships.get_by_id(rel_id)
-            if rel is None:
-                context.add_semantic_error(
-                    f"Slide master relationship '{rel_id}' not found",
-                    node="r:id",
-                )
-            elif rel.type != REL_SLIDE_MASTER:
-                context.add_semantic_error(
-                    f"Relationship '{rel_id}' should be slideMaster type, got '{rel.type}'",
-                    node="r:id",
-                )
 
     def _validate_slide_list(
         self,
-        xml: etree._Element,
+        slide_list: etree._Element | None,
         part: "PresentationPart",
         context: "ValidationContext",
     ) -> None:
         """Validate slide references."""
-        slide_list = xml.find("p:sldIdLst", self._ns)
-
         if slide_list is None:
             # Empty presentation - valid but possibly warn
             return
 
-        slide_ids = slide_list.findall("p:sldId", self._ns)
-        seen_ids: set[str] = set()
-
-        for slide_id in slide_ids:
-            # Check for duplicate slide IDs
-            id_val = slide_id.get("id", "")
-            if id_val:
-                if id_val in seen_ids:
-                    context.add_semantic_error(
-                        f"Duplicate slide ID: {id_val}",
-                        node="id",
-                    )
-                seen_ids.add(id_val)
-
-            # Check relationship exists
-            rel_id = slide_id.get(f"{{{self._rel_ns}}}id", "")
-            if not rel_id:
-                context.add_schema_error(
-                    "sldId missing r:id attribute",
-                    node="sldId",
-                )
-                continue
-
-            rel = part.relationships.get_by_id(rel_id)
-            if rel is None:
-                context.add_semantic_error(
-                    f"Slide relationship '{rel_id}' not found",
-                    node="r:id",
-                )
-            elif rel.type != REL_SLIDE:
-                context.add_semantic_error(
-                    f"Relationship '{rel_id}' should be slide type, got '{rel.type}'",
-                    node="r:id",
-                )
+        check_id_list(
+            slide_list,
+            _Q_SLDID,
+            REL_SLIDE,
+            part.relationships,
+            context,
+            label="slide",
+            report_actual_type=True,
+        )
 
     def _validate_notes_master(
-        self,
-        xml: etree._Element,
-        part: "PresentationPart",
-        context: "ValidationContext",
+        self, notes_list: etree._Element | None, context: "ValidationContext"
     ) -> None:
         """Validate notes master reference."""
-        notes_list = xml.find("p:notesMasterIdLst", self._ns)
         if notes_list is None:
             return  # Notes master is optional
 
-        notes_ids = notes_list.findall("p:notesMasterId", self._ns)
-        if len(notes_ids) > 1:
+        if sum(1 for _ in notes_list.iterchildren(_Q_NOTESMASTERID)) > 1:
             context.add_schema_error(
                 "Only one notes master allowed",
             )
 
     def _validate_handout_master(
-        self,
-        xml: etree._Element,
-        part: "PresentationPart",
-        context: "ValidationContext",
+        self, handout_list: etree._Element | None, context: "ValidationContext"
     ) -> None:
         """Validate handout master reference."""
-        handout_list = xml.find("p:handoutMasterIdLst", self._ns)
         if handout_list is None:
             return  # Handout master is optional
 
-        handout_ids = handout_list.findall("p:handoutMasterId", self._ns)
-        if len(handout_ids) > 1:
+        if sum(1 for _ in handout_list.iterchildren(_Q_HANDOUTMASTERID)) > 1:
             context.add_schema_error(
                 "Only one handout master allowed",
             )
 
     def _validate_slide_size(
-        self, xml: etree._Element, context: "ValidationContext"
+        self, slide_size: etree._Element | None, context: "ValidationContext"
     ) -> None:
         """Validate slide size element."""
-        slide_size = xml.find("p:sldSz", self._ns)
         if slide_size is None:
             return  # Uses default size
 
         # Validate dimensions
-        cx = slide_size.get("cx")
-        cy = slide_size.get("cy")
-
-        if cx is not None:
-            try:
-                cx_val = int(cx)
-                if cx_val <= 0:
-                    context.add_semantic_error(
-                        f"Slide width must be positive, got {cx_val}",
-                        node="cx",
-                    )
-            except ValueError:
+        for attr, label in (("cx", "width"), ("cy", "height")):
+            value = slide_size.get(attr)
+            if value is None:
+                continue
+            parsed = _parse_int(value)
+            if parsed is None:
                 context.add_schema_error(
-                    f"Invalid slide width: {cx}",
-                    node="cx",
+                    f"Invalid slide {label}: {value}",
+                    node=attr,
                 )
-
-        if cy is not None:
-            try:
-                cy_val = int(cy)
-                if cy_val <= 0:
-                    context.add_semantic_error(
-                        f"Slide height must be positive, got {cy_val}",
-                        node="cy",
-                    )
-            except ValueError:
-                context.add_schema_error(
-                    f"Invalid slide height: {cy}",
-                    node="cy",
+            elif parsed <= 0:
+                context.add_semantic_error(
+                    f"Slide {label} must be positive, got {parsed}",
+                    node=attr,
                 )
 
     def _validate_notes_size(
-        self, xml: etree._Element, context: "ValidationContext"
+        self, notes_size: etree._Element | None, context: "ValidationContext"
     ) -> None:
         """Validate notes size element."""
-        notes_size = xml.find("p:notesSz", self._ns)
         if notes_size is None:
             context.add_schema_error(
                 "notesSz element is required",
@@ -285,6 +316,10 @@ class PresentationValidator:
             )
 
 
+# PresentationValidator holds no per-call state, so the helper shares one instance.
+_PRESENTATION_VALIDATOR = PresentationValidator()
+
+
 def validate_presentation(
     part: "PresentationPart", context: "ValidationContext"
 ) -> list[ValidationError]:
@@ -297,5 +332,4 @@ def validate_presentation(
     Returns:
         List of validation errors.
     """
-    validator = PresentationValidator()
-    return validator.validate(part, context)
+    return _PRESENTATION_VALIDATOR.validate(part, context)
@@ -6,28 +6,134 @@ and embedded content.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from typing import TYPE_CHECKING, cast
 
 from lxml import etree
 
 from openxml_audit.context import ElementContext
+from openxml_audit.core.package import PART_PARSER_OPTIONS
 from openxml_audit.errors import ValidationError
-from openxml_audit.namespaces import DRAWINGML, PRESENTATIONML
+from openxml_audit.namespaces import DRAWINGML, PRESENTATIONML, REL_SLIDE_LAYOUT
 
 if TYPE_CHECKING:
     from openxml_audit.context import ValidationContext
     from openxml_audit.parts import SlidePart
 
+_NS = {"p": PRESENTATIONML, "a": DRAWINGML}
+_XP_CSLD = etree.XPath("p:cSld[1]", namespaces=_NS)
+_XP_SPTREE = etree.XPath("p:spTree[1]", namespaces=_NS)
+_XP_NVGRPSPPR = etree.XPath("p:nvGrpSpPr[1]", namespaces=_NS)
+_XP_GRPSPPR = etree.XPath("p:grpSpPr[1]", namespaces=_NS)
+_XP_CNVPR = etree.XPath("p:cNvPr[1]", namespaces=_NS)
+_XP_CNVGRPSPPR = etree.XPath("p:cNvGrpSpPr[1]", namespaces=_NS)
+_XP_NVPR = etree.XPath("p:nvPr[1]", namespaces=_NS)
+_XP_TXBODY = etree.XPath("p:txBody[1]", namespaces=_NS)
+_XP_BODYPR = etree.XPath("a:bodyPr[1]", namespaces=_NS)
+_XP_PARAGRAPH = etree.XPath("a:p[1]", namespaces=_NS)
+_XP_CLRMAPOVR = etree.XPath("p:clrMapOvr[1]", namespaces=_NS)
+_XP_MASTERCLRMAP = etree.XPath("a:masterClrMapping[1]", namespaces=_NS)
+_XP_OVERRIDECLRMAP = etree.XPath("a:overrideClrMapping[1]", namespaces=_NS)
+
+_P = f"{{{PRESENTATIONML}}}"
+_Q_SLD = f"{_P}sld"
+_Q_CNVPR = f"{_P}cNvPr"
+_Q_CSLD = f"{_P}cSld"
+_Q_SPTREE = f"{_P}spTree"
+
+# Validates one shape: (shape, seen shape IDs, context).
+_ShapeCheck = Callable[[etree._Element, set[str], "ValidationContext"], None]
+# Validates a part of one shape: (shape, context).
+_ShapePartCheck = Callable[[etree._Element, "ValidationContext"], None]
+
+
+def _first(matches: object) -> etree._Element | None:
+    """Return the first XPath match, or None."""
+    # The compiled paths select elements only
+    elements = cast("list[etree._Element]", matches)
+    return elements[0] if elements else None
+
+
+def _check_text_body(shape: etree._Element, context: ValidationContext) -> None:
+    """Validate shape text body."""
+    txBody = _first(_XP_TXBODY(shape))
+    if txBody is None:
+        return  # Text body is optional
+
+    # Check body properties
+    bodyPr = _first(_XP_BODYPR(txBody))
+    if bodyPr is None:
+        context.add_schema_error(
+            "txBody missing required bodyPr element",
+        )
+
+    # Check for at least one paragraph
+    if not _XP_PARAGRAPH(txBody):
+        context.add_schema_error(
+            "txBody must have at least one paragraph (a:p)",
+        )
+
+
+def _make_shape_check(
+    shape_type: str,
+    nv_prop_name: str,
+    sp_prop_name: str | None,
+    text_body_check: _ShapePartCheck | None = None,
+) -> _ShapeCheck:
+    """Build a validator for one shape type with its tags and messages baked in."""
+    cnvpr_path = f"{_P}{nv_prop_name}/{_Q_CNVPR}"
+    sp_prop_tag = f"{_P}{sp_prop_name}" if sp_prop_name else None
+    missing_sp_prop = f"{shape_type} missing required {sp_prop_name} element"
+
+    def check(
+        shape: etree._Element,
+        seen_ids: set[str],
+        context: ValidationContext,
+    ) -> None:
+        # Find the shape's non-visual properties in one path lookup
+        cNvPr = shape.find(cnvpr_path)
+        if cNvPr is not None:
+            shape_id = cNvPr.get("id")
+            if shape_id:
+                seen_count = len(seen_ids)
+                seen_ids.add(shape_id)
+                if len(seen_ids) == seen_count:
+                    context.add_semantic_error(
+                        f"Duplicate shape ID: {shape_id}",
+                        node="id",
+                    )
+
+        # Validate shape properties exist
+        if sp_prop_tag is not None and shape.find(sp_prop_tag) is None:
+            context.add_schema_error(missing_sp_prop)
+
+        # Validate text body for shapes that can have text
+        if text_body_check is not None:
+            text_body_check(shape, context)
+
+    return check
+
+
+# Shape elements in a spTree, keyed by Clark name, mapped to their checks.
+# graphicFrame carries p:xfrm rather than shape properties, so it has none.
+_SHAPE_CHECKS: dict[str, _ShapeCheck] = {
+    f"{_P}{shape_type}": _make_shape_check(shape_type, nv_prop_name, sp_prop_name, text_body)
+    for shape_type, nv_prop_name, sp_prop_name, text_body in (
+        ("sp", "nvSpPr", "spPr", _check_text_body),
+        ("grpSp", "nvGrpSpPr", "grpSpPr", None),
+        ("graphicFrame", "nvGraphicFramePr", None, None),
+        ("cxnSp", "nvCxnSpPr", "spPr", None),
+        ("pic", "nvPicPr", "spPr", None),
+    )
+}
+
 
 class SlideValidator:
     """Validates PPTX slide structure."""
 
-    def __init__(self) -> None:
-        self._ns = {
-            "p": PRESENTATIONML,
-            "a": DRAWINGML,
-        }
-        self._rel_ns = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    # Slides larger than this are streamed: each top-level shape is validated
+    # as soon as it is parsed and then dropped from the tree.
+    STREAM_THRESHOLD_BYTES = 4 * 1024 * 1024
 
     def validate(
         self, part: "SlidePart", context: "ValidationContext"
@@ -42,18 +148,34 @@ class SlideValidator:
             List of validation errors.
         """
         context.set_part(part)
-        errors: list[ValidationError] = []
+
+        size = part.size
+        if (
+            size is not None
+            and size > self.STREAM_THRESHOLD_BYTES
+            and self._validate_streaming(part, context)
+        ):
+            return list(context.errors)
 
         xml = part.xml
         if xml is None:
-            return errors
+            return []
 
         with ElementContext(context, xml):
             # Validate root element
             self._validate_root(xml, context)
 
             # Validate common slide data
-            self._validate_cSld(xml, context)
+            spTree = self._validate_cSld(xml, context)
+            if spTree is not None:
+                self._validate_group_properties(spTree, context)
+
+                # Validate shapes
+                seen_ids: set[str] = set()
+                for child in spTree.iterchildren():
+                    check = _SHAPE_CHECKS.get(child.tag)
+                    if check is not None:
+                        check(child, seen_ids, context)
 
             # Validate color map override
             self._validate_clr_map_ovr(xml, context)
@@ -61,42 +183,101 @@ class SlideValidator:
             # Validate slide layout relationship
             self._validate_layout_relationship(part, context)
 
-        errors.extend(context.errors)
-        return errors
+        return list(context.errors)
+
+    def _validate_streaming(
+        self, part: "SlidePart", context: "ValidationContext"
+    ) -> bool:
+        """Validate a slide while streaming it, dropping shapes once checked.
+
+        Shape errors are collected in a spawned context and merged after the
+        slide-level checks, so the output matches the in-memory path.
+
+        Returns:
+            False if the part is missing or malformed; the caller then falls
+            back to the in-memory path, which reports the parse error.
+        """
+        stream = part.stream()
+        if stream is None:
+            return False
+
+        shape_context = context.spawn()
+        shape_context.set_part(part)
+        seen_ids: set[str] = set()
+        spTree: etree._Element | None = None
+
+        try:
+            with stream:
+                events = etree.iterparse(
+                    stream,
+                    events=("end",),
+                    tag=tuple(_SHAPE_CHECKS),
+                    **PART_PARSER_OPTIONS,
+                )
+                for _, shape in events:
+                    if spTree is None:
+                        root = shape.getroottree().getroot()
+                        cSld = root.find(_Q_CSLD)
+                        spTree = cSld.find(_Q_SPTREE) if cSld is not None else None
+                        if spTree is not None:
+                            shape_context.push_element(root)
+
+                    # Only direct children of the first cSld/spTree are shapes
+                    # to check; nested ones are released with their group.
+                    if spTree is None or shape.getparent() is not spTree:
+                        continue
+
+                    _SHAPE_CHECKS[shape.tag](shape, seen_ids, shape_context)
+                    spTree.remove(shape)
+                xml = events.root
+        except etree.XMLSyntaxError:
+            return False
+
+        with ElementContext(context, xml):
+            self._validate_root(xml, context)
+
+            spTree = self._validate_cSld(xml, context)
+            if spTree is not None:
+                self._validate_group_properties(spTree, context)
+                context.merge(shape_context)
+
+            self._validate_clr_map_ovr(xml, context)
+            self._validate_layout_relationship(part, context)
+
+        return True
 
     def _validate_root(self, xml: etree._Element, context: "ValidationContext") -> None:
         """Validate the root slide element."""
-        expected_tag = f"{{{PRESENTATIONML}}}sld"
-        if xml.tag != expected_tag:
+        if xml.tag != _Q_SLD:
             context.add_schema_error(
                 f"Root element should be 'sld', got '{xml.tag}'",
             )
 
-    def _validate_cSld(self, xml: etree._Element, context: "ValidationContext") -> None:
-        """Validate common slide data."""
-        cSld = xml.find("p:cSld", self._ns)
+    def _validate_cSld(
+        self, xml: etree._Element, context: "ValidationContext"
+    ) -> etree._Element | None:
+        """Validate common slide data and return its shape tree, if any."""
+        cSld = _first(_XP_CSLD(xml))
         if cSld is None:
             context.add_schema_error(
                 "Slide missing required cSld (common slide data) element",
             )
-            return
+            return None
 
         # Validate shape tree
-        spTree = cSld.find("p:spTree", self._ns)
+        spTree = _first(_XP_SPTREE(cSld))
         if spTree is None:
             context.add_schema_error(
                 "cSld missing required spTree (shape tree) element",
             )
-            return
+        return spTree
 
-        self._validate_shape_tree(spTree, context)
-
-    def _validate_shape_tree(
+    def _validate_group_properties(
         self, spTree: etree._Element, context: "ValidationContext"
     ) -> None:
-        """Validate the shape tree structure."""
+        """Validate the shape tree's own group properties."""
         # Validate group shape properties
-        nvGrpSpPr = spTree.find("p:nvGrpSpPr", self._ns)
+        nvGrpSpPr = _first(_XP_NVGRPSPPR(spTree))
         if nvGrpSpPr is None:
             context.add_schema_error(
                 "spTree missing required nvGrpSpPr element",
@@ -104,28 +285,17 @@ class SlideValidator:
         else:
             self._validate_nv_grp_sp_pr(nvGrpSpPr, context)
 
-        grpSpPr = spTree.find("p:grpSpPr", self._ns)
+        grpSpPr = _first(_XP_GRPSPPR(spTree))
         if grpSpPr is None:
             context.add_schema_error(
                 "spTree missing required grpSpPr element",
             )
 
-        # Validate shapes
-        seen_ids: set[str] = set()
-
-        for child in spTree:
-            tag = child.tag
-            if isinstance(tag, str):
-                local_name = tag.split("}")[-1] if "}" in tag else tag
-
-                if local_name in ("sp", "grpSp", "graphicFrame", "cxnSp", "pic"):
-                    self._validate_shape(child, local_name, seen_ids, context)
-
     def _validate_nv_grp_sp_pr(
         self, nvGrpSpPr: etree._Element, context: "ValidationContext"
     ) -> None:
         """Validate non-visual group shape properties."""
-        cNvPr = nvGrpSpPr.find("p:cNvPr", self._ns)
+        cNvPr = _first(_XP_CNVPR(nvGrpSpPr))
         if cNvPr is None:
             context.add_schema_error(
                 "nvGrpSpPr missing required cNvPr element",
@@ -143,104 +313,29 @@ class SlideValidator:
                     node="name",
                 )
 
-        cNvGrpSpPr = nvGrpSpPr.find("p:cNvGrpSpPr", self._ns)
+        cNvGrpSpPr = _first(_XP_CNVGRPSPPR(nvGrpSpPr))
         if cNvGrpSpPr is None:
             context.add_schema_error(
                 "nvGrpSpPr missing required cNvGrpSpPr element",
             )
 
-        nvPr = nvGrpSpPr.find("p:nvPr", self._ns)
+        nvPr = _first(_XP_NVPR(nvGrpSpPr))
         if nvPr is None:
             context.add_schema_error(
                 "nvGrpSpPr missing required nvPr element",
             )
 
-    def _validate_shape(
-        self,
-        shape: etree._Element,
-        shape_type: str,
-        seen_ids: set[str],
-        context: "ValidationContext",
-    ) -> None:
-        """Validate a shape element."""
-        # Find non-visual properties based on shape type
-        nv_prop_map = {
-            "sp": "nvSpPr",
-            "grpSp": "nvGrpSpPr",
-            "graphicFrame": "nvGraphicFramePr",
-            "cxnSp": "nvCxnSpPr",
-            "pic": "nvPicPr",
-        }
-
-        nv_prop_name = nv_prop_map.get(shape_type)
-        if nv_prop_name:
-            nv_prop = shape.find(f"p:{nv_prop_name}", self._ns)
-            if nv_prop is not None:
-                cNvPr = nv_prop.find("p:cNvPr", self._ns)
-                if cNvPr is not None:
-                    shape_id = cNvPr.get("id")
-                    if shape_id:
-                        if shape_id in seen_ids:
-                            context.add_semantic_error(
-                                f"Duplicate shape ID: {shape_id}",
-                                node="id",
-                            )
-                        seen_ids.add(shape_id)
-
-        # Validate shape properties exist
-        sp_prop_map = {
-            "sp": "spPr",
-            "grpSp": "grpSpPr",
-            "graphicFrame": "xfrm",
-            "cxnSp": "spPr",
-            "pic": "spPr",
-        }
-
-        sp_prop_name = sp_prop_map.get(shape_type)
-        if sp_prop_name and shape_type != "graphicFrame":
-            sp_prop = shape.find(f"p:{sp_prop_name}", self._ns)
-            if sp_prop is None:
-                context.add_schema_error(
-                    f"{shape_type} missing required {sp_prop_name} element",
-                )
-
-        # Validate text body for shapes that can have text
-        if shape_type == "sp":
-            self._validate_text_body(shape, context)
-
-    def _validate_text_body(
-        self, shape: etree._Element, context: "ValidationContext"
-    ) -> None:
-        """Validate shape text body."""
-        txBody = shape.find("p:txBody", self._ns)
-        if txBody is None:
-            return  # Text body is optional
-
-        # Check body properties
-        bodyPr = txBody.find("a:bodyPr", self._ns)
-        if bodyPr is None:
-            context.add_schema_error(
-                "txBody missing required bodyPr element",
-            )
-
-        # Check for at least one paragraph
-        paragraphs = txBody.findall("a:p", self._ns)
-        if not paragraphs:
-            context.add_schema_error(
-                "txBody must have at least one paragraph (a:p)",
-            )
-
     def _validate_clr_map_ovr(
         self, xml: etree._Element, context: "ValidationContext"
     ) -> None:
         """Validate color map override."""
-        clrMapOvr = xml.find("p:clrMapOvr", self._ns)
+        clrMapOvr = _first(_XP_CLRMAPOVR(xml))
         if clrMapOvr is None:
             return  # Optional
 
         # Should have either masterClrMapping or overrideClrMapping
-        has_master = clrMapOvr.find("a:masterClrMapping", self._ns) is not None
-        has_override = clrMapOvr.find("a:overrideClrMapping", self._ns) is not None
+        has_master = bool(_XP_MASTERCLRMAP(clrMapOvr))
+        has_override = bool(_XP_OVERRIDECLRMAP(clrMapOvr))
 
         if not has_master and not has_override:
             context.add_schema_error(
@@ -251,16 +346,14 @@ class SlideValidator:
         self, part: "SlidePart", context: "ValidationContext"
     ) -> None:
         """Validate slide has a layout relationship."""
-        layout_type = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
-
-        layout_rels = list(part.relationships.get_by_type(layout_type))
-        if not layout_rels:
+        layout_count = part.relationships.count_by_type(REL_SLIDE_LAYOUT)
+        if not layout_count:
             context.add_semantic_error(
                 "Slide must have a slideLayout relationship",
             )
-        elif len(layout_rels) > 1:
+        elif layout_count > 1:
             context.add_semantic_error(
-                f"Slide has {len(layout_rels)} slideLayout relationships, expected 1",
+                f"Slide has {layout_count} slideLayout relationships, expected 1",
             )
 
 
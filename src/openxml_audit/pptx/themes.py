@@ -6,7 +6,7 @@ and format schemes.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from lxml import etree
 
@@ -18,13 +18,80 @@ if TYPE_CHECKING:
     from openxml_audit.context import ValidationContext
     from openxml_audit.parts import ThemePart
 
+_NS = {"a": DRAWINGML}
+_A = f"{{{DRAWINGML}}}"
+_Q_THEME = f"{_A}theme"
+_XP_THEMEELEMENTS = etree.XPath("a:themeElements[1]", namespaces=_NS)
+_XP_CLRSCHEME = etree.XPath("a:clrScheme[1]", namespaces=_NS)
+_XP_FONTSCHEME = etree.XPath("a:fontScheme[1]", namespaces=_NS)
+_XP_FMTSCHEME = etree.XPath("a:fmtScheme[1]", namespaces=_NS)
+_XP_MAJORFONT = etree.XPath("a:majorFont[1]", namespaces=_NS)
+_XP_MINORFONT = etree.XPath("a:minorFont[1]", namespaces=_NS)
+_XP_LATIN = etree.XPath("a:latin[1]", namespaces=_NS)
+_XP_EA = etree.XPath("a:ea[1]", namespaces=_NS)
+_XP_CS = etree.XPath("a:cs[1]", namespaces=_NS)
+
+# Required children of themeElements
+_THEME_ELEMENT_NAMES = ("clrScheme", "fontScheme", "fmtScheme")
+
+# Required color elements
+_REQUIRED_COLORS = (
+    "dk1",   # Dark 1
+    "lt1",   # Light 1
+    "dk2",   # Dark 2
+    "lt2",   # Light 2
+    "accent1",
+    "accent2",
+    "accent3",
+    "accent4",
+    "accent5",
+    "accent6",
+    "hlink",  # Hyperlink
+    "folHlink",  # Followed hyperlink
+)
+
+# Color can be defined by various elements
+_COLOR_TYPE_TAGS = frozenset(
+    f"{_A}{color_type}"
+    for color_type in (
+        "srgbClr",  # RGB color
+        "schemeClr",  # Scheme color reference
+        "sysClr",  # System color
+        "prstClr",  # Preset color
+        "hslClr",  # HSL color
+        "scrgbClr",  # RGB percentage color
+    )
+)
+
+# Required format lists and their minimum style counts
+_REQUIRED_STYLE_LISTS = (
+    ("fillStyleLst", 3),   # Fill styles - minimum 3
+    ("lnStyleLst", 3),     # Line styles - minimum 3
+    ("effectStyleLst", 3), # Effect styles - minimum 3
+    ("bgFillStyleLst", 3), # Background fill styles - minimum 3
+)
+
+
+def _child_xpaths(names: tuple[str, ...]) -> dict[str, etree.XPath]:
+    """Compile a first-child lookup for each DrawingML local name."""
+    return {name: etree.XPath(f"a:{name}[1]", namespaces=_NS) for name in names}
+
+
+_XP_THEME_ELEMENTS = _child_xpaths(_THEME_ELEMENT_NAMES)
+_REQUIRED_COLOR_TAGS = tuple((name, _A + name) for name in _REQUIRED_COLORS)
+_XP_STYLE_LISTS = _child_xpaths(tuple(name for name, _ in _REQUIRED_STYLE_LISTS))
+
+
+def _first(matches: object) -> etree._Element | None:
+    """Return the first XPath match, or None."""
+    # The compiled paths select elements only
+    elements = cast("list[etree._Element]", matches)
+    return elements[0] if elements else None
+
 
 class ThemeValidator:
     """Validates PPTX theme structure."""
 
-    def __init__(self) -> None:
-        self._ns = {"a": DRAWINGML}
-
     def validate(
         self, part: "ThemePart", context: "ValidationContext"
     ) -> list[ValidationError]:
@@ -38,35 +105,38 @@ class ThemeValidator:
             List of validation errors.
         """
         context.set_part(part)
-        errors: list[ValidationError] = []
 
         xml = part.xml
         if xml is None:
-            return errors
+            return []
 
         with ElementContext(context, xml):
             # Validate root element
             self._validate_root(xml, context)
 
             # Validate theme elements
-            self._validate_theme_elements(xml, context)
+            themeElements = _first(_XP_THEMEELEMENTS(xml))
+            if themeElements is None:
+                context.add_schema_error(
+                    "Theme missing required themeElements element",
+                )
+            else:
+                self._validate_theme_elements(themeElements, context)
 
-            # Validate color scheme
-            self._validate_clr_scheme(xml, context)
+                # Validate color scheme
+                self._validate_clr_scheme(themeElements, context)
 
-            # Validate font scheme
-            self._validate_font_scheme(xml, context)
+                # Validate font scheme
+                self._validate_font_scheme(themeElements, context)
 
-            # Validate format scheme
-            self._validate_fmt_scheme(xml, context)
+                # Validate format scheme
+                self._validate_fmt_scheme(themeElements, context)
 
-        errors.extend(context.errors)
-        return errors
+        return list(context.errors)
 
     def _validate_root(self, xml: etree._Element, context: "ValidationContext") -> None:
         """Validate the root theme element."""
-        expected_tag = f"{{{DRAWINGML}}}theme"
-        if xml.tag != expected_tag:
+        if xml.tag != _Q_THEME:
             context.add_schema_error(
                 f"Root element should be 'theme', got '{xml.tag}'",
             )
@@ -80,33 +150,21 @@ class ThemeValidator:
             )
 
     def _validate_theme_elements(
-        self, xml: etree._Element, context: "ValidationContext"
+        self, themeElements: etree._Element, context: "ValidationContext"
     ) -> None:
         """Validate theme elements structure."""
-        themeElements = xml.find("a:themeElements", self._ns)
-        if themeElements is None:
-            context.add_schema_error(
-                "Theme missing required themeElements element",
-            )
-            return
-
         # Check required children of themeElements
-        required = ["clrScheme", "fontScheme", "fmtScheme"]
-        for elem_name in required:
-            if themeElements.find(f"a:{elem_name}", self._ns) is None:
-                context.add_schema_error(
-                    f"themeElements missing required {elem_name} element",
-                )
+        context.add_schema_errors(
+            (f"themeElements missing required {elem_name} element", None)
+            for elem_name in _THEME_ELEMENT_NAMES
+            if not _XP_THEME_ELEMENTS[elem_name](themeElements)
+        )
 
     def _validate_clr_scheme(
-        self, xml: etree._Element, context: "ValidationContext"
+        self, themeElements: etree._Element, context: "ValidationContext"
     ) -> None:
         """Validate color scheme."""
-        themeElements = xml.find("a:themeElements", self._ns)
-        if themeElements is None:
-            return
-
-        clrScheme = themeElements.find("a:clrScheme", self._ns)
+        clrScheme = _first(_XP_CLRSCHEME(themeElements))
         if clrScheme is None:
             return  # Already reported
 
@@ -118,69 +176,34 @@ class ThemeValidator:
                 node="name",
             )
 
-        # Required color elements
-        required_colors = [
-            "dk1",   # Dark 1
-            "lt1",   # Light 1
-            "dk2",   # Dark 2
-            "lt2",   # Light 2
-            "accent1",
-            "accent2",
-            "accent3",
-            "accent4",
-            "accent5",
-            "accent6",
-            "hlink",  # Hyperlink
-            "folHlink",  # Followed hyperlink
-        ]
-
-        for color_name in required_colors:
-            color_elem = clrScheme.find(f"a:{color_name}", self._ns)
+        # Index the scheme's colors in one pass, keeping the first of each
+        colors: dict[str, etree._Element] = {}
+        for child in clrScheme.iterchildren("*"):
+            colors.setdefault(child.tag, child)
+
+        # All color errors share the clrScheme path, so flush them as one batch
+        errs: list[tuple[str, str | None]] = []
+        for color_name, color_tag in _REQUIRED_COLOR_TAGS:
+            color_elem = colors.get(color_tag)
             if color_elem is None:
-                context.add_schema_error(
-                    f"clrScheme missing required {color_name} color",
-                )
-            else:
+                errs.append((f"clrScheme missing required {color_name} color", None))
+            elif not self._has_color_definition(color_elem):
                 # Each color must have a color definition child
-                self._validate_color_element(color_elem, color_name, context)
+                errs.append(
+                    (f"{color_name} element must contain a color definition", None)
+                )
+        if errs:
+            context.add_schema_errors(errs)
 
-    def _validate_color_element(
-        self,
-        color_elem: etree._Element,
-        color_name: str,
-        context: "ValidationContext",
-    ) -> None:
-        """Validate a color element has a proper color definition."""
-        # Color can be defined by various elements
-        valid_color_types = [
-            "srgbClr",  # RGB color
-            "schemeClr",  # Scheme color reference
-            "sysClr",  # System color
-            "prstClr",  # Preset color
-            "hslClr",  # HSL color
-            "scrgbClr",  # RGB percentage color
-        ]
-
-        has_color = False
-        for color_type in valid_color_types:
-            if color_elem.find(f"a:{color_type}", self._ns) is not None:
-                has_color = True
-                break
-
-        if not has_color:
-            context.add_schema_error(
-                f"{color_name} element must contain a color definition",
-            )
+    def _has_color_definition(self, color_elem: etree._Element) -> bool:
+        """Check a color element has a proper color definition."""
+        return any(child.tag in _COLOR_TYPE_TAGS for child in color_elem)
 
     def _validate_font_scheme(
-        self, xml: etree._Element, context: "ValidationContext"
+        self, themeElements: etree._Element, context: "ValidationContext"
     ) -> None:
         """Validate font scheme."""
-        themeElements = xml.find("a:themeElements", self._ns)
-        if themeElements is None:
-            return
-
-        fontScheme = themeElements.find("a:fontScheme", self._ns)
+        fontScheme = _first(_XP_FONTSCHEME(themeElements))
         if fontScheme is None:
             return  # Already reported
 
@@ -193,7 +216,7 @@ class ThemeValidator:
             )
 
         # Required font collections
-        majorFont = fontScheme.find("a:majorFont", self._ns)
+        majorFont = _first(_XP_MAJORFONT(fontScheme))
         if majorFont is None:
             context.add_schema_error(
                 "fontScheme missing required majorFont element",
@@ -201,7 +224,7 @@ class ThemeValidator:
         else:
             self._validate_font_collection(majorFont, "majorFont", context)
 
-        minorFont = fontScheme.find("a:minorFont", self._ns)
+        minorFont = _first(_XP_MINORFONT(fontScheme))
         if minorFont is None:
             context.add_schema_error(
                 "fontScheme missing required minorFont element",
@@ -217,7 +240,7 @@ class ThemeValidator:
     ) -> None:
         """Validate a font collection (majorFont or minorFont)."""
         # Must have latin font
-        latin = font_coll.find("a:latin", self._ns)
+        latin = _first(_XP_LATIN(font_coll))
         if latin is None:
             context.add_schema_error(
                 f"{name} missing required latin font",
@@ -231,28 +254,22 @@ class ThemeValidator:
                 )
 
         # Must have east asian font
-        ea = font_coll.find("a:ea", self._ns)
-        if ea is None:
+        if not _XP_EA(font_coll):
             context.add_schema_error(
                 f"{name} missing required ea (East Asian) font",
             )
 
         # Must have complex script font
-        cs = font_coll.find("a:cs", self._ns)
-        if cs is None:
+        if not _XP_CS(font_coll):
             context.add_schema_error(
                 f"{name} missing required cs (Complex Script) font",
             )
 
     def _validate_fmt_scheme(
-        self, xml: etree._Element, context: "ValidationContext"
+        self, themeElements: etree._Element, context: "ValidationContext"
     ) -> None:
         """Validate format scheme."""
-        themeElements = xml.find("a:themeElements", self._ns)
-        if themeElements is None:
-            return
-
-        fmtScheme = themeElements.find("a:fmtScheme", self._ns)
+        fmtScheme = _first(_XP_FMTSCHEME(themeElements))
         if fmtScheme is None:
             return  # Already reported
 
@@ -264,26 +281,18 @@ class ThemeValidator:
                 node="name",
             )
 
-        # Required format lists
-        required_lists = [
-            ("fillStyleLst", 3),   # Fill styles - minimum 3
-            ("lnStyleLst", 3),     # Line styles - minimum 3
-            ("effectStyleLst", 3), # Effect styles - minimum 3
-            ("bgFillStyleLst", 3), # Background fill styles - minimum 3
-        ]
-
-        for list_name, min_count in required_lists:
-            style_list = fmtScheme.find(f"a:{list_name}", self._ns)
+        for list_name, min_count in _REQUIRED_STYLE_LISTS:
+            style_list = _first(_XP_STYLE_LISTS[list_name](fmtScheme))
             if style_list is None:
                 context.add_schema_error(
                     f"fmtScheme missing required {list_name} element",
                 )
             else:
                 # Count children (each represents a style)
-                children = [c for c in style_list if isinstance(c.tag, str)]
-                if len(children) < min_count:
+                style_count = sum(1 for _ in style_list.iterchildren("*"))
+                if style_count < min_count:
                     context.add_schema_error(
-                        f"{list_name} must have at least {min_count} styles, found {len(children)}",
+                        f"{list_name} must have at least {min_count} styles, found {style_count}",
                     )
 
 
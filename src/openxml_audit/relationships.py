@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from pathlib import PurePosixPath
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from lxml import etree
@@ -13,8 +14,36 @@ from openxml_audit.namespaces import RELATIONSHIPS
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+# .rels files carry no DTDs, entities or significant whitespace.
+_RELS_PARSER = etree.XMLParser(
+    collect_ids=False,
+    resolve_entities=False,
+    no_network=True,
+    huge_tree=False,
+    remove_blank_text=True,
+)
+_Q_RELATIONSHIP = f"{{{RELATIONSHIPS}}}Relationship"
 
-@dataclass
+
+@lru_cache(maxsize=4096)
+def _resolve_relative(source_uri: str, target: str) -> str:
+    """Resolve a relative target against the directory of ``source_uri``."""
+    # Directory of the source part, ignoring empty and "." segments
+    source_dir = [s for s in source_uri.split("/") if s and s != "."][:-1]
+
+    # Normalize (resolve .. and ., drop empty segments)
+    segments: list[str] = []
+    for segment in (*source_dir, *target.split("/")):
+        if segment == "..":
+            if segments:
+                segments.pop()
+        elif segment and segment != ".":
+            segments.append(segment)
+
+    return "/" + "/".join(segments)
+
+
+@dataclass(slots=True, frozen=True)
 class Relationship:
     """An OPC relationship between parts."""
 
@@ -45,22 +74,7 @@ class Relationship:
             # Already absolute
             return self.target
 
-        # Get the directory of the source part
-        source_path = PurePosixPath(source_uri)
-        source_dir = source_path.parent
-
-        # Resolve relative path
-        target_path = source_dir / self.target
-        # Normalize (resolve .. and .)
-        parts = []
-        for part in target_path.parts:
-            if part == "..":
-                if parts and parts[-1] != "/":
-                    parts.pop()
-            elif part != ".":
-                parts.append(part)
-
-        return "/" + "/".join(p for p in parts if p != "/")
+        return _resolve_relative(source_uri, self.target)
 
 
 class RelationshipCollection:
@@ -68,11 +82,21 @@ class RelationshipCollection:
 
     def __init__(self, source_uri: str = "/"):
         self._relationships: dict[str, Relationship] = {}
+        self._by_type: dict[str, list[Relationship]] = {}
         self._source_uri = source_uri
 
     def add(self, rel: Relationship) -> None:
         """Add a relationship to the collection."""
+        replacing = rel.id in self._relationships
         self._relationships[rel.id] = rel
+        if replacing:
+            # A repeated Id keeps its original position; rebuild the type
+            # index so it stays in collection order.
+            self._by_type = {}
+            for existing in self._relationships.values():
+                self._by_type.setdefault(existing.type, []).append(existing)
+        else:
+            self._by_type.setdefault(rel.type, []).append(rel)
 
     def get_by_id(self, rel_id: str) -> Relationship | None:
         """Get a relationship by its ID."""
@@ -80,13 +104,16 @@ class RelationshipCollection:
 
     def get_by_type(self, rel_type: str) -> Iterator[Relationship]:
         """Get all relationships of a specific type."""
-        for rel in self._relationships.values():
-            if rel.type == rel_type:
-                yield rel
+        return iter(self._by_type.get(rel_type, ()))
 
     def get_first_by_type(self, rel_type: str) -> Relationship | None:
         """Get the first relationship of a specific type."""
-        return next(self.get_by_type(rel_type), None)
+        rels = self._by_type.get(rel_type)
+        return rels[0] if rels else None
+
+    def count_by_type(self, rel_type: str) -> int:
+        """Count the relationships of a specific type."""
+        return len(self._by_type.get(rel_type, ()))
 
     def resolve_target(self, rel_id: str) -> str | None:
         """Resolve the target path for a relationship ID."""
@@ -118,25 +145,26 @@ class RelationshipCollection:
         collection = cls(source_uri)
 
         try:
-            root = etree.fromstring(xml_content)
+            root = etree.fromstring(xml_content, _RELS_PARSER)
         except etree.XMLSyntaxError:
             return collection
 
-        # Handle namespace
-        ns = {"r": RELATIONSHIPS}
-
-        for rel_elem in root.findall("r:Relationship", ns):
-            rel_id = rel_elem.get("Id", "")
-            rel_type = rel_elem.get("Type", "")
-            target = rel_elem.get("Target", "")
-            target_mode = rel_elem.get("TargetMode", "Internal")
+        for rel_elem in root.iterchildren(_Q_RELATIONSHIP):
+            attrib = rel_elem.attrib
+            rel_id = attrib.get("Id", "")
+            rel_type = attrib.get("Type", "")
+            target = attrib.get("Target", "")
+            target_mode = attrib.get("TargetMode", "Internal")
 
             if rel_id and rel_type:
                 rel = Relationship(
                     id=rel_id,
-                    type=rel_type,
+                    # Type and mode repeat across every .rels file; interning
+                    # shares one copy and lets comparisons with the REL_*
+                    # constants and "External" hit the identity fast path.
+                    type=sys.intern(rel_type),
                     target=target,
-                    target_mode=target_mode,
+                    target_mode=sys.intern(target_mode),
                 )
                 collection.add(rel)
 
@@ -157,8 +185,7 @@ def get_rels_path(part_uri: str) -> str:
     if part_uri == "/":
         return "/_rels/.rels"
 
-    path = PurePosixPath(part_uri)
-    rels_dir = path.parent / "_rels"
-    rels_name = path.name + ".rels"
-
-    return str(rels_dir / rels_name)
+    idx = part_uri.rfind("/")
+    if idx < 0:
+        return f"_rels/{part_uri}.rels"
+    return f"{part_uri[:idx]}/_rels/{part_uri[idx + 1:]}.rels"
@@ -5,24 +5,32 @@ Defines the structure requirements for PPTX elements based on ECMA-376.
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
+from functools import partial
 from typing import TYPE_CHECKING
 
 from openxml_audit.namespaces import DRAWINGML, PRESENTATIONML
 from openxml_audit.schema.particle import (
     AnyParticle,
     ChoiceParticle,
+    CompositeParticle,
     ElementParticle,
     ParticleConstraint,
     SequenceParticle,
+    get_validator,
 )
 from openxml_audit.schema.types import XsdBuiltinType, XsdTypeValidator, get_type_validator
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Callable, Iterable
 
+    from lxml import etree
 
-@dataclass
+    from openxml_audit.context import ValidationContext
+
+
+@dataclass(slots=True, frozen=True)
 class AttributeConstraint:
     """Constraint for an XML attribute."""
 
@@ -32,40 +40,92 @@ class AttributeConstraint:
     required: bool = False
     default_value: str | None = None
     fixed_value: str | None = None
+    qualified_name: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def qualified_name(self) -> str:
-        """Get the Clark notation qualified name."""
+    def __post_init__(self) -> None:
         if self.namespace:
-            return f"{{{self.namespace}}}{self.local_name}"
-        return self.local_name
+            qualified_name = sys.intern(f"{{{self.namespace}}}{self.local_name}")
+        else:
+            qualified_name = sys.intern(self.local_name)
+        object.__setattr__(self, "qualified_name", qualified_name)
+
+
+# Structurally identical attribute constraints share one instance
+_ATTRIBUTE_POOL: dict[AttributeConstraint, AttributeConstraint] = {}
 
 
-@dataclass
+def intern_attribute(attr: AttributeConstraint) -> AttributeConstraint:
+    """Return the shared instance equal to an attribute constraint."""
+    return _ATTRIBUTE_POOL.setdefault(attr, attr)
+
+
+@dataclass(slots=True)
 class ElementConstraint:
     """Constraint for an XML element type."""
 
     namespace: str
     local_name: str
-    attributes: list[AttributeConstraint] = field(default_factory=list)
+    attributes: tuple[AttributeConstraint, ...] = ()
     content_model: ParticleConstraint | None = None
     allows_text: bool = False
-
-    @property
-    def qualified_name(self) -> str:
-        """Get the Clark notation qualified name."""
-        return f"{{{self.namespace}}}{self.local_name}"
+    _attr_index: dict[tuple[str | None, str], AttributeConstraint] = field(
+        init=False, repr=False, compare=False
+    )
+    _required_attrs: tuple[AttributeConstraint, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    _value_checked_attrs: tuple[AttributeConstraint, ...] = field(
+        init=False, repr=False, compare=False
+    )
+    # Particle validator bound to content_model, resolved once
+    _content_validator: Callable[
+        [Iterable[etree._Element], ValidationContext], bool
+    ] | None = field(init=False, repr=False, compare=False)
+    qualified_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.qualified_name = sys.intern(f"{{{self.namespace}}}{self.local_name}")
+        self.rebuild_index()
+        self._content_validator = None
+        if isinstance(self.content_model, CompositeParticle):
+            validator = get_validator(self.content_model.particle_type)
+            if validator is not None:
+                self._content_validator = partial(validator.validate, self.content_model)
+
+    def rebuild_index(self) -> None:
+        """Rebuild the attribute lookups after replacing ``attributes``."""
+        self.attributes = tuple(intern_attribute(attr) for attr in self.attributes)
+        index: dict[tuple[str | None, str], AttributeConstraint] = {}
+        for attr in self.attributes:
+            # Keep the first declaration, as the linear scan did
+            index.setdefault((attr.namespace, attr.local_name), attr)
+        self._attr_index = index
+        self._required_attrs = tuple(attr for attr in self.attributes if attr.required)
+        self._value_checked_attrs = tuple(
+            attr
+            for attr in self.attributes
+            if attr.fixed_value is not None or attr.type_validator is not None
+        )
 
     def get_attribute(self, name: str, namespace: str | None = None) -> AttributeConstraint | None:
         """Get an attribute constraint by name."""
-        for attr in self.attributes:
-            if attr.local_name == name and attr.namespace == namespace:
-                return attr
-        return None
+        return self._attr_index.get((namespace, name))
 
-    def get_required_attributes(self) -> list[AttributeConstraint]:
+    def get_required_attributes(self) -> tuple[AttributeConstraint, ...]:
         """Get all required attributes."""
-        return [attr for attr in self.attributes if attr.required]
+        return self._required_attrs
+
+    def get_value_checked_attributes(self) -> tuple[AttributeConstraint, ...]:
+        """Get attributes with a fixed value or type to check."""
+        return self._value_checked_attrs
+
+    def validate_content(
+        self, children: Iterable[etree._Element], context: ValidationContext
+    ) -> bool:
+        """Validate child elements against the content model."""
+        if self._content_validator is None:
+            return True
+        return self._content_validator(children, context)
 
 
 class ElementConstraintRegistry:
@@ -73,10 +133,24 @@ class ElementConstraintRegistry:
 
     def __init__(self) -> None:
         self._constraints: dict[str, ElementConstraint] = {}
+        self._by_ns_name: dict[tuple[str, str], ElementConstraint] = {}
+        self._frozen = False
 
     def register(self, constraint: ElementConstraint) -> None:
         """Register an element constraint."""
+        if self._frozen:
+            raise TypeError("Cannot register constraints on a frozen registry")
         self._constraints[constraint.qualified_name] = constraint
+        self._by_ns_name[(constraint.namespace, constraint.local_name)] = constraint
+
+    def freeze(self) -> None:
+        """Make the registry read-only."""
+        self._frozen = True
+
+    @property
+    def frozen(self) -> bool:
+        """Check whether the registry has been frozen."""
+        return self._frozen
 
     def get(self, qualified_name: str) -> ElementConstraint | None:
         """Get constraint for an element."""
@@ -84,7 +158,7 @@ class ElementConstraintRegistry:
 
     def get_by_name(self, namespace: str, local_name: str) -> ElementConstraint | None:
         """Get constraint by namespace and local name."""
-        return self.get(f"{{{namespace}}}{local_name}")
+        return self._by_ns_name.get((namespace, local_name))
 
 
 def _create_pptx_constraints() -> ElementConstraintRegistry:
@@ -95,24 +169,31 @@ def _create_pptx_constraints() -> ElementConstraintRegistry:
     """
     registry = ElementConstraintRegistry()
 
+    # Shared type validators, resolved once for the whole registry
+    v_bool = get_type_validator(XsdBuiltinType.BOOLEAN)
+    v_str = get_type_validator(XsdBuiltinType.STRING)
+    v_uint = get_type_validator(XsdBuiltinType.UNSIGNED_INT)
+    v_long = get_type_validator(XsdBuiltinType.LONG)
+    v_nni = get_type_validator(XsdBuiltinType.NON_NEGATIVE_INTEGER)
+
     # p:presentation - root element of presentation.xml
     presentation = ElementConstraint(
         namespace=PRESENTATIONML,
         local_name="presentation",
-        attributes=[
+        attributes=(
             AttributeConstraint(
                 namespace=None,
                 local_name="saveSubsetFonts",
-                type_validator=get_type_validator(XsdBuiltinType.BOOLEAN),
+                type_validator=v_bool,
                 required=False,
             ),
             AttributeConstraint(
                 namespace=None,
                 local_name="autoCompressPictures",
-                type_validator=get_type_validator(XsdBuiltinType.BOOLEAN),
+                type_validator=v_bool,
                 required=False,
             ),
-        ],
+        ),
         content_model=SequenceParticle(children=[
             ElementParticle(PRESENTATIONML, "sldMasterIdLst", min_occurs=0),
             ElementParticle(PRESENTATIONML, "notesMasterIdLst", min_occurs=0),
@@ -129,26 +210,26 @@ def _create_pptx_constraints() -> ElementConstraintRegistry:
     slide = ElementConstraint(
         namespace=PRESENTATIONML,
         local_name="sld",
-        attributes=[
+        attributes=(
             AttributeConstraint(
                 namespace=None,
                 local_name="showMasterSp",
-                type_validator=get_type_validator(XsdBuiltinType.BOOLEAN),
+                type_validator=v_bool,
                 required=False,
             ),
             AttributeConstraint(
                 namespace=None,
                 local_name="showMasterPhAnim",
-                type_validator=get_type_validator(XsdBuiltinType.BOOLEAN),
+                type_validator=v_bool,
                 required=False,
             ),
             AttributeConstraint(
                 namespace=None,
                 local_name="show",
-                type_validator=get_type_validator(XsdBuiltinType.BOOLEAN),
+                type_validator=v_bool,
                 required=False,
             ),
-        ],
+        ),
         content_model=SequenceParticle(children=[
             ElementParticle(PRESENTATIONML, "cSld", min_occurs=1),
             ElementParticle(PRESENTATIONML, "clrMapOvr", min_occurs=0),
@@ -163,14 +244,14 @@ def _create_pptx_constraints() -> ElementConstraintRegistry:
     cSld = ElementConstraint(
         namespace=PRESENTATIONML,
         local_name="cSld",
-        attributes=[
+        attributes=(
             AttributeConstraint(
                 namespace=None,
                 local_name="name",
-                type_validator=get_type_validator(XsdBuiltinType.STRING),
+                type_validator=v_str,
                 required=False,
             ),
-        ],
+        ),
         content_model=SequenceParticle(children=[
             ElementParticle(PRESENTATIONML, "bg", min_occurs=0),
             ElementParticle(PRESENTATIONML, "spTree", min_occurs=1),
@@ -206,14 +287,14 @@ def _create_pptx_constraints() -> ElementConstraintRegistry:
     sp = ElementConstraint(
         namespace=PRESENTATIONML,
         local_name="sp",
-        attributes=[
+        attributes=(
             AttributeConstraint(
                 namespace=None,
                 local_name="useBgFill",
-                type_validator=get_type_validator(XsdBuiltinType.BOOLEAN),
+                type_validator=v_bool,
                 required=False,
             ),
-        ],
+        ),
         content_model=SequenceParticle(children=[
             ElementParticle(PRESENTATIONML, "nvSpPr", min_occurs=1),
             ElementParticle(PRESENTATIONML, "spPr", min_occurs=1),
@@ -240,32 +321,32 @@ def _create_pptx_constraints() -> ElementConstraintRegistry:
     cNvPr = ElementConstraint(
         namespace=PRESENTATIONML,
         local_name="cNvPr",
-        attributes=[
+        attributes=(
             AttributeConstraint(
                 namespace=None,
                 local_name="id",
-                type_validator=get_type_validator(XsdBuiltinType.UNSIGNED_INT),
+                type_validator=v_uint,
                 required=True,
             ),
             AttributeConstraint(
                 namespace=None,
                 local_name="name",
-                type_validator=get_type_validator(XsdBuiltinType.STRING),
+                type_validator=v_str,
                 required=True,
             ),
             AttributeConstraint(
                 namespace=None,
                 local_name="descr",
-                type_validator=get_type_validator(XsdBuiltinType.STRING),
+                type_validator=v_str,
                 required=False,
             ),
             AttributeConstraint(
                 namespace=None,
                 local_name="hidden",
-                type_validator=get_type_validator(XsdBuiltinType.BOOLEAN),
+                type_validator=v_bool,
                 required=False,
             ),
-        ],
+        ),
     )
     registry.register(cNvPr)
 
@@ -273,20 +354,20 @@ def _create_pptx_constraints() -> ElementConstraintRegistry:
     off = ElementConstraint(
         namespace=DRAWINGML,
         local_name="off",
-        attributes=[
+        attributes=(
             AttributeConstraint(
                 namespace=None,
                 local_name="x",
-                type_validator=get_type_validator(XsdBuiltinType.LONG),
+                type_validator=v_long,
                 required=True,
             ),
             AttributeConstraint(
                 namespace=None,
                 local_name="y",
-                type_validator=get_type_validator(XsdBuiltinType.LONG),
+                type_validator=v_long,
                 required=True,
             ),
-        ],
+        ),
     )
     registry.register(off)
 
@@ -294,28 +375,29 @@ def _create_pptx_constraints() -> ElementConstraintRegistry:
     ext = ElementConstraint(
         namespace=DRAWINGML,
         local_name="ext",
-        attributes=[
+        attributes=(
             AttributeConstraint(
                 namespace=None,
                 local_name="cx",
-                type_validator=get_type_validator(XsdBuiltinType.NON_NEGATIVE_INTEGER),
+                type_validator=v_nni,
                 required=True,
             ),
             AttributeConstraint(
                 namespace=None,
                 local_name="cy",
-                type_validator=get_type_validator(XsdBuiltinType.NON_NEGATIVE_INTEGER),
+                type_validator=v_nni,
                 required=True,
             ),
-        ],
+        ),
     )
     registry.register(ext)
 
     return registry
 
 
-# Global registry instance
+# Global registry instance; built once and never extended afterwards
 PPTX_CONSTRAINTS = _create_pptx_constraints()
+PPTX_CONSTRAINTS.freeze()
 
 
 def get_element_constraint(namespace: str, local_name: str) -> ElementConstraint | None:
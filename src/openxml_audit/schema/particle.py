@@ -8,14 +8,23 @@ Particles define the structure of child elements:
 
 from __future__ import annotations
 
+import itertools
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import partial
+from itertools import compress, islice
+from operator import eq, not_
 from typing import TYPE_CHECKING
 
 from lxml import etree
 
+from openxml_audit.namespaces import get_local_name
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from openxml_audit.context import ValidationContext
 
 
@@ -30,7 +39,18 @@ class ParticleType(Enum):
     GROUP = "group"
 
 
-@dataclass
+def _clark_name(namespace: str | None, local_name: str) -> str:
+    """Build an interned Clark notation name."""
+    if namespace:
+        return sys.intern(f"{{{namespace}}}{local_name}")
+    return sys.intern(local_name)
+
+
+def _accept_any_tag(tag: str) -> bool:
+    return True
+
+
+@dataclass(slots=True)
 class ParticleConstraint:
     """Base constraint for particles."""
 
@@ -39,6 +59,24 @@ class ParticleConstraint:
     max_occurs: int = 1  # -1 means unbounded
     namespace: str | None = None
     local_name: str | None = None
+    # Interned Clark name, so tag comparisons can short-circuit on identity
+    qualified_name: str = field(default="", init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.local_name is not None:
+            self.qualified_name = _clark_name(self.namespace, self.local_name)
+
+    def matches_tag(self, tag: str) -> bool:
+        """Check if an element with this Clark tag matches the particle."""
+        return False
+
+    def tag_matcher(self) -> Callable[[str], bool]:
+        """Get the cheapest callable equivalent to ``matches_tag``.
+
+        Subclasses return C-level bound methods where possible so long runs
+        of children are matched without a Python frame per element.
+        """
+        return self.matches_tag
 
     @property
     def is_optional(self) -> bool:
@@ -49,10 +87,11 @@ class ParticleConstraint:
         return self.max_occurs == -1
 
 
-@dataclass
 class ElementParticle(ParticleConstraint):
     """Particle for a specific element."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         namespace: str,
@@ -68,31 +107,98 @@ class ElementParticle(ParticleConstraint):
             local_name=local_name,
         )
 
-    @property
-    def qualified_name(self) -> str:
-        """Get the Clark notation qualified name."""
-        if self.namespace:
-            return f"{{{self.namespace}}}{self.local_name}"
-        return self.local_name or ""
+    def matches_tag(self, tag: str) -> bool:
+        return tag == self.qualified_name
 
+    def tag_matcher(self) -> Callable[[str], bool]:
+        # str.__eq__ returns NotImplemented (truthy) for non-str tags such as
+        # comments; operator.eq always gives a bool and stays C-level.
+        return partial(eq, self.qualified_name)
 
-@dataclass
+
+@dataclass(slots=True)
 class CompositeParticle(ParticleConstraint):
     """Particle containing child particles (sequence, choice, all)."""
 
-    children: list[ParticleConstraint] = field(default_factory=list)
+    children: tuple[ParticleConstraint, ...] = ()
+    # Accepted tag -> top-level child particle, plus any-particles at any depth
+    _match_index: dict[str, ParticleConstraint] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _any_particles: list[AnyParticle] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _child_matchers: tuple[Callable[[str], bool], ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+    # The nested any-particles flattened into what they accept
+    _any_accepts_all: bool = field(default=False, init=False, repr=False, compare=False)
+    _any_local: bool = field(default=False, init=False, repr=False, compare=False)
+    _any_prefixes: tuple[str, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # slots=True recreates the class, which breaks zero-argument super()
+        ParticleConstraint.__post_init__(self)
+        self.rebuild_index()
 
     def add_child(self, child: ParticleConstraint) -> None:
-        self.children.append(child)
+        self.children = (*self.children, child)
+        self.rebuild_index()
+
+    def rebuild_index(self) -> None:
+        """Rebuild the tag dispatch table from ``children``.
+
+        Nested composites contribute their own indexes, so they must be
+        complete before the parent is built (as construction order ensures).
+        """
+        self.children = tuple(self.children)
+        index: dict[str, ParticleConstraint] = {}
+        any_particles: list[AnyParticle] = []
+        for child in self.children:
+            if isinstance(child, ElementParticle):
+                index.setdefault(child.qualified_name, child)
+            elif isinstance(child, AnyParticle):
+                any_particles.append(child)
+            elif isinstance(child, CompositeParticle):
+                for qname in child._match_index:
+                    index.setdefault(qname, child)
+                any_particles.extend(child._any_particles)
+        self._match_index = index
+        self._any_particles = any_particles
+        self._child_matchers = tuple(child.tag_matcher() for child in self.children)
+
+        constraints = {particle.namespace_constraint for particle in any_particles}
+        self._any_accepts_all = bool(constraints & {"##any", "##other"})
+        self._any_local = "##local" in constraints
+        constraints -= {"##any", "##other", "##local"}
+        self._any_prefixes = tuple(f"{{{uri}}}" for uri in sorted(constraints))
+
+    def matches_tag(self, tag: str) -> bool:
+        """Check if an element matches any particle within this composite."""
+        if self._any_accepts_all or tag in self._match_index:
+            return True
+        if self._any_local and not tag.startswith("{"):
+            return True
+        return tag.startswith(self._any_prefixes)
+
+    def tag_matcher(self) -> Callable[[str], bool]:
+        if self._any_accepts_all:
+            return _accept_any_tag
+        if self._any_particles:
+            return self.matches_tag
+        return self._match_index.__contains__
 
 
-@dataclass
 class SequenceParticle(CompositeParticle):
     """Sequence particle - children must appear in order."""
 
+    __slots__ = ()
+
     def __init__(
         self,
-        children: list[ParticleConstraint] | None = None,
+        children: Iterable[ParticleConstraint] | None = None,
         min_occurs: int = 1,
         max_occurs: int = 1,
     ):
@@ -100,18 +206,18 @@ class SequenceParticle(CompositeParticle):
             particle_type=ParticleType.SEQUENCE,
             min_occurs=min_occurs,
             max_occurs=max_occurs,
+            children=tuple(children) if children else (),
         )
-        if children:
-            self.children = children
 
 
-@dataclass
 class ChoiceParticle(CompositeParticle):
     """Choice particle - one of the children must appear."""
 
+    __slots__ = ("_expected_names",)
+
     def __init__(
         self,
-        children: list[ParticleConstraint] | None = None,
+        children: Iterable[ParticleConstraint] | None = None,
         min_occurs: int = 1,
         max_occurs: int = 1,
     ):
@@ -119,18 +225,27 @@ class ChoiceParticle(CompositeParticle):
             particle_type=ParticleType.CHOICE,
             min_occurs=min_occurs,
             max_occurs=max_occurs,
+            children=tuple(children) if children else (),
+        )
+
+    def rebuild_index(self) -> None:
+        CompositeParticle.rebuild_index(self)
+        # Joined once for the "not a valid choice" error message
+        self._expected_names = ", ".join(
+            child.local_name or ""
+            for child in self.children
+            if isinstance(child, ElementParticle)
         )
-        if children:
-            self.children = children
 
 
-@dataclass
 class AllParticle(CompositeParticle):
     """All particle - all children required but any order."""
 
+    __slots__ = ("_element_index", "_element_particles")
+
     def __init__(
         self,
-        children: list[ParticleConstraint] | None = None,
+        children: Iterable[ParticleConstraint] | None = None,
         min_occurs: int = 1,
         max_occurs: int = 1,
     ):
@@ -138,12 +253,22 @@ class AllParticle(CompositeParticle):
             particle_type=ParticleType.ALL,
             min_occurs=min_occurs,
             max_occurs=max_occurs,
+            children=tuple(children) if children else (),
+        )
+
+    def rebuild_index(self) -> None:
+        CompositeParticle.rebuild_index(self)
+        # Only direct element children take part in all-group matching
+        self._element_particles = tuple(
+            child for child in self.children if isinstance(child, ElementParticle)
         )
-        if children:
-            self.children = children
+        index: dict[str, ElementParticle] = {}
+        for particle in self._element_particles:
+            index.setdefault(particle.qualified_name, particle)
+        self._element_index = index
 
 
-@dataclass
+@dataclass(slots=True)
 class AnyParticle(ParticleConstraint):
     """Any particle - allows any element from namespace."""
 
@@ -155,13 +280,30 @@ class AnyParticle(ParticleConstraint):
         min_occurs: int = 0,
         max_occurs: int = -1,
     ):
-        super().__init__(
+        # slots=True recreates the class, which breaks zero-argument super()
+        ParticleConstraint.__init__(
+            self,
             particle_type=ParticleType.ANY,
             min_occurs=min_occurs,
             max_occurs=max_occurs,
         )
         self.namespace_constraint = namespace_constraint
 
+    def matches_tag(self, tag: str) -> bool:
+        """Check if an element with this tag matches the namespace constraint."""
+        ns_constraint = self.namespace_constraint
+
+        if ns_constraint == "##any":
+            return True
+        elif ns_constraint == "##local":
+            return not tag.startswith("{")
+        elif ns_constraint == "##other":
+            # Would need target namespace context
+            return True
+        else:
+            # Specific namespace URI
+            return tag.startswith(f"{{{ns_constraint}}}")
+
 
 class ParticleValidator(ABC):
     """Base class for particle validators."""
@@ -170,7 +312,7 @@ class ParticleValidator(ABC):
     def validate(
         self,
         constraint: ParticleConstraint,
-        children: list[etree._Element],
+        children: Iterable[etree._Element],
         context: ValidationContext,
     ) -> bool:
         """Validate children against the particle constraint.
@@ -186,89 +328,75 @@ class ParticleValidator(ABC):
         pass
 
 
+# Below this many remaining children, setting up the iterator pipeline costs
+# more than a plain loop
+_BATCH_MIN_CHILDREN = 64
+
+
 class SequenceParticleValidator(ParticleValidator):
     """Validates sequence particles."""
 
     def validate(
         self,
         constraint: ParticleConstraint,
-        children: list[etree._Element],
+        children: Iterable[etree._Element],
         context: ValidationContext,
     ) -> bool:
         if not isinstance(constraint, SequenceParticle):
             return False
 
+        # Matching only needs tags, so read each child's tag once
+        tags = [child.tag for child in children]
+        tag_count = len(tags)
         child_index = 0
         valid = True
 
-        for particle in constraint.children:
-            count = 0
-
-            # Count matching elements
-            while child_index < len(children):
-                child = children[child_index]
-
-                if self._matches(particle, child):
-                    count += 1
+        for particle, matches_tag in zip(
+            constraint.children, constraint._child_matchers, strict=True
+        ):
+            max_occurs = particle.max_occurs
+            start = child_index
+
+            # Count the run of matching elements
+            if max_occurs == -1 and tag_count - child_index > _BATCH_MIN_CHILDREN:
+                # Long unbounded runs: find the first miss with C iterators,
+                # without bytecode per element
+                misses = map(not_, map(matches_tag, islice(tags, child_index, None)))
+                child_index += next(
+                    compress(itertools.count(), misses), tag_count - child_index
+                )
+            else:
+                while child_index < tag_count and matches_tag(tags[child_index]):
                     child_index += 1
 
-                    if particle.max_occurs != -1 and count >= particle.max_occurs:
+                    if max_occurs != -1 and child_index - start >= max_occurs:
                         break
-                else:
-                    break
+            count = child_index - start
 
             # Check occurrence constraints
             if count < particle.min_occurs:
                 if isinstance(particle, ElementParticle):
                     context.add_schema_error(
-                        f"Required element '{particle.local_name}' is missing "
-                        f"(minOccurs={particle.min_occurs}, found={count})",
+                        "Required element '{}' is missing (minOccurs={}, found={})",
+                        particle.local_name,
+                        particle.min_occurs,
+                        count,
                         node=particle.local_name,
                     )
                 valid = False
 
         # Check for unexpected elements
-        if child_index < len(children):
-            unexpected = children[child_index]
-            tag = unexpected.tag
-            if tag.startswith("{"):
-                tag = tag.split("}")[-1]
+        if child_index < tag_count:
+            tag = get_local_name(tags[child_index])
             context.add_schema_error(
-                f"Unexpected element '{tag}' found",
+                "Unexpected element '{}' found",
+                tag,
                 node=tag,
             )
             valid = False
 
         return valid
 
-    def _matches(self, particle: ParticleConstraint, element: etree._Element) -> bool:
-        """Check if an element matches a particle."""
-        if isinstance(particle, ElementParticle):
-            return element.tag == particle.qualified_name
-        elif isinstance(particle, AnyParticle):
-            return self._matches_any(particle, element)
-        elif isinstance(particle, CompositeParticle):
-            # For composite particles, check if any child matches
-            for child in particle.children:
-                if self._matches(child, element):
-                    return True
-        return False
-
-    def _matches_any(self, particle: AnyParticle, element: etree._Element) -> bool:
-        """Check if element matches an any particle."""
-        ns_constraint = particle.namespace_constraint
-
-        if ns_constraint == "##any":
-            return True
-        elif ns_constraint == "##local":
-            return not element.tag.startswith("{")
-        elif ns_constraint == "##other":
-            # Would need target namespace context
-            return True
-        else:
-            # Specific namespace URI
-            return element.tag.startswith(f"{{{ns_constraint}}}")
-
 
 class ChoiceParticleValidator(ParticleValidator):
     """Validates choice particles."""
@@ -276,13 +404,15 @@ class ChoiceParticleValidator(ParticleValidator):
     def validate(
         self,
         constraint: ParticleConstraint,
-        children: list[etree._Element],
+        children: Iterable[etree._Element],
         context: ValidationContext,
     ) -> bool:
         if not isinstance(constraint, ChoiceParticle):
             return False
 
-        if not children:
+        # Only the first child is checked, so don't materialize the rest
+        child = next(iter(children), None)
+        if child is None:
             if constraint.min_occurs > 0:
                 context.add_schema_error(
                     "Required choice element is missing",
@@ -290,54 +420,24 @@ class ChoiceParticleValidator(ParticleValidator):
                 return False
             return True
 
-        # Check that first child matches one of the choices
-        child = children[0]
-        for particle in constraint.children:
-            if self._matches(particle, child):
-                return True
-
-        # No match found
+        # Check that first child matches one of the choices; a choice of
+        # plain elements is decided by the index probe alone
         tag = child.tag
-        if tag.startswith("{"):
-            tag = tag.split("}")[-1]
-
-        expected = []
-        for p in constraint.children:
-            if isinstance(p, ElementParticle):
-                expected.append(p.local_name or "")
+        if tag in constraint._match_index:
+            return True
+        if constraint._any_particles and constraint.matches_tag(tag):
+            return True
 
+        # No match found
+        tag = get_local_name(tag)
         context.add_schema_error(
-            f"Element '{tag}' is not a valid choice. "
-            f"Expected one of: {', '.join(expected)}",
+            "Element '{}' is not a valid choice. Expected one of: {}",
+            tag,
+            constraint._expected_names,
             node=tag,
         )
         return False
 
-    def _matches(self, particle: ParticleConstraint, element: etree._Element) -> bool:
-        """Check if an element matches a particle."""
-        if isinstance(particle, ElementParticle):
-            return element.tag == particle.qualified_name
-        elif isinstance(particle, AnyParticle):
-            return self._matches_any(particle, element)
-        elif isinstance(particle, CompositeParticle):
-            for child in particle.children:
-                if self._matches(child, element):
-                    return True
-        return False
-
-    def _matches_any(self, particle: AnyParticle, element: etree._Element) -> bool:
-        """Check if element matches an any particle."""
-        ns_constraint = particle.namespace_constraint
-
-        if ns_constraint == "##any":
-            return True
-        elif ns_constraint == "##local":
-            return not element.tag.startswith("{")
-        elif ns_constraint == "##other":
-            return True
-        else:
-            return element.tag.startswith(f"{{{ns_constraint}}}")
-
 
 class AllParticleValidator(ParticleValidator):
     """Validates all particles (all elements required, any order)."""
@@ -345,7 +445,7 @@ class AllParticleValidator(ParticleValidator):
     def validate(
         self,
         constraint: ParticleConstraint,
-        children: list[etree._Element],
+        children: Iterable[etree._Element],
         context: ValidationContext,
     ) -> bool:
         if not isinstance(constraint, AllParticle):
@@ -355,37 +455,41 @@ class AllParticleValidator(ParticleValidator):
         found: set[str] = set()
 
         # Track which elements we found
+        element_index = constraint._element_index
         for child in children:
-            for particle in constraint.children:
-                if isinstance(particle, ElementParticle):
-                    if child.tag == particle.qualified_name:
-                        if particle.qualified_name in found and particle.max_occurs == 1:
-                            context.add_schema_error(
-                                f"Duplicate element '{particle.local_name}' not allowed",
-                                node=particle.local_name,
-                            )
-                            valid = False
-                        found.add(particle.qualified_name)
-                        break
+            particle = element_index.get(child.tag)
+            if particle is None:
+                continue
+            if particle.qualified_name in found and particle.max_occurs == 1:
+                context.add_schema_error(
+                    "Duplicate element '{}' not allowed",
+                    particle.local_name,
+                    node=particle.local_name,
+                )
+                valid = False
+            found.add(particle.qualified_name)
 
         # Check all required elements present
-        for particle in constraint.children:
-            if isinstance(particle, ElementParticle):
-                if particle.min_occurs > 0 and particle.qualified_name not in found:
-                    context.add_schema_error(
-                        f"Required element '{particle.local_name}' is missing",
-                        node=particle.local_name,
-                    )
-                    valid = False
+        for particle in constraint._element_particles:
+            if particle.min_occurs > 0 and particle.qualified_name not in found:
+                context.add_schema_error(
+                    "Required element '{}' is missing",
+                    particle.local_name,
+                    node=particle.local_name,
+                )
+                valid = False
 
         return valid
 
 
+# Validators hold no state, so one shared instance per particle type suffices
+_VALIDATORS: dict[ParticleType, ParticleValidator] = {
+    ParticleType.SEQUENCE: SequenceParticleValidator(),
+    ParticleType.CHOICE: ChoiceParticleValidator(),
+    ParticleType.ALL: AllParticleValidator(),
+}
+
+
 def get_validator(particle_type: ParticleType) -> ParticleValidator | None:
     """Get the appropriate validator for a particle type."""
-    validators: dict[ParticleType, ParticleValidator] = {
-        ParticleType.SEQUENCE: SequenceParticleValidator(),
-        ParticleType.CHOICE: ChoiceParticleValidator(),
-        ParticleType.ALL: AllParticleValidator(),
-    }
-    return validators.get(particle_type)
+    return _VALIDATORS.get(particle_type)
@@ -8,6 +8,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal, InvalidOperation
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -51,6 +52,12 @@ class XsdBuiltinType(Enum):
     NMTOKEN = "NMTOKEN"
 
 
+@lru_cache(maxsize=2048)
+def _get_regex(pattern: str) -> re.Pattern[str]:
+    """Compile a facet pattern once and share it across validators."""
+    return re.compile(pattern)
+
+
 @dataclass
 class TypeValidationResult:
     """Result of type validation."""
@@ -89,7 +96,7 @@ class StringTypeValidator(XsdTypeValidator):
     ):
         self.min_length = min_length
         self.max_length = max_length
-        self.pattern = re.compile(pattern) if pattern else None
+        self.pattern = _get_regex(pattern) if pattern else None
         self.enumeration = set(enumeration) if enumeration else None
 
     def validate(self, value: str, context: ValidationContext | None = None) -> TypeValidationResult:
@@ -126,16 +133,17 @@ class StringTypeValidator(XsdTypeValidator):
 class BooleanTypeValidator(XsdTypeValidator):
     """Validates boolean values."""
 
-    VALID_VALUES = {"true", "false", "1", "0"}
+    VALID_VALUES = frozenset({"true", "false", "1", "0"})
 
     def validate(self, value: str, context: ValidationContext | None = None) -> TypeValidationResult:
-        if value.lower() not in self.VALID_VALUES:
+        lowered = value.lower()
+        if lowered not in self.VALID_VALUES:
             return TypeValidationResult(
                 is_valid=False,
                 error_message=f"Invalid boolean value: '{value}'. Expected true, false, 1, or 0",
             )
 
-        parsed = value.lower() in ("true", "1")
+        parsed = lowered in ("true", "1")
         return TypeValidationResult(is_valid=True, parsed_value=parsed)
 
 
@@ -258,7 +266,14 @@ class DateTimeTypeValidator(XsdTypeValidator):
         r"(?P<fraction>\.\d+)?(?P<tz>Z|[+-]\d{2}:\d{2})?$"
     )
 
+    # Largest timezone offset XSD allows; fromisoformat accepts up to 24h.
+    MAX_TZ_OFFSET = timedelta(hours=14)
+
     def validate(self, value: str, context: ValidationContext | None = None) -> TypeValidationResult:
+        parsed = self._parse_common(value)
+        if parsed is not None:
+            return TypeValidationResult(is_valid=True, parsed_value=parsed)
+
         match = self.DATETIME_PATTERN.match(value)
         if not match:
             return TypeValidationResult(
@@ -352,6 +367,36 @@ class DateTimeTypeValidator(XsdTypeValidator):
 
         return TypeValidationResult(is_valid=True, parsed_value=parsed or value)
 
+    def _parse_common(self, value: str) -> datetime | None:
+        """Parse the common fixed-width forms with the native ISO parser.
+
+        Only ``YYYY-MM-DDTHH:MM:SS`` with an optional ``Z`` or ``+HH:MM``
+        suffix is attempted, so the broader ISO 8601 syntax accepted by
+        ``fromisoformat`` never leaks through. Anything else, including
+        fractions, leap seconds and out-of-range values, returns None and
+        is left to the regex path.
+        """
+        length = len(value)
+        if length == 20:
+            if value[19] != "Z":
+                return None
+            value = value[:19] + "+00:00"
+        elif length == 25:
+            if value[19] not in "+-" or value[22] != ":" or value[23] > "5":
+                return None
+        elif length != 19:
+            return None
+        if value[4] + value[7] + value[10] + value[13] + value[16] != "--T::":
+            return None
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        offset = parsed.utcoffset()
+        if offset is not None and abs(offset) > self.MAX_TZ_OFFSET:
+            return None
+        return parsed
+
     def _days_in_month(self, year: int, month: int) -> int:
         if month == 2:
             return 29 if self._is_leap_year(year) else 28
@@ -370,31 +415,38 @@ class DateTimeTypeValidator(XsdTypeValidator):
 class HexBinaryTypeValidator(XsdTypeValidator):
     """Validates hexBinary values."""
 
-    HEX_PATTERN = re.compile(r"^[0-9A-Fa-f]*$")
+    HEX_DIGITS = "0123456789abcdefABCDEF"
 
     def __init__(self, length: int | None = None):
         self.length = length
 
     def validate(self, value: str, context: ValidationContext | None = None) -> TypeValidationResult:
-        if not self.HEX_PATTERN.match(value):
-            return TypeValidationResult(
-                is_valid=False,
-                error_message=f"Invalid hexBinary value: '{value}'",
-            )
+        try:
+            parsed = bytes.fromhex(value)
+        except ValueError:
+            parsed = None
 
-        if len(value) % 2 != 0:
+        # fromhex skips whitespace between bytes, which hexBinary does not allow
+        if parsed is None or len(parsed) * 2 != len(value):
+            if len(value) % 2 != 0 and not value.strip(self.HEX_DIGITS):
+                return TypeValidationResult(
+                    is_valid=False,
+                    error_message="hexBinary value must have even number of characters",
+                )
             return TypeValidationResult(
                 is_valid=False,
-                error_message="hexBinary value must have even number of characters",
+                error_message=f"Invalid hexBinary value: '{value}'",
             )
 
-        if self.length is not None and len(value) // 2 != self.length:
+        if self.length is not None and len(parsed) != self.length:
             return TypeValidationResult(
                 is_valid=False,
-                error_message=f"hexBinary length {len(value) // 2} does not match required {self.length}",
+                error_message=(
+                    f"hexBinary length {len(parsed)} does not match required {self.length}"
+                ),
             )
 
-        return TypeValidationResult(is_valid=True, parsed_value=bytes.fromhex(value))
+        return TypeValidationResult(is_valid=True, parsed_value=parsed)
 
 
 class NCNameTypeValidator(XsdTypeValidator):
@@ -422,6 +474,8 @@ class NCNameTypeValidator(XsdTypeValidator):
 class AnyURITypeValidator(XsdTypeValidator):
     """Validates anyURI values."""
 
+    INVALID_CHARS_PATTERN = re.compile(r'[<>"{}|\\^`]')
+
     def validate(self, value: str, context: ValidationContext | None = None) -> TypeValidationResult:
         # Basic URI validation - allow most strings that could be URIs
         # A more complete implementation would parse according to RFC 3986
@@ -429,8 +483,7 @@ class AnyURITypeValidator(XsdTypeValidator):
             return TypeValidationResult(is_valid=True, parsed_value=value)
 
         # Check for invalid characters
-        invalid_chars = set('<>"{}|\\^`')
-        if any(c in value for c in invalid_chars):
+        if self.INVALID_CHARS_PATTERN.search(value):
             return TypeValidationResult(
                 is_valid=False,
                 error_message=f"Invalid URI: contains invalid characters",
@@ -466,6 +519,12 @@ BUILTIN_VALIDATORS: dict[XsdBuiltinType, XsdTypeValidator] = {
 }
 
 
+# Same validators keyed by XSD type name, so string lookups skip enum construction
+_VALIDATORS_BY_NAME: dict[str, XsdTypeValidator] = {
+    type_enum.value: validator for type_enum, validator in BUILTIN_VALIDATORS.items()
+}
+
+
 def get_type_validator(type_name: str | XsdBuiltinType) -> XsdTypeValidator | None:
     """Get a validator for an XSD built-in type.
 
@@ -476,11 +535,5 @@ def get_type_validator(type_name: str | XsdBuiltinType) -> XsdTypeValidator | No
         The appropriate validator, or None if not found.
     """
     if isinstance(type_name, str):
-        try:
-            type_enum = XsdBuiltinType(type_name)
-        except ValueError:
-            return None
-    else:
-        type_enum = type_name
-
-    return BUILTIN_VALIDATORS.get(type_enum)
+        return _VALIDATORS_BY_NAME.get(type_name)
+    return BUILTIN_VALIDATORS.get(type_name)
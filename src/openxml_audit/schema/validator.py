@@ -10,26 +10,28 @@ from openxml_audit.context import ElementContext, ValidationContext
 from openxml_audit.errors import ValidationError
 from openxml_audit.namespaces import MC
 from openxml_audit.schema.constraints import get_constraint_for_tag as get_hardcoded_constraint
-from openxml_audit.schema.particle import (
-    CompositeParticle,
-    ParticleType,
-    get_validator,
-)
 
 # Try to import SDK constraint bridge
 try:
     from openxml_audit.codegen.constraint_bridge import (
         get_element_constraint as get_sdk_constraint,
         get_element_constraint_for_element as get_sdk_constraint_for_element,
+        is_ambiguous_tag,
     )
     _HAS_SDK_CONSTRAINTS = True
 except ImportError:
     _HAS_SDK_CONSTRAINTS = False
     get_sdk_constraint = None  # type: ignore
     get_sdk_constraint_for_element = None  # type: ignore
+    is_ambiguous_tag = None  # type: ignore
 
+_MC_NS = {"mc": MC}
+_MC_ALTERNATE_CONTENT = f"{{{MC}}}AlternateContent"
 
-def get_constraint_for_tag(tag: str, element: etree._Element | None = None):
+
+def get_constraint_for_tag(
+    tag: str, element: etree._Element | None = None
+) -> ElementConstraint | None:
     """Get constraint for element tag, preferring SDK constraints.
 
     Args:
@@ -51,6 +53,8 @@ def get_constraint_for_tag(tag: str, element: etree._Element | None = None):
     return get_hardcoded_constraint(tag)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from openxml_audit.parts import OpenXmlPart
 
 
@@ -71,6 +75,8 @@ class SchemaValidator:
                                        without known constraints.
         """
         self._validate_unknown = validate_unknown_elements
+        self._constraint_cache: dict[str, ElementConstraint | None] = {}
+        self._ambiguous_tags: set[str] = set()
 
     def validate_part(
         self, part: OpenXmlPart, context: ValidationContext
@@ -103,20 +109,34 @@ class SchemaValidator:
             tag = element.tag
 
             # Get constraint for this element
-            constraint = get_constraint_for_tag(tag, element)
+            constraint = self._get_constraint(tag, element)
 
             if constraint is not None:
                 # Validate attributes
                 self._validate_attributes(element, constraint, context)
 
                 # Validate content model
-                if constraint.content_model is not None:
-                    self._validate_content_model(element, constraint.content_model, context)
+                self._validate_content_model(element, constraint, context)
 
             # Recursively validate children
-            for child in self._get_validation_children(element):
+            for child in self._iter_validation_children(element):
                 self._validate_element(child, context)
 
+    def _get_constraint(self, tag: str, element: etree._Element) -> ElementConstraint | None:
+        """Get the constraint for an element, cached per tag when unambiguous."""
+        cache = self._constraint_cache
+        if tag in cache:
+            return cache[tag]
+        if tag in self._ambiguous_tags:
+            return get_constraint_for_tag(tag, element)
+
+        constraint = get_constraint_for_tag(tag, element)
+        if is_ambiguous_tag is not None and is_ambiguous_tag(tag):
+            self._ambiguous_tags.add(tag)
+        else:
+            cache[tag] = constraint
+        return constraint
+
     def _validate_attributes(
         self,
         element: etree._Element,
@@ -124,79 +144,68 @@ class SchemaValidator:
         context: ValidationContext,
     ) -> None:
         """Validate element attributes."""
+        attrib = element.attrib
+
         # Check required attributes
         for attr_constraint in constraint.get_required_attributes():
-            attr_name = attr_constraint.qualified_name
-            if attr_name not in element.attrib:
+            if attr_constraint.qualified_name not in attrib:
                 context.add_schema_error(
                     f"Required attribute '{attr_constraint.local_name}' is missing",
                     node=attr_constraint.local_name,
                 )
 
-        # Validate attribute values
-        for attr_constraint in constraint.attributes:
-            attr_name = attr_constraint.qualified_name
-            if attr_name in element.attrib:
-                value = element.attrib[attr_name]
-
-                # Check fixed value
-                if attr_constraint.fixed_value is not None:
-                    if value != attr_constraint.fixed_value:
-                        context.add_schema_error(
-                            f"Attribute '{attr_constraint.local_name}' must have "
-                            f"fixed value '{attr_constraint.fixed_value}', got '{value}'",
-                            node=attr_constraint.local_name,
-                        )
-
-                # Type validation
-                if attr_constraint.type_validator is not None:
-                    result = attr_constraint.type_validator.validate(value, context)
-                    if not result.is_valid:
-                        context.add_schema_error(
-                            f"Invalid value for attribute '{attr_constraint.local_name}': "
-                            f"{result.error_message}",
-                            node=attr_constraint.local_name,
-                        )
+        # Validate attribute values; attributes with nothing to check are skipped
+        for attr_constraint in constraint.get_value_checked_attributes():
+            value = attrib.get(attr_constraint.qualified_name)
+            if value is None:
+                continue
 
+            # Check fixed value
+            if attr_constraint.fixed_value is not None:
+                if value != attr_constraint.fixed_value:
+                    context.add_schema_error(
+                        f"Attribute '{attr_constraint.local_name}' must have "
+                        f"fixed value '{attr_constraint.fixed_value}', got '{value}'",
+                        node=attr_constraint.local_name,
+                    )
+
+            # Type validation
+            if attr_constraint.type_validator is not None:
+                result = attr_constraint.type_validator.validate(value, context)
+                if not result.is_valid:
+                    context.add_schema_error(
+                        f"Invalid value for attribute '{attr_constraint.local_name}': "
+                        f"{result.error_message}",
+                        node=attr_constraint.local_name,
+                    )
 
     def _validate_content_model(
         self,
         element: etree._Element,
-        content_model: "ParticleConstraint",  # type: ignore
+        constraint: "ElementConstraint",  # type: ignore
         context: ValidationContext,
     ) -> None:
         """Validate element children against content model."""
-        # Get non-comment children, with AlternateContent expanded
-        children = self._get_validation_children(element)
-
-        if isinstance(content_model, CompositeParticle):
-            validator = get_validator(content_model.particle_type)
-            if validator is not None:
-                validator.validate(content_model, children, context)
-
-    def _get_validation_children(self, element: etree._Element) -> list[etree._Element]:
-        children: list[etree._Element] = []
-
-        for child in element:
-            if not isinstance(child.tag, str):
-                continue
-            if child.tag == f"{{{MC}}}AlternateContent":
-                children.extend(self._resolve_alternate_content(child))
+        # Stream non-comment children, with AlternateContent expanded
+        constraint.validate_content(self._iter_validation_children(element), context)
+
+    def _iter_validation_children(self, element: etree._Element) -> Iterator[etree._Element]:
+        # "*" yields elements only, skipping comments, PIs and entities
+        for child in element.iterchildren("*"):
+            if child.tag == _MC_ALTERNATE_CONTENT:
+                yield from self._resolve_alternate_content(child)
                 continue
-            children.append(child)
+            yield child
 
-        return children
-
-    def _resolve_alternate_content(self, alt: etree._Element) -> list[etree._Element]:
-        ns = {"mc": MC}
-        chosen = alt.find("mc:Fallback", ns)
+    def _resolve_alternate_content(self, alt: etree._Element) -> Iterator[etree._Element]:
+        chosen = alt.find("mc:Fallback", _MC_NS)
         if chosen is None:
-            chosen = alt.find("mc:Choice", ns)
+            chosen = alt.find("mc:Choice", _MC_NS)
         if chosen is None:
-            return []
-        return [c for c in chosen if isinstance(c.tag, str)]
+            return iter(())
+        children: Iterator[etree._Element] = chosen.iterchildren("*")
+        return children
 
 
 # Import for type hints only
 from openxml_audit.schema.constraints import ElementConstraint  # noqa: E402
-from openxml_audit.schema.particle import ParticleConstraint  # noqa: E402
@@ -38,13 +38,11 @@ class OrConstraint(SemanticConstraint):
 
             if result:
                 # One passed - remove any errors added by failed constraints
-                while len(context.errors) > original_errors:
-                    context.errors.pop()
+                context.truncate_errors(original_errors)
                 return True
 
             # Remove errors from this failed attempt
-            while len(context.errors) > original_errors:
-                context.errors.pop()
+            context.truncate_errors(original_errors)
 
         # All constraints failed
         if self.error_message:
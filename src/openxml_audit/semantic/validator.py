@@ -10,7 +10,7 @@ from openxml_audit.context import ElementContext
 from openxml_audit.errors import ValidationError
 from openxml_audit.semantic.attributes import SemanticConstraint
 from openxml_audit.semantic.references import IdTracker, validate_unique_ids
-from openxml_audit.namespaces import MC, OFFICE_DOC_RELATIONSHIPS
+from openxml_audit.namespaces import MC, OFFICE_DOC_RELATIONSHIPS, get_local_name
 from openxml_audit.semantic.relationships import validate_part_relationships
 
 if TYPE_CHECKING:
@@ -95,9 +95,8 @@ class SemanticValidator:
                     constraint.validate(element, context)
 
             # Recursively validate children
-            for child in element:
-                if isinstance(child.tag, str):
-                    self._validate_element(child, context)
+            for child in element.iterchildren("*"):
+                self._validate_element(child, context)
 
     def _validate_relationship_attributes(
         self, element: etree._Element, context: ValidationContext
@@ -113,7 +112,7 @@ class SemanticValidator:
                 continue
             rel = part.relationships.get_by_id(value)
             if rel is None:
-                local_attr = attr_name.split("}")[-1] if attr_name.startswith("{") else attr_name
+                local_attr = get_local_name(attr_name)
                 context.add_semantic_error(
                     f"Relationship '{value}' referenced by '{local_attr}' does not exist",
                     node=local_attr,
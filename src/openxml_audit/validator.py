@@ -30,13 +30,16 @@ from openxml_audit.namespaces import (
     REL_NUMBERING,
     REL_SETTINGS,
     REL_SLIDE,
+    REL_SLIDE_LAYOUT,
     REL_SLIDE_MASTER,
     REL_STYLES,
     REL_STYLES_WITH_EFFECTS,
     REL_SHARED_STRINGS,
     REL_THEME,
     REL_WEB_SETTINGS,
+    SPREADSHEETML,
     WORDPROCESSINGML,
+    qualify_name_cached,
 )
 from openxml_audit.package import OpenXmlPackage
 from openxml_audit.parts import (
@@ -67,6 +70,16 @@ from openxml_audit.excel.workbook import WorkbookValidator
 if TYPE_CHECKING:
     pass
 
+_W_NS = {"w": WORDPROCESSINGML}
+_W_R_NS = {"w": WORDPROCESSINGML, "r": OFFICE_DOC_RELATIONSHIPS}
+
+_W_NUM_ID_TAG = qualify_name_cached("numId", WORDPROCESSINGML)
+_W_STYLE_TAG = qualify_name_cached("style", WORDPROCESSINGML)
+_W_NUM_TAG = qualify_name_cached("num", WORDPROCESSINGML)
+_W_ABSTRACT_NUM_TAG = qualify_name_cached("abstractNum", WORDPROCESSINGML)
+_S_CELL_TAG = qualify_name_cached("c", SPREADSHEETML)
+_S_VALUE_TAG = qualify_name_cached("v", SPREADSHEETML)
+
 
 class DocumentKind(Enum):
     """Supported Open XML document kinds."""
@@ -387,10 +400,7 @@ class OpenXmlValidator:
                 continue
 
             # Check slide has a layout relationship
-            layout_rels = list(slide.relationships.get_by_type(
-                "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
-            ))
-            if not layout_rels:
+            if slide.relationships.get_first_by_type(REL_SLIDE_LAYOUT) is None:
                 errors.append(
                     ValidationError(
                         error_type=ValidationErrorType.RELATIONSHIP,
@@ -486,7 +496,7 @@ class OpenXmlValidator:
         # Check main document relationships
         main_doc_uri = package.get_main_document_uri()
         if main_doc_uri:
-            main_part = OpenXmlPart(package, main_doc_uri)
+            main_part = package.get_part(main_doc_uri)
             for rel in main_part.relationships:
                 if not rel.is_external:
                     target = rel.resolve_target(main_doc_uri)
@@ -542,15 +552,14 @@ class OpenXmlValidator:
         if not package.has_part(font_table_uri):
             return font_keys
 
-        part = OpenXmlPart(package, font_table_uri)
+        part = package.get_part(font_table_uri)
         xml = part.xml
         if xml is None:
             return font_keys
 
-        ns = {"w": WORDPROCESSINGML, "r": OFFICE_DOC_RELATIONSHIPS}
         embed_tags = ("embedRegular", "embedBold", "embedItalic", "embedBoldItalic")
         for tag in embed_tags:
-            for embed in xml.findall(f".//w:{tag}", ns):
+            for embed in xml.findall(f".//w:{tag}", _W_R_NS):
                 rel_id = embed.get(f"{{{OFFICE_DOC_RELATIONSHIPS}}}id", "")
                 font_key = embed.get(f"{{{WORDPROCESSINGML}}}fontKey", "")
                 if not rel_id or not font_key:
@@ -603,7 +612,7 @@ class OpenXmlValidator:
             content_type = package.content_types.get_content_type(part_uri)
             if not is_xml_content_type(content_type):
                 continue
-            part = OpenXmlPart(package, part_uri)
+            part = package.get_part(part_uri)
             self._schema_validator.validate_part(part, context)
 
             if context.should_stop:
@@ -663,7 +672,7 @@ class OpenXmlValidator:
 
         main_doc_uri = package.get_main_document_uri()
         if main_doc_uri:
-            main_doc = OpenXmlPart(package, main_doc_uri)
+            main_doc = package.get_part(main_doc_uri)
             self._validate_required_relationships(
                 main_doc,
                 self._word_required_relationships(),
@@ -695,7 +704,7 @@ class OpenXmlValidator:
 
         main_doc_uri = package.get_main_document_uri()
         if main_doc_uri:
-            main_doc = OpenXmlPart(package, main_doc_uri)
+            main_doc = package.get_part(main_doc_uri)
             self._validate_required_relationships(
                 main_doc,
                 self._spreadsheet_required_relationships(),
@@ -730,7 +739,7 @@ class OpenXmlValidator:
             content_type = package.content_types.get_content_type(part_uri)
             if not is_xml_content_type(content_type):
                 continue
-            part = OpenXmlPart(package, part_uri)
+            part = package.get_part(part_uri)
             validator.validate_part(part, context)
 
             if context.should_stop:
@@ -859,7 +868,7 @@ class OpenXmlValidator:
         if main_doc_uri is None:
             return
 
-        main_doc = OpenXmlPart(package, main_doc_uri)
+        main_doc = package.get_part(main_doc_uri)
         self._validate_word_main_content_type(main_doc, context)
         self._validate_custom_xml_parts(package, main_doc, context)
 
@@ -887,7 +896,7 @@ class OpenXmlValidator:
         missing_endnotes_reported = False
 
         for part_uri, xml in self._iter_word_reference_parts(package):
-            part = OpenXmlPart(package, part_uri)
+            part = package.get_part(part_uri)
             context.set_part(part)
 
             for style_ref in self._iter_word_style_refs(xml):
@@ -973,7 +982,7 @@ class OpenXmlValidator:
                     )
 
         if styles_xml is not None:
-            styles_part = OpenXmlPart(package, "/word/styles.xml")
+            styles_part = package.get_part("/word/styles.xml")
             self._validate_word_style_links(styles_xml, style_ids, context, styles_part)
         if numbering_xml is not None:
             self._validate_word_numbering_links(numbering_xml, abstract_ids, context)
@@ -1001,7 +1010,7 @@ class OpenXmlValidator:
         if main_doc_uri is None:
             return
 
-        main_doc = OpenXmlPart(package, main_doc_uri)
+        main_doc = package.get_part(main_doc_uri)
         self._validate_spreadsheet_main_content_type(main_doc, context)
 
         shared_strings_xml = package.get_part_xml("/xl/sharedStrings.xml")
@@ -1015,7 +1024,7 @@ class OpenXmlValidator:
 
         needs_shared_strings = False
         for part_uri, xml in self._iter_spreadsheet_worksheet_parts(package):
-            part = OpenXmlPart(package, part_uri)
+            part = package.get_part(part_uri)
             context.set_part(part)
             for ref in self._iter_shared_string_refs(xml):
                 needs_shared_strings = True
@@ -1163,29 +1172,26 @@ class OpenXmlValidator:
         return parts
 
     def _iter_word_style_refs(self, xml: etree._Element) -> list[str]:
-        ns = {"w": WORDPROCESSINGML}
         refs: list[str] = []
         for tag in ("pStyle", "rStyle", "tblStyle"):
-            for elem in xml.findall(f".//w:{tag}", ns):
+            for elem in xml.iter(qualify_name_cached(tag, WORDPROCESSINGML)):
                 val = elem.get(f"{{{WORDPROCESSINGML}}}val")
                 if val:
                     refs.append(val)
         return refs
 
     def _iter_word_num_refs(self, xml: etree._Element) -> list[str]:
-        ns = {"w": WORDPROCESSINGML}
         refs: list[str] = []
-        for elem in xml.findall(".//w:numId", ns):
+        for elem in xml.iter(_W_NUM_ID_TAG):
             val = elem.get(f"{{{WORDPROCESSINGML}}}val")
             if val:
                 refs.append(val)
         return refs
 
     def _iter_word_id_refs(self, xml: etree._Element, tags: tuple[str, ...]) -> list[str]:
-        ns = {"w": WORDPROCESSINGML}
         refs: list[str] = []
         for tag in tags:
-            for elem in xml.findall(f".//w:{tag}", ns):
+            for elem in xml.iter(qualify_name_cached(tag, WORDPROCESSINGML)):
                 val = elem.get(f"{{{WORDPROCESSINGML}}}id")
                 if val:
                     refs.append(val)
@@ -1193,10 +1199,10 @@ class OpenXmlValidator:
 
     def _iter_shared_string_refs(self, xml: etree._Element) -> list[int]:
         refs: list[int] = []
-        for cell in xml.findall(".//{http://schemas.openxmlformats.org/spreadsheetml/2006/main}c"):
+        for cell in xml.iter(_S_CELL_TAG):
             if cell.get("t") != "s":
                 continue
-            value = cell.find("{http://schemas.openxmlformats.org/spreadsheetml/2006/main}v")
+            value = cell.find(_S_VALUE_TAG)
             if value is None or value.text is None:
                 continue
             try:
@@ -1208,9 +1214,8 @@ class OpenXmlValidator:
     def _collect_word_style_ids(self, styles_xml: etree._Element | None) -> set[str]:
         if styles_xml is None:
             return set()
-        ns = {"w": WORDPROCESSINGML}
         style_ids = set()
-        for style in styles_xml.findall(".//w:style", ns):
+        for style in styles_xml.iter(_W_STYLE_TAG):
             style_id = style.get(f"{{{WORDPROCESSINGML}}}styleId")
             if style_id:
                 style_ids.add(style_id)
@@ -1221,14 +1226,13 @@ class OpenXmlValidator:
     ) -> tuple[set[str], set[str]]:
         if numbering_xml is None:
             return set(), set()
-        ns = {"w": WORDPROCESSINGML}
         num_ids = set()
         abstract_ids = set()
-        for num in numbering_xml.findall(".//w:num", ns):
+        for num in numbering_xml.iter(_W_NUM_TAG):
             num_id = num.get(f"{{{WORDPROCESSINGML}}}numId")
             if num_id:
                 num_ids.add(num_id)
-        for abstract_num in numbering_xml.findall(".//w:abstractNum", ns):
+        for abstract_num in numbering_xml.iter(_W_ABSTRACT_NUM_TAG):
             abstract_id = abstract_num.get(f"{{{WORDPROCESSINGML}}}abstractNumId")
             if abstract_id:
                 abstract_ids.add(abstract_id)
@@ -1242,9 +1246,8 @@ class OpenXmlValidator:
     ) -> set[str]:
         if xml is None:
             return set()
-        ns = {"w": WORDPROCESSINGML}
         ids = set()
-        for elem in xml.findall(f".//w:{element_name}", ns):
+        for elem in xml.iter(qualify_name_cached(element_name, WORDPROCESSINGML)):
             elem_id = elem.get(f"{{{WORDPROCESSINGML}}}{id_attribute}")
             if elem_id:
                 ids.add(elem_id)
@@ -1257,12 +1260,11 @@ class OpenXmlValidator:
         context: ValidationContext,
         styles_part: OpenXmlPart,
     ) -> None:
-        ns = {"w": WORDPROCESSINGML}
         context.set_part(styles_part)
-        for style in styles_xml.findall(".//w:style", ns):
+        for style in styles_xml.iter(_W_STYLE_TAG):
             style_id = style.get(f"{{{WORDPROCESSINGML}}}styleId") or ""
             for tag in ("basedOn", "next", "link"):
-                ref = style.find(f"w:{tag}", ns)
+                ref = style.find(f"w:{tag}", _W_NS)
                 if ref is None:
                     continue
                 val = ref.get(f"{{{WORDPROCESSINGML}}}val")
@@ -1278,13 +1280,12 @@ class OpenXmlValidator:
         abstract_ids: set[str],
         context: ValidationContext,
     ) -> None:
-        ns = {"w": WORDPROCESSINGML}
         if context.package is None:
             return
-        context.set_part(OpenXmlPart(context.package, "/word/numbering.xml"))
-        for num in numbering_xml.findall(".//w:num", ns):
+        context.set_part(context.package.get_part("/word/numbering.xml"))
+        for num in numbering_xml.iter(_W_NUM_TAG):
             num_id = num.get(f"{{{WORDPROCESSINGML}}}numId") or ""
-            abstract_ref = num.find("w:abstractNumId", ns)
+            abstract_ref = num.find("w:abstractNumId", _W_NS)
             if abstract_ref is None:
                 context.add_semantic_error(
                     f"Numbering definition '{num_id}' missing abstractNumId",
@@ -1308,17 +1309,16 @@ class OpenXmlValidator:
         settings_xml = package.get_part_xml("/word/settings.xml")
         if settings_xml is None:
             return
-        settings_part = OpenXmlPart(package, "/word/settings.xml")
+        settings_part = package.get_part("/word/settings.xml")
         context.set_part(settings_part)
-        ns = {"w": WORDPROCESSINGML}
-        for elem in settings_xml.findall(".//w:footnotePr/w:footnote", ns):
+        for elem in settings_xml.findall(".//w:footnotePr/w:footnote", _W_NS):
             note_id = elem.get(f"{{{WORDPROCESSINGML}}}id")
             if note_id and note_id not in footnote_ids:
                 context.add_semantic_error(
                     f"Footnote '{note_id}' referenced in settings.xml was not found in footnotes.xml",
                     node="footnote",
                 )
-        for elem in settings_xml.findall(".//w:endnotePr/w:endnote", ns):
+        for elem in settings_xml.findall(".//w:endnotePr/w:endnote", _W_NS):
             note_id = elem.get(f"{{{WORDPROCESSINGML}}}id")
             if note_id and note_id not in endnote_ids:
                 context.add_semantic_error(
@@ -1344,8 +1344,7 @@ class OpenXmlValidator:
             return
 
         context.set_part(main_doc)
-        has_rel = any(rel.type == REL_CUSTOM_XML for rel in main_doc.relationships)
-        if not has_rel:
+        if main_doc.relationships.get_first_by_type(REL_CUSTOM_XML) is None:
             context.add_semantic_error(
                 f"Missing required relationship type 'customXml' ({REL_CUSTOM_XML})",
                 node="Relationship",
@@ -1354,13 +1353,13 @@ class OpenXmlValidator:
         for item_uri in items:
             rels_path = get_rels_path(item_uri)
             if not package.has_part(rels_path):
-                context.set_part(OpenXmlPart(package, item_uri))
+                context.set_part(package.get_part(item_uri))
                 context.add_semantic_error(
                     "customXml item missing relationships to customXmlProps",
                     node="Relationship",
                 )
                 continue
-            item_part = OpenXmlPart(package, item_uri)
+            item_part = package.get_part(item_uri)
             rels = item_part.relationships
             rel = rels.get_first_by_type(REL_CUSTOM_XML_PROPS)
             if rel is None:
@@ -1402,9 +1401,7 @@ class OpenXmlValidator:
         if not main_doc_uri:
             return errors
 
-        self._validate_presentation_main_content_type(
-            OpenXmlPart(package, main_doc_uri), context
-        )
+        self._validate_presentation_main_content_type(package.get_part(main_doc_uri), context)
 
         # Validate presentation.xml
         presentation = PresentationPart(package, main_doc_uri)
@@ -1425,16 +1422,14 @@ class OpenXmlValidator:
                     break
 
                 # Validate theme for this master
-                theme_rel_type = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/theme"
-                for theme_rel in master.relationships.get_by_type(theme_rel_type):
+                for theme_rel in master.relationships.get_by_type(REL_THEME):
                     theme_target = theme_rel.resolve_target(target)
                     if theme_target and package.has_part(theme_target):
                         theme = ThemePart(package, theme_target)
                         self._theme_validator.validate(theme, context)
 
                 # Validate layouts for this master
-                layout_rel_type = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout"
-                for layout_rel in master.relationships.get_by_type(layout_rel_type):
+                for layout_rel in master.relationships.get_by_type(REL_SLIDE_LAYOUT):
                     layout_target = layout_rel.resolve_target(target)
                     if layout_target and package.has_part(layout_target):
                         layout = SlideLayoutPart(package, layout_target)
@@ -8,42 +8,40 @@ from lxml import etree
 
 from openxml_audit.context import ElementContext
 from openxml_audit.errors import ValidationError
-from openxml_audit.namespaces import REL_FOOTER, REL_HEADER, WORDPROCESSINGML
+from openxml_audit.namespaces import R_ID_ATTR, REL_FOOTER, REL_HEADER, WORDPROCESSINGML
 
 if TYPE_CHECKING:
     from openxml_audit.context import ValidationContext
     from openxml_audit.parts import DocumentPart
 
+_Q_DOCUMENT = f"{{{WORDPROCESSINGML}}}document"
+
 
 class DocumentValidator:
     """Validate Word document structure and relationships."""
 
     def __init__(self) -> None:
         self._ns = {"w": WORDPROCESSINGML}
-        self._rel_ns = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
 
     def validate(
         self, part: "DocumentPart", context: "ValidationContext"
     ) -> list[ValidationError]:
         """Validate a Word document part."""
         context.set_part(part)
-        errors: list[ValidationError] = []
 
         xml = part.xml
         if xml is None:
-            return errors
+            return []
 
         with ElementContext(context, xml):
             self._validate_root(xml, context)
             self._validate_body(xml, context)
             self._validate_header_footer_refs(xml, part, context)
 
-        errors.extend(context.errors)
-        return errors
+        return list(context.errors)
 
     def _validate_root(self, xml: etree._Element, context: "ValidationContext") -> None:
-        expected_tag = f"{{{WORDPROCESSINGML}}}document"
-        if xml.tag != expected_tag:
+        if xml.tag != _Q_DOCUMENT:
             context.add_schema_error(
                 f"Root element should be 'document', got '{xml.tag}'",
             )
@@ -67,7 +65,7 @@ class DocumentValidator:
             ("footerReference", REL_FOOTER),
         ):
             for ref in xml.findall(f".//w:{tag}", self._ns):
-                rel_id = ref.get(f"{{{self._rel_ns}}}id", "")
+                rel_id = ref.get(R_ID_ATTR, "")
                 if not rel_id:
                     context.add_schema_error(
                         f"{tag} is missing r:id attribute",
@@ -0,0 +1,103 @@
+"""Tests for the validation context."""
+
+from __future__ import annotations
+
+from openxml_audit.context import ValidationContext
+from openxml_audit.errors import ValidationErrorType, ValidationSeverity
+
+
+class TestValidationContext:
+    """Tests for ValidationContext error tracking."""
+
+    def test_should_stop_at_max_errors(self) -> None:
+        """Test context stops once max_errors is reached."""
+        context = ValidationContext(max_errors=2)
+
+        context.add_schema_error("first")
+        assert not context.should_stop
+        context.add_schema_error("second")
+        assert context.should_stop
+
+        context.add_schema_error("dropped")
+        assert context.error_count == 2
+        assert len(context.errors) == 2
+
+    def test_warnings_do_not_count_toward_limit(self) -> None:
+        """Test warnings are collected without triggering the stop flag."""
+        context = ValidationContext(max_errors=1)
+
+        context.add_error(
+            ValidationErrorType.SCHEMA,
+            "warning",
+            severity=ValidationSeverity.WARNING,
+        )
+        assert not context.should_stop
+        assert context.error_count == 0
+
+    def test_max_errors_zero_never_stops(self) -> None:
+        """Test max_errors=0 disables the limit."""
+        context = ValidationContext(max_errors=0)
+
+        for index in range(10):
+            context.add_schema_error(f"error {index}")
+
+        assert not context.should_stop
+        assert context.error_count == 10
+
+    def test_truncate_errors_resets_stop(self) -> None:
+        """Test rolling back errors also rolls back the stop flag."""
+        context = ValidationContext(max_errors=2)
+        context.add_schema_error("kept")
+        context.add_schema_error("speculative")
+        assert context.should_stop
+
+        context.truncate_errors(1)
+
+        assert not context.should_stop
+        assert context.error_count == 1
+        assert [e.description for e in context.errors] == ["kept"]
+
+    def test_merge_preserves_order_and_limit(self) -> None:
+        """Test merging spawned contexts keeps order and honours max_errors."""
+        context = ValidationContext(max_errors=3, strict=True)
+        first = context.spawn()
+        second = context.spawn()
+        assert second.strict and second.max_errors == 3
+
+        first.add_schema_error("a")
+        first.add_schema_error("b")
+        second.add_schema_error("c")
+        second.add_schema_error("d")
+        context.merge(first)
+        context.merge(second)
+
+        assert [e.description for e in context.errors] == ["a", "b", "c"]
+        assert context.should_stop
+
+    def test_add_schema_errors_matches_single_adds(self) -> None:
+        """Test batched schema errors match one-by-one adds and the limit."""
+        entries = [("a", None), ("b", "name"), ("c", None)]
+        for strict in (True, False):
+            single = ValidationContext(max_errors=2, strict=strict)
+            for description, node in entries:
+                single.add_schema_error(description, node=node)
+            batched = ValidationContext(max_errors=2, strict=strict)
+            batched.add_schema_errors(entries)
+
+            assert batched.errors == single.errors
+            assert batched.error_count == single.error_count
+            assert batched.should_stop == single.should_stop
+
+    def test_add_schema_error_formats_template_lazily(self) -> None:
+        """Test template args are formatted only for recorded errors."""
+
+        class Exploding:
+            def __format__(self, spec: str) -> str:
+                raise AssertionError("formatted after stop")
+
+        context = ValidationContext(max_errors=1, strict=True)
+        context.add_schema_error("Missing '{}' ({})", "name", 2, node="name")
+        context.add_schema_error("Dropped {}", Exploding())
+
+        assert [e.description for e in context.errors] == ["Missing 'name' (2)"]
+        assert context.errors[0].node == "name"
@@ -103,6 +103,16 @@ class TestValidateOnSaveDecorator:
 
         assert "invalid" in str(exc_info.value).lower()
 
+    def test_decorator_matches_suffix_case_insensitively(self, tmp_path: Path) -> None:
+        """Test decorator detects upper-case .PPTX output paths."""
+
+        @validate_on_save(raise_on_invalid=True)
+        def create_invalid_pptx(output_path: str) -> None:
+            Path(output_path).write_text("not a valid pptx")
+
+        with pytest.raises(ValueError):
+            create_invalid_pptx(str(tmp_path / "INVALID.PPTX"))
+
 
 class TestRequireValidPptxDecorator:
     """Tests for require_valid_pptx decorator."""
@@ -43,6 +43,41 @@ class TestContentTypes:
         ct = ContentTypes.from_xml(xml)
         assert ct.get_content_type("/test.unknown") is None
 
+    def test_lookup_without_leading_slash(self) -> None:
+        """Test part names are normalized and lookups are memoized."""
+        xml = load_fixture_bytes("content_types", "override.xml")
+
+        ct = ContentTypes.from_xml(xml)
+
+        assert ct.get_content_type("ppt/presentation.xml") == ct.get_content_type(
+            "/ppt/presentation.xml"
+        )
+        assert ct.get_content_type("docProps/app") is None
+        assert ct.get_content_type("docProps/app") is None
+
+    def test_extension_comes_from_last_segment(self) -> None:
+        """Test dots in folder names or leading dots do not form an extension."""
+        xml = load_fixture_bytes("content_types", "defaults.xml")
+
+        ct = ContentTypes.from_xml(xml)
+
+        assert ct.get_content_type("/dir.xml/file") is None
+        assert ct.get_content_type("/_rels/.rels") is None
+        assert ct.get_content_type("/dir.v2/part.xml") == "application/xml"
+
+    def test_malformed_content_types_yield_nothing(self) -> None:
+        """Test entries read before a syntax error are discarded."""
+        xml = (
+            b'<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            b'<Default Extension="xml" ContentType="application/xml"/>'
+            b"<Override"
+        )
+
+        ct = ContentTypes.from_xml(xml)
+
+        assert ct.defaults == {}
+        assert ct.overrides == {}
+
 
 class TestOpenXmlPackage:
     """Tests for OpenXmlPackage."""
@@ -83,6 +118,23 @@ class TestOpenXmlPackage:
             assert content is not None
             assert b"<p:presentation" in content
 
+    def test_part_cache_is_bounded(self, minimal_pptx: Path) -> None:
+        """Test part cache evicts least recently used parts over budget."""
+        with OpenXmlPackage(minimal_pptx) as package:
+            presentation = package.get_part_content("/ppt/presentation.xml") or b""
+            content_types = package.get_part_content("/[Content_Types].xml") or b""
+            package.close()
+            package.open()
+            package.PART_CACHE_BYTES = len(presentation) + len(content_types) - 1
+
+            package.get_part_content("/ppt/presentation.xml")
+            package.get_part_content("/[Content_Types].xml")
+
+            assert list(package._part_cache) == ["[Content_Types].xml"]
+            assert package._part_cache_bytes <= package.PART_CACHE_BYTES
+            # Evicted parts are still readable
+            assert package.get_part_content("/ppt/presentation.xml") == presentation
+
     def test_get_part_xml(self, minimal_pptx: Path) -> None:
         """Test getting part as parsed XML."""
         with OpenXmlPackage(minimal_pptx) as package:
@@ -100,6 +152,20 @@ class TestOpenXmlPackage:
             office_doc_rels = [r for r in rels if "officeDocument" in r.type]
             assert len(office_doc_rels) == 1
 
+    def test_part_relationships_are_parsed_once(self, minimal_pptx: Path) -> None:
+        """Test repeated lookups share one RelationshipCollection."""
+        with OpenXmlPackage(minimal_pptx) as package:
+            first = package.get_part_relationships("/ppt/presentation.xml")
+            second = package.get_part_relationships("/ppt/presentation.xml")
+            assert first is second
+
+    def test_get_part_reuses_live_instances(self, minimal_pptx: Path) -> None:
+        """Test get_part returns the same part while it is referenced."""
+        with OpenXmlPackage(minimal_pptx) as package:
+            part = package.get_part("/ppt/presentation.xml")
+            assert package.get_part("/ppt/presentation.xml") is part
+            assert part.xml is not None
+
     def test_validate_structure(self, minimal_pptx: Path) -> None:
         """Test structure validation on valid package."""
         with OpenXmlPackage(minimal_pptx) as package:
@@ -117,6 +183,23 @@ class TestOpenXmlPackage:
 
         assert any("ZIP" in e.description for e in exc_info.value.errors)
 
+    def test_try_open_reports_bad_zip(self, not_a_zip: Path) -> None:
+        """Test try_open returns an error instead of raising."""
+        package, error = OpenXmlPackage.try_open(not_a_zip)
+
+        assert package is None
+        assert error is not None
+        assert "Invalid ZIP" in error.description
+
+    def test_try_open_valid_package(self, minimal_pptx: Path) -> None:
+        """Test try_open returns an opened package."""
+        package, error = OpenXmlPackage.try_open(minimal_pptx)
+
+        assert error is None
+        assert package is not None
+        with package:
+            assert package.has_part("/ppt/presentation.xml")
+
     def test_missing_presentation_detected(
         self, invalid_pptx_missing_presentation: Path
     ) -> None:
@@ -127,3 +210,17 @@ class TestOpenXmlPackage:
 
         # Should detect missing main document or missing officeDocument relationship
         assert len(errors) > 0
+
+    def test_missing_content_types_short_circuits(self, tmp_path: Path) -> None:
+        """Test structure checks stop once [Content_Types].xml is missing."""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("dummy.txt", "content")
+        path = tmp_path / "no_content_types.pptx"
+        path.write_bytes(buffer.getvalue())
+
+        with OpenXmlPackage(path) as package:
+            errors = package.validate_structure()
+            assert package._rels_cache == {}
+
+        assert [e.description for e in errors] == ["Missing [Content_Types].xml"]
@@ -31,6 +31,15 @@ class TestRelationship:
         )
         assert not rel.is_external
 
+    def test_is_immutable_and_slotted(self) -> None:
+        """Test relationships are frozen and carry no instance dict."""
+        import dataclasses
+
+        rel = Relationship(id="rId1", type="http://example.com/type", target="a.xml")
+        assert not hasattr(rel, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            rel.target = "b.xml"  # type: ignore[misc]
+
     def test_resolve_target_absolute(self) -> None:
         """Test resolving absolute target path."""
         rel = Relationship(
@@ -61,6 +70,16 @@ class TestRelationship:
         resolved = rel.resolve_target("/ppt/slideMasters/slideMaster1.xml")
         assert resolved == "/ppt/theme/theme1.xml"
 
+    def test_resolve_target_normalizes_segments(self) -> None:
+        """Test dot, empty and out-of-root segments are normalized."""
+        rel = Relationship(
+            id="rId1",
+            type="http://example.com/type",
+            target="./media//../../../docProps/app.xml",
+        )
+        assert rel.resolve_target("/ppt/presentation.xml") == "/docProps/app.xml"
+        assert rel.resolve_target("/") == "/docProps/app.xml"
+
 
 class TestRelationshipCollection:
     """Tests for RelationshipCollection."""
@@ -104,6 +123,29 @@ class TestRelationshipCollection:
         ))
         assert len(master_rels) == 1
 
+    def test_type_index_follows_replaced_ids(self) -> None:
+        """Test the type index tracks a relationship whose Id is re-added."""
+        rels = RelationshipCollection()
+        rels.add(Relationship(id="rId1", type="urn:a", target="one.xml"))
+        rels.add(Relationship(id="rId2", type="urn:a", target="two.xml"))
+        rels.add(Relationship(id="rId1", type="urn:b", target="three.xml"))
+
+        assert [rel.id for rel in rels.get_by_type("urn:a")] == ["rId2"]
+        assert rels.count_by_type("urn:b") == 1
+        assert rels.get_first_by_type("urn:b").target == "three.xml"
+        assert rels.count_by_type("urn:missing") == 0
+        assert rels.get_first_by_type("urn:missing") is None
+
+    def test_from_xml_interns_type(self) -> None:
+        """Test parsed relationship types share the REL_* constant objects."""
+        from openxml_audit.namespaces import REL_SLIDE
+
+        xml = load_fixture_bytes("relationships", "by_type.xml")
+
+        rels = RelationshipCollection.from_xml(xml)
+
+        assert all(rel.type is REL_SLIDE for rel in rels.get_by_type(REL_SLIDE))
+
     def test_resolve_target(self) -> None:
         """Test resolve_target helper method."""
         xml = load_fixture_bytes("relationships", "resolve_target.xml")
@@ -0,0 +1,238 @@
+"""Tests for schema element constraints."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+from lxml import etree
+
+from openxml_audit.context import ValidationContext
+from openxml_audit.schema.constraints import (
+    PPTX_CONSTRAINTS,
+    AttributeConstraint,
+    ElementConstraint,
+    ElementConstraintRegistry,
+)
+from openxml_audit.schema.particle import (
+    AllParticle,
+    AnyParticle,
+    ChoiceParticle,
+    ElementParticle,
+    ParticleType,
+    SequenceParticle,
+    get_validator,
+)
+
+
+class TestElementConstraint:
+    """Tests for ElementConstraint attribute lookups."""
+
+    def test_get_attribute_by_namespace_and_name(self) -> None:
+        """Test attributes are found by (namespace, local name)."""
+        plain = AttributeConstraint(namespace=None, local_name="id", required=True)
+        qualified = AttributeConstraint(namespace="urn:x", local_name="id")
+        constraint = ElementConstraint(
+            namespace="urn:x",
+            local_name="el",
+            attributes=[plain, qualified],
+        )
+
+        assert constraint.get_attribute("id") == plain
+        assert constraint.get_attribute("id", "urn:x") == qualified
+        assert constraint.get_attribute("missing") is None
+        assert constraint.get_required_attributes() == (plain,)
+
+    def test_rebuild_index_after_mutation(self) -> None:
+        """Test rebuild_index picks up attributes added after construction."""
+        constraint = ElementConstraint(namespace="urn:x", local_name="el")
+        assert constraint.attributes == ()
+        added = AttributeConstraint(namespace=None, local_name="name", required=True)
+        constraint.attributes = [added]  # type: ignore[assignment]
+        constraint.rebuild_index()
+
+        assert constraint.attributes == (added,)
+
+        assert constraint.get_attribute("name") == added
+        assert constraint.get_required_attributes() == (added,)
+
+    def test_qualified_names_are_interned(self) -> None:
+        """Test qualified names are precomputed and interned."""
+        constraint = ElementConstraint(
+            namespace="urn:x",
+            local_name="el",
+            attributes=[
+                AttributeConstraint(namespace="urn:x", local_name="a"),
+                AttributeConstraint(namespace=None, local_name="b"),
+            ],
+        )
+
+        assert constraint.qualified_name is sys.intern("{urn:x}el")
+        assert [a.qualified_name for a in constraint.attributes] == ["{urn:x}a", "b"]
+
+    def test_identical_attributes_share_one_instance(self) -> None:
+        """Test equal attribute constraints are pooled across elements."""
+        first = ElementConstraint(
+            namespace="urn:x",
+            local_name="one",
+            attributes=[AttributeConstraint(namespace=None, local_name="shared", required=True)],
+        )
+        second = ElementConstraint(
+            namespace="urn:x",
+            local_name="two",
+            attributes=[AttributeConstraint(namespace=None, local_name="shared", required=True)],
+        )
+
+        assert first.attributes[0] is second.attributes[0]
+        with pytest.raises(AttributeError):
+            first.attributes[0].required = False  # type: ignore[misc]
+
+
+class TestCompositeParticle:
+    """Tests for composite particle tag dispatch."""
+
+    def test_match_index_includes_nested_particles(self) -> None:
+        """Test nested element and any particles are reachable by tag."""
+        inner = ChoiceParticle(children=[
+            ElementParticle("urn:x", "b"),
+            AnyParticle(namespace_constraint="urn:y"),
+        ])
+        outer = SequenceParticle(children=[ElementParticle("urn:x", "a"), inner])
+
+        assert outer._match_index == {"{urn:x}a": outer.children[0], "{urn:x}b": inner}
+        assert outer.matches_tag("{urn:y}anything")
+        assert not outer.matches_tag("{urn:z}a")
+
+    def test_add_child_updates_index(self) -> None:
+        """Test add_child makes the new particle matchable."""
+        choice = ChoiceParticle()
+        assert not choice.matches_tag("{urn:x}a")
+
+        choice.add_child(ElementParticle("urn:x", "a"))
+
+        assert isinstance(choice.children, tuple)
+        assert choice.matches_tag("{urn:x}a")
+
+    def test_element_matcher_returns_bool_for_non_str_tags(self) -> None:
+        """Test comment tags never match an element particle."""
+        matcher = ElementParticle("urn:x", "a").tag_matcher()
+
+        assert matcher("{urn:x}a") is True
+        assert matcher(etree.Comment) is False
+
+    def test_particles_have_no_instance_dict(self) -> None:
+        """Test particle classes are slotted."""
+        for particle in (
+            ElementParticle("urn:x", "a"),
+            SequenceParticle(),
+            ChoiceParticle(),
+            AnyParticle(),
+        ):
+            assert not hasattr(particle, "__dict__")
+
+
+class TestSequenceParticleValidator:
+    """Tests for sequence validation."""
+
+    def test_long_unbounded_run_reports_unexpected_element(self) -> None:
+        """Test the batched path for long runs stops at the first miss."""
+        sequence = SequenceParticle(children=[
+            ElementParticle("urn:x", "a", max_occurs=-1),
+            ElementParticle("urn:x", "b", min_occurs=0),
+        ])
+        root = etree.Element("root")
+        for local in ["a"] * 120 + ["c", "a"]:
+            etree.SubElement(root, f"{{urn:x}}{local}")
+        context = ValidationContext(strict=True)
+
+        valid = get_validator(ParticleType.SEQUENCE).validate(sequence, list(root), context)
+
+        assert not valid
+        assert [e.description for e in context.errors] == ["Unexpected element 'c' found"]
+
+    def test_long_unbounded_run_of_matches_is_valid(self) -> None:
+        """Test a long run matching to the end leaves no unexpected elements."""
+        sequence = SequenceParticle(children=[ElementParticle("urn:x", "a", max_occurs=-1)])
+        root = etree.Element("root")
+        for _ in range(120):
+            etree.SubElement(root, "{urn:x}a")
+        context = ValidationContext(strict=True)
+
+        assert get_validator(ParticleType.SEQUENCE).validate(sequence, list(root), context)
+        assert context.errors == []
+
+
+class TestAllParticleValidator:
+    """Tests for all-group validation."""
+
+    def test_reports_duplicates_and_missing_elements(self) -> None:
+        """Test duplicates of single elements and missing required ones."""
+        all_particle = AllParticle(children=[
+            ElementParticle("urn:x", "a"),
+            ElementParticle("urn:x", "b", min_occurs=0, max_occurs=-1),
+            ElementParticle("urn:x", "c"),
+        ])
+        root = etree.Element("root")
+        for local in ("b", "a", "b", "a", "d"):
+            etree.SubElement(root, f"{{urn:x}}{local}")
+        context = ValidationContext(strict=True)
+
+        valid = get_validator(ParticleType.ALL).validate(all_particle, list(root), context)
+
+        assert not valid
+        assert [e.description for e in context.errors] == [
+            "Duplicate element 'a' not allowed",
+            "Required element 'c' is missing",
+        ]
+
+
+class TestElementConstraintRegistry:
+    """Tests for the element constraint registry."""
+
+    def test_lookup_by_tag_and_name(self) -> None:
+        """Test constraints resolve by Clark tag and by (namespace, name)."""
+        registry = ElementConstraintRegistry()
+        constraint = ElementConstraint(namespace="urn:x", local_name="el")
+        registry.register(constraint)
+
+        assert registry.get("{urn:x}el") is constraint
+        assert registry.get_by_name("urn:x", "el") is constraint
+        assert registry.get_by_name("urn:y", "el") is None
+
+    def test_frozen_registry_rejects_registration(self) -> None:
+        """Test the shared PPTX registry is frozen after construction."""
+        assert PPTX_CONSTRAINTS.frozen
+        with pytest.raises(TypeError):
+            PPTX_CONSTRAINTS.register(ElementConstraint(namespace="urn:x", local_name="el"))
+
+
+class TestSchemaValidatorConstraintCache:
+    """Tests for SchemaValidator's per-tag constraint cache."""
+
+    def test_unambiguous_tags_resolve_once(self) -> None:
+        """Test repeated tags reuse one constraint and keep validation results."""
+        from openxml_audit.schema.validator import SchemaValidator, get_constraint_for_tag
+
+        ns = "http://schemas.openxmlformats.org/drawingml/2006/main"
+        root = etree.fromstring(
+            f'<a:p xmlns:a="{ns}"><a:r><a:t>x</a:t></a:r><a:r><a:t>y</a:t></a:r></a:p>'
+        )
+        runs = list(root)
+        validator = SchemaValidator()
+
+        first = validator._get_constraint(runs[0].tag, runs[0])
+        assert first is not None
+        assert validator._get_constraint(runs[1].tag, runs[1]) is first
+        assert first.qualified_name == get_constraint_for_tag(runs[0].tag).qualified_name
+
+    def test_ambiguous_tags_resolve_per_element(self) -> None:
+        """Test tags with several SDK candidates bypass the per-tag cache."""
+        from openxml_audit.codegen.constraint_bridge import is_ambiguous_tag
+        from openxml_audit.schema.validator import SchemaValidator
+
+        tag = "{http://schemas.microsoft.com/office/spreadsheetml/2022/featurepropertybag}bagId"
+        assert is_ambiguous_tag(tag)
+        validator = SchemaValidator()
+        validator._get_constraint(tag, etree.Element(tag))
+        assert tag in validator._ambiguous_tags
+        assert tag not in validator._constraint_cache
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
+
 import pytest
 
 from openxml_audit.schema.types import (
@@ -13,6 +15,8 @@ from openxml_audit.schema.types import (
     IntegerTypeValidator,
     NCNameTypeValidator,
     StringTypeValidator,
+    XsdBuiltinType,
+    get_type_validator,
 )
 
 
@@ -58,6 +62,12 @@ class TestStringTypeValidator:
         assert not result.is_valid
         assert "pattern" in result.error_message.lower()
 
+    def test_pattern_is_shared(self) -> None:
+        """Test identical patterns reuse one compiled regex."""
+        first = StringTypeValidator(pattern=r"^[A-F0-9]{6}$")
+        second = StringTypeValidator(pattern=r"^[A-F0-9]{6}$")
+        assert first.pattern is second.pattern
+
     def test_enumeration(self) -> None:
         """Test enumeration constraint."""
         validator = StringTypeValidator(enumeration=["red", "green", "blue"])
@@ -92,6 +102,19 @@ class TestBooleanTypeValidator:
             result = validator.validate(value)
             assert not result.is_valid, f"{value} should be invalid"
 
+    def test_parsed_values(self) -> None:
+        """Test parsing is case-insensitive and maps to Python booleans."""
+        validator = BooleanTypeValidator()
+
+        for value, expected in [
+            ("true", True),
+            ("TRUE", True),
+            ("1", True),
+            ("False", False),
+            ("0", False),
+        ]:
+            assert validator.validate(value).parsed_value is expected
+
 
 class TestIntegerTypeValidator:
     """Tests for IntegerTypeValidator."""
@@ -223,6 +246,26 @@ class TestDateTimeTypeValidator:
             result = validator.validate(value)
             assert not result.is_valid, f"{value} should be invalid"
 
+    def test_native_parse_matches_xsd_rules(self) -> None:
+        """Test the fixed-width fast path keeps XSD limits and parsed values."""
+        validator = DateTimeTypeValidator()
+
+        result = validator.validate("2023-03-25T12:30:45Z")
+        assert result.is_valid
+        assert result.parsed_value == datetime(2023, 3, 25, 12, 30, 45, tzinfo=timezone.utc)
+
+        for value in [
+            "2023-W12-6T12:30:45",  # ISO week date
+            "2023-01-01T00:00:00+15:00",  # offset beyond 14 hours
+            "2023-01-01T00:00:00+05:60",  # invalid offset minutes
+        ]:
+            result = validator.validate(value)
+            assert not result.is_valid, f"{value} should be invalid"
+
+        result = validator.validate("2016-12-31T23:59:60Z")
+        assert result.is_valid
+        assert result.parsed_value == "2016-12-31T23:59:60Z"
+
 
 class TestHexBinaryTypeValidator:
     """Tests for HexBinaryTypeValidator."""
@@ -244,6 +287,23 @@ class TestHexBinaryTypeValidator:
                 result = validator.validate(value)
                 assert not result.is_valid, f"{value} (odd length) should be invalid"
 
+    def test_whitespace_rejected(self) -> None:
+        """Test whitespace that bytes.fromhex would skip is still invalid."""
+        validator = HexBinaryTypeValidator()
+
+        for value in ["00 FF", " 00", "00\n", "0\n"]:
+            result = validator.validate(value)
+            assert not result.is_valid, f"{value!r} should be invalid"
+
+    def test_length_and_parsed_value(self) -> None:
+        """Test the parsed bytes and the length facet."""
+        validator = HexBinaryTypeValidator(length=2)
+
+        result = validator.validate("00fF")
+        assert result.is_valid
+        assert result.parsed_value == b"\x00\xff"
+        assert not validator.validate("00").is_valid
+
 
 class TestNCNameTypeValidator:
     """Tests for NCNameTypeValidator (XML names)."""
@@ -281,3 +341,31 @@ class TestAnyURITypeValidator:
         ]:
             result = validator.validate(value)
             assert result.is_valid, f"{value} should be valid"
+
+    def test_invalid_uri(self) -> None:
+        """Test URIs containing forbidden characters are rejected."""
+        validator = AnyURITypeValidator()
+
+        for value in ["a<b", 'a"b', "a{b}", "a|b", "a\\b", "a^b", "a`b"]:
+            result = validator.validate(value)
+            assert not result.is_valid, f"{value} should be invalid"
+
+
+class TestGetTypeValidator:
+    """Tests for get_type_validator lookups."""
+
+    def test_lookup_by_name_and_enum(self) -> None:
+        """Test string names and enum members resolve to the same validator."""
+        for type_enum in (
+            XsdBuiltinType.BOOLEAN,
+            XsdBuiltinType.UNSIGNED_INT,
+            XsdBuiltinType.ANY_URI,
+        ):
+            validator = get_type_validator(type_enum.value)
+            assert validator is not None
+            assert validator is get_type_validator(type_enum)
+
+    def test_unknown_type(self) -> None:
+        """Test unknown or unsupported types return None."""
+        assert get_type_validator("notAType") is None
+        assert get_type_validator(XsdBuiltinType.DURATION) is None
@@ -145,3 +145,51 @@ class TestConvenienceFunctions:
         """Test that string paths work."""
         result = validate_pptx(str(minimal_pptx))
         assert isinstance(result, ValidationResult)
+
+
+class TestStreamingSlideValidation:
+    """Tests for the streamed SlideValidator path."""
+
+    def test_streaming_matches_in_memory(self, minimal_pptx: Path, tmp_path: Path) -> None:
+        """Test streamed slides report the same errors as parsed ones."""
+        import zipfile
+
+        from openxml_audit.context import ValidationContext
+        from openxml_audit.package import OpenXmlPackage
+        from openxml_audit.parts import SlidePart
+        from openxml_audit.pptx import SlideValidator
+
+        shape = (
+            '<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="s"/><p:cNvSpPr/><p:nvPr/>'
+            "</p:nvSpPr>{body}</p:sp>"
+        )
+        shapes = "".join(
+            shape.format(id=index % 7, body="" if index % 5 else "<p:spPr/>")
+            for index in range(40)
+        )
+        group = (
+            '<p:grpSp><p:nvGrpSpPr><p:cNvPr id="3" name="g"/><p:cNvGrpSpPr/><p:nvPr/>'
+            f"</p:nvGrpSpPr>{shapes}</p:grpSp>"
+        )
+        slide_path = "ppt/slides/slide1.xml"
+        pptx_path = tmp_path / "shapes.pptx"
+        with zipfile.ZipFile(minimal_pptx) as source, zipfile.ZipFile(pptx_path, "w") as target:
+            for info in source.infolist():
+                data = source.read(info)
+                if info.filename == slide_path:
+                    data = data.replace(
+                        b"<p:grpSpPr/>", b"<p:grpSpPr/>" + (shapes + group).encode()
+                    )
+                target.writestr(info, data)
+
+        def run(threshold: int) -> list[tuple[str, str]]:
+            validator = SlideValidator()
+            validator.STREAM_THRESHOLD_BYTES = threshold
+            with OpenXmlPackage(pptx_path) as package:
+                context = ValidationContext(package=package)
+                validator.validate(SlidePart(package, "/" + slide_path), context)
+            return [(e.description, e.path) for e in context.errors]
+
+        in_memory = run(threshold=1 << 30)
+        assert any(desc.startswith("Duplicate shape ID") for desc, _ in in_memory)
+        assert run(threshold=0) == in_memory